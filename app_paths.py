@@ -0,0 +1,25 @@
+"""Uygulama dizinleri - kullanıcı başına durum (state) klasörü"""
+import os
+import sys
+
+APP_NAME = 'HTML_VIEWER'
+
+
+def state_dir(*parts, create=True):
+    """Per-user directory for autosave journals, indexes and sessions
+
+    - Windows: %LOCALAPPDATA%\\HTML_VIEWER
+    - macOS: ~/Library/Application Support/HTML_VIEWER
+    - Linux/other: $XDG_STATE_HOME/html_viewer (default ~/.local/state)
+    """
+    if sys.platform == 'win32':
+        base = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), APP_NAME)
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~/Library/Application Support'), APP_NAME)
+    else:
+        xdg = os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state')
+        base = os.path.join(xdg, APP_NAME.lower())
+    path = os.path.join(base, *parts)
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,107 @@
+"""Önizleme varlıkları - belge klasöründen çözümleme ve boyut sınırlı LRU önbellek"""
+import mimetypes
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+def resolve_asset(base_dir, relpath):
+    """Absolute path of ``relpath`` inside ``base_dir``, or None
+
+    Paths escaping the document's directory (``..``, absolute paths,
+    symlinks pointing outside) are refused.
+    """
+    if not base_dir or not relpath:
+        return None
+    base = os.path.realpath(base_dir)
+    path = os.path.realpath(os.path.join(base, *relpath.split('/')))
+    try:
+        if os.path.commonpath([base, path]) != base:
+            return None
+    except ValueError:  # Windows: farklı sürücü
+        return None
+    return path
+
+
+class Asset:
+    """A file as served to the preview"""
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'etag', 'content_type', 'data', 'checked')
+
+    def __init__(self, path, mtime_ns, size, data):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.etag = f'"{mtime_ns:x}-{size:x}"'
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if self.content_type.startswith('text/') or self.content_type in (
+                'application/javascript', 'application/json', 'image/svg+xml'):
+            self.content_type += '; charset=utf-8'
+        self.data = data
+        self.checked = time.monotonic()
+
+
+class AssetCache:
+    """In-memory LRU of asset bytes, keyed by path and validated by mtime
+
+    An entry is reused while the file's ``(mtime, size)`` is unchanged, so
+    repeated previews only read files that were modified. Stats are
+    skipped for entries validated in the last ``revalidate_interval``
+    seconds (one page load requests many assets at once). Total size is
+    capped at ``max_bytes``; files above ``max_item_bytes`` are served but
+    not kept.
+    """
+
+    revalidate_interval = 0.5  # saniye
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_item_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self._entries = OrderedDict()  # path -> Asset
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        """Current Asset for ``path``; raises OSError if it cannot be read"""
+        with self._lock:
+            asset = self._entries.get(path)
+            if asset is not None and time.monotonic() - asset.checked < self.revalidate_interval:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return asset
+        stat = os.stat(path)
+        if asset is not None and asset.mtime_ns == stat.st_mtime_ns and asset.size == stat.st_size:
+            with self._lock:
+                asset.checked = time.monotonic()
+                if path in self._entries:
+                    self._entries.move_to_end(path)
+                self.hits += 1
+            return asset
+        with open(path, 'rb') as file:
+            data = file.read()
+        asset = Asset(path, stat.st_mtime_ns, len(data), data)
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= old.size
+            if asset.size <= self.max_item_bytes:
+                self._entries[path] = asset
+                self._bytes += asset.size
+                while self._bytes > self.max_bytes and self._entries:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= evicted.size
+        return asset
+
+    @property
+    def size(self):
+        with self._lock:
+            return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
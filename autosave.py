@@ -0,0 +1,250 @@
+"""Otomatik kayıt - çökmeye dayanıklı, sadece eklemeli kurtarma günlüğü
+
+Layout under ``state_dir('autosave')``::
+
+    <session>/lock         held (file lock) while the editor runs
+    <session>/<tab>.snap   JSON snapshot: path, title, version, text
+    <session>/<tab>.log    append-only JSON lines: [version, kind, start, end, text]
+
+Edits are collected from each tab's ChangeJournal on a timer and appended
+in one batch by a writer thread. When a log grows past the size of its
+snapshot (or a minimum), the next flush writes a fresh snapshot and
+truncates the log, so bytes written stay within a small constant factor
+of the edits made.
+"""
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+
+from app_paths import state_dir
+from file_io import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _lock_file(file):
+    """Non-blocking exclusive lock; False if another process holds it"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+class AutosaveJournal:
+    """Batched autosave of dirty tabs for crash recovery"""
+
+    flush_interval = 2000  # ms - Tk zamanlayıcı aralığı
+    min_compact_bytes = 64 * 1024
+
+    def __init__(self, root_dir=None):
+        self.root_dir = root_dir or state_dir('autosave')
+        self.session_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.session_dir = os.path.join(self.root_dir, self.session_id)
+        os.makedirs(self.session_dir, exist_ok=True)
+        self._lock = open(os.path.join(self.session_dir, 'lock'), 'a+')
+        _lock_file(self._lock)
+        self._tabs = {}  # key -> {'flushed', 'log_bytes', 'snap_bytes', 'compact'}
+        self._jobs = queue.Queue()
+        self._writer = threading.Thread(target=self._run_writer, name="autosave", daemon=True)
+        self._writer.start()
+
+    # --- Tk thread -------------------------------------------------------
+
+    def collect(self, key, journal, meta, get_text):
+        """Queue the edits of one dirty tab since the last flush
+
+        ``get_text`` is only called when a snapshot is needed: the first
+        flush of a tab, after compaction was requested, or when the
+        journal no longer holds the edits since the last flush.
+        """
+        key = str(key)
+        state = self._tabs.get(key)
+        if state is not None and state['flushed'] == journal.version and not state['compact']:
+            return
+        changes = None
+        if state is not None and not state['compact']:
+            changes = journal.changes_since(state['flushed'])
+        if changes is None:
+            state = self._tabs[key] = {'flushed': journal.version, 'log_bytes': 0,
+                                       'snap_bytes': 0, 'compact': False}
+            self._jobs.put(('snapshot', key, dict(meta, version=journal.version, text=get_text())))
+        elif changes:
+            state['flushed'] = journal.version
+            self._jobs.put(('append', key, changes))
+
+    def discard(self, key):
+        """Tab was saved or closed - its recovery data is no longer needed"""
+        key = str(key)
+        if self._tabs.pop(key, None) is not None:
+            self._jobs.put(('discard', key, None))
+
+    def is_tracked(self, key):
+        return str(key) in self._tabs
+
+    def close(self, keep=False):
+        """Clean shutdown: nothing to recover from this session
+
+        With ``keep`` the pending writes are finished and the lock released
+        but the journal stays, so the next start offers it for recovery.
+        """
+        self._jobs.put(None)
+        self._writer.join(timeout=5)
+        try:
+            self._lock.close()
+        except Exception:
+            pass
+        if not keep:
+            shutil.rmtree(self.session_dir, ignore_errors=True)
+
+    # --- writer thread ---------------------------------------------------
+
+    def _paths(self, key):
+        base = os.path.join(self.session_dir, key)
+        return base + '.snap', base + '.log'
+
+    def _run_writer(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            # Kuyrukta biriken işleri tek seferde yaz
+            batch = [job]
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._write_batch(batch)
+                    return
+                batch.append(job)
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        appends = {}
+        for kind, key, payload in batch:
+            snap_path, log_path = self._paths(key)
+            try:
+                if kind == 'snapshot':
+                    appends.pop(key, None)
+                    data = json.dumps(payload, ensure_ascii=False)
+                    size = atomic_write(snap_path, data)
+                    # Snapshot sürümüne kadar olan kayıtlar artık gereksiz
+                    open(log_path, 'w').close()
+                    state = self._tabs.get(key)
+                    if state is not None:
+                        state['snap_bytes'] = size
+                        state['log_bytes'] = 0
+                elif kind == 'append':
+                    appends.setdefault(key, []).extend(payload)
+                elif kind == 'discard':
+                    appends.pop(key, None)
+                    for path in (snap_path, log_path):
+                        try:
+                            os.unlink(path)
+                        except OSError:
+                            pass
+            except Exception as e:
+                print(f"Autosave error: {e}")
+
+        for key, changes in appends.items():
+            _, log_path = self._paths(key)
+            lines = ''.join(json.dumps(list(change), ensure_ascii=False) + '\n'
+                            for change in changes)
+            try:
+                with open(log_path, 'a', encoding='utf-8') as log:
+                    log.write(lines)
+                    log.flush()
+                    os.fsync(log.fileno())
+            except Exception as e:
+                print(f"Autosave error: {e}")
+                continue
+            state = self._tabs.get(key)
+            if state is not None:
+                state['log_bytes'] += len(lines.encode('utf-8'))
+                if state['log_bytes'] > max(self.min_compact_bytes, state['snap_bytes']):
+                    state['compact'] = True  # Bir sonraki turda snapshot al
+
+    # --- recovery --------------------------------------------------------
+
+    def find_recoverable(self):
+        """Snapshots left behind by sessions that did not exit cleanly
+
+        Returns ``[(session_dir, key, snapshot, changes)]``; sessions whose
+        lock is still held (another running editor) are skipped.
+        """
+        found = []
+        try:
+            sessions = sorted(os.listdir(self.root_dir))
+        except OSError:
+            return found
+        for session in sessions:
+            session_dir = os.path.join(self.root_dir, session)
+            if session_dir == self.session_dir or not os.path.isdir(session_dir):
+                continue
+            try:
+                with open(os.path.join(session_dir, 'lock'), 'a+') as lock:
+                    if not _lock_file(lock):
+                        continue  # Başka bir editör hâlâ çalışıyor
+            except OSError:
+                continue
+            names = sorted(os.listdir(session_dir))
+            if not any(name.endswith('.snap') for name in names):
+                # Kurtarılacak bir şey yok - eski oturumu temizle
+                shutil.rmtree(session_dir, ignore_errors=True)
+                continue
+            for name in names:
+                if not name.endswith('.snap'):
+                    continue
+                key = name[:-5]
+                try:
+                    with open(os.path.join(session_dir, name), encoding='utf-8') as f:
+                        snapshot = json.load(f)
+                    changes = []
+                    log_path = os.path.join(session_dir, key + '.log')
+                    if os.path.exists(log_path):
+                        with open(log_path, encoding='utf-8') as f:
+                            for line in f:
+                                try:
+                                    changes.append(json.loads(line))
+                                except ValueError:
+                                    break  # Yarım yazılmış son satır
+                    changes = [c for c in changes if c[0] > snapshot.get('version', 0)]
+                    found.append((session_dir, key, snapshot, changes))
+                except (OSError, ValueError) as e:
+                    print(f"Autosave recovery error ({name}): {e}")
+        return found
+
+    def clear_recoverable(self, entries):
+        """Remove the sessions of recovered (or rejected) entries"""
+        for session_dir in {entry[0] for entry in entries}:
+            shutil.rmtree(session_dir, ignore_errors=True)
+
+
+def replay_changes(text_widget, snapshot, changes):
+    """Rebuild a buffer in a (hidden) Text widget
+
+    Indices in the log are Tk ``line.col`` indices, so replaying them
+    through a Text widget reproduces the exact buffer.
+    """
+    text_widget.delete('1.0', 'end')
+    text_widget.insert('1.0', snapshot.get('text', ''))
+    for change in changes:
+        _, kind, start, end, text = change
+        if kind == 'insert':
+            text_widget.insert(start, text)
+        else:
+            text_widget.delete(start, end)
+    return text_widget.get('1.0', 'end-1c')
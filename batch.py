@@ -0,0 +1,148 @@
+"""Başsız toplu denetim - çok sayıda HTML dosyasını paralel doğrular (Tk gerektirmez)
+
+Usage: python main.py --batch DIR [--jobs N] [--snapshots DIR [--check]]
+       python batch.py DIR ...
+
+Every HTML file below DIR is read like the editor reads it, linted with
+the same rules the editor underlines (lint.py) plus the document-level
+checks of html_check.py, its local CSS/JS/image links are resolved the
+way the preview server resolves them, and its DOM outline is snapshotted. One
+JSON object per file is written to stdout as soon as it is done; a
+summary goes to stderr. Exit status is 1 if any file has errors (or, with
+``--check``, a snapshot differs).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import posixpath
+import sys
+import time
+from urllib.parse import unquote, urlsplit
+
+from asset_cache import resolve_asset
+from file_io import atomic_write, read_text
+from html_check import check_html, snapshot_hash
+from lint import LintIndex
+from workspace import walk_files
+
+HTML_EXTENSIONS = ('.html', '.htm', '.xhtml')
+
+
+def find_html_files(root):
+    """Relative paths of the HTML files below ``root``, sorted"""
+    return sorted(path for path, _ in walk_files(root) if path.lower().endswith(HTML_EXTENSIONS))
+
+
+def check_references(checker, root, relpath):
+    """Issues for local resources that would not load in the preview"""
+    page_dir = posixpath.dirname(relpath)
+    broken = []
+    for line, column, url in checker.references:
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or url.startswith(('#', '/', 'data:')):
+            continue  # Dış bağlantı / kök göreli - sunucu bilmiyor
+        path = resolve_asset(root, posixpath.normpath(posixpath.join(page_dir, unquote(parts.path))))
+        if path is None or not os.path.isfile(path):
+            broken.append({'line': line, 'column': column, 'severity': 'error',
+                           'code': 'missing-resource', 'message': f"{url} not found"})
+    return broken
+
+
+def check_file(job):
+    """Worker entry point: ``(root, relpath, snapshot_dir, check_only)`` -> result dict"""
+    root, relpath, snapshot_dir, check_only = job
+    start = time.perf_counter()
+    result = {'path': relpath}
+    try:
+        text = read_text(os.path.join(root, *relpath.split('/')))
+    except (OSError, UnicodeDecodeError) as e:
+        result.update(ok=False, error=str(e), ms=round((time.perf_counter() - start) * 1000, 2))
+        return result
+    checker = check_html(text)
+    # Editördeki altı çizili sorunlarla aynı kurallar + belge düzeyi uyarılar
+    issues = [issue.as_dict() for issue in LintIndex.build(text).issues() + checker.issues]
+    issues.extend(check_references(checker, root, relpath))
+    issues.sort(key=lambda issue: (issue['line'], issue['column']))
+    snapshot = checker.snapshot()
+    result.update(bytes=len(text.encode('utf-8')), title=checker.title,
+                  elements=sum(1 for line in checker.outline if line.lstrip().startswith('<')),
+                  issues=issues, snapshot=snapshot_hash(snapshot))
+    failed = any(issue['severity'] == 'error' for issue in issues)
+    if snapshot_dir:
+        snapshot_path = os.path.join(snapshot_dir, *relpath.split('/')) + '.snap'
+        try:
+            previous = read_text(snapshot_path)
+        except (OSError, UnicodeDecodeError):
+            previous = None
+        if previous is None:
+            result['snapshot_status'] = 'new'
+        else:
+            result['snapshot_status'] = 'same' if previous == snapshot else 'changed'
+        if check_only:
+            failed = failed or result['snapshot_status'] != 'same'
+        elif result['snapshot_status'] != 'same':
+            os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+            atomic_write(snapshot_path, snapshot)
+    result['ok'] = not failed
+    result['ms'] = round((time.perf_counter() - start) * 1000, 2)
+    return result
+
+
+def iter_results(jobs, workers):
+    """Yield results in completion order; ``workers`` > 1 uses a process pool"""
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield check_file(job)
+        return
+    # Küçük dosyalar için süreçler arası yükü parçalarla azalt
+    chunksize = max(1, min(64, len(jobs) // (workers * 8)))
+    with multiprocessing.get_context('spawn').Pool(workers) as pool:
+        yield from pool.imap_unordered(check_file, jobs, chunksize)
+
+
+def run(root, workers=None, snapshot_dir=None, check_only=False, out=None):
+    """Check every HTML file below ``root``, streaming JSON lines to ``out``
+
+    Returns ``(checked, failed, seconds)``.
+    """
+    out = out or sys.stdout
+    start = time.perf_counter()
+    root = os.path.abspath(root)
+    if snapshot_dir:
+        snapshot_dir = os.path.abspath(snapshot_dir)
+    relpaths = find_html_files(root)
+    jobs = [(root, relpath, snapshot_dir, check_only) for relpath in relpaths]
+    workers = workers or os.cpu_count() or 1
+    failed = 0
+    for result in iter_results(jobs, min(workers, len(jobs))):
+        failed += not result['ok']
+        out.write(json.dumps(result, ensure_ascii=False) + '\n')
+        out.flush()
+    return len(jobs), failed, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='main.py --batch',
+                                     description="Validate, lint and snapshot HTML files headlessly")
+    parser.add_argument('--batch', dest='root', metavar='DIR', help='folder to check')
+    parser.add_argument('folder', nargs='?', help=argparse.SUPPRESS)
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--snapshots', metavar='DIR',
+                        help='write DOM snapshots here and report new/same/changed')
+    parser.add_argument('--check', action='store_true',
+                        help='with --snapshots: do not update, fail on differences')
+    args = parser.parse_args(argv)
+    root = args.root or args.folder
+    if not root or not os.path.isdir(root):
+        parser.error("a folder to check is required")
+    if args.check and not args.snapshots:
+        parser.error("--check needs --snapshots DIR")
+    checked, failed, seconds = run(root, args.jobs, args.snapshots, args.check)
+    print(f"{checked} file(s) checked in {seconds:.2f}s, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Optimized export benchmark: size savings and build time
+
+Exports example_page.html and default_page.html and reports raw and
+compressed sizes before and after minification. With ``--copies N`` it
+also builds a workspace of N pages and compares a serial export against
+the process pool the "Export" command uses.
+
+Usage: python benchmarks/export_bench.py [--copies N]
+"""
+import argparse
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from export import ExportRun, brotli, export_document, run_job  # noqa: E402
+
+PAGES = ('example_page.html', 'default_page.html')
+
+
+def bench_page(name, out_dir, rounds=20):
+    with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+        html = f.read()
+    raw = html.encode('utf-8')
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        stats = export_document(html, ROOT, out_dir, name)
+        samples.append((time.perf_counter() - start) * 1000)
+    before_gzip = len(gzip.compress(raw, 9, mtime=0))
+    print(f"{name}:")
+    print(f"  raw:      {len(raw):7,} B -> {stats['output']:7,} B "
+          f"({1 - stats['output'] / len(raw):.0%} smaller)")
+    print(f"  gzip:     {before_gzip:7,} B -> {stats['gzip']:7,} B "
+          f"({1 - stats['gzip'] / before_gzip:.0%} smaller)")
+    if brotli is not None:
+        before_brotli = len(brotli.compress(raw))
+        print(f"  brotli:   {before_brotli:7,} B -> {stats['brotli']:7,} B")
+    print(f"  export:   {min(samples):.2f} ms (best of {rounds})")
+
+
+def build_workspace(folder, copies):
+    jobs = []
+    for i in range(copies):
+        name = PAGES[i % len(PAGES)]
+        relpath = f"pages/{i // 100}/{i}_{name}"
+        os.makedirs(os.path.join(folder, os.path.dirname(relpath)), exist_ok=True)
+        shutil.copy(os.path.join(ROOT, name), os.path.join(folder, relpath))
+        jobs.append(relpath)
+    return jobs
+
+
+def bench_workspace(copies):
+    with tempfile.TemporaryDirectory() as folder:
+        relpaths = build_workspace(os.path.join(folder, 'src'), copies)
+        src = os.path.join(folder, 'src')
+        jobs = [(os.path.join(src, relpath), None, src, os.path.join(folder, 'serial'), relpath)
+                for relpath in relpaths]
+        start = time.perf_counter()
+        for job in jobs:
+            run_job(job)
+        serial = time.perf_counter() - start
+
+        jobs = [job[:3] + (os.path.join(folder, 'pool'), job[4]) for job in jobs]
+        run = ExportRun(jobs)
+        first = None
+        while not run.done:
+            if run.poll() and first is None:
+                first = time.perf_counter() - run.started
+            time.sleep(0.005)
+        run.poll()
+    print(f"workspace of {copies} pages:")
+    print(f"  serial:        {serial:.2f} s")
+    print(f"  ExportRun:     {run.elapsed:.2f} s ({os.cpu_count()} CPUs, "
+          f"first result after {first or run.elapsed:.2f} s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--copies', type=int, default=0,
+                        help='also export a workspace of N pages')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name in PAGES:
+            bench_page(name, out_dir)
+    if args.copies:
+        bench_workspace(args.copies)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Syntax highlighting benchmark: full vs incremental re-highlighting
+
+Builds a ~50k-line HTML document from example_page.html and compares
+re-lexing the whole file against the incremental path a keystroke takes
+(mark the edited line dirty, re-lex until the line states converge).
+With ``--tk`` (needs a display) it also times the real Tk round trip of
+an insert plus re-tagging the visible region.
+
+Usage: python benchmarks/highlight_bench.py [--lines N] [--tk]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from highlighter import INITIAL_STATE, LineStateIndex  # noqa: E402
+
+
+def build_document(line_count):
+    with open(os.path.join(ROOT, 'example_page.html'), encoding='utf-8') as f:
+        page = f.read().split('\n')
+    lines = []
+    while len(lines) < line_count:
+        lines.extend(page)
+    return lines[:line_count]
+
+
+def bench_full(lines, rounds=3):
+    index = LineStateIndex(len(lines))
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        index.full_relex(lines)
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def bench_incremental(lines, rounds=500):
+    """Type one character per round on lines spread across the file"""
+    index = LineStateIndex(len(lines))
+    index.full_relex(lines)
+    samples = []
+    step = max(1, len(lines) // rounds)
+    for i in range(rounds):
+        line = (i * step) % len(lines)
+        lines[line] = lines[line] + 'x'
+        start = time.perf_counter()
+        index.on_insert(line, 0)
+        index.relex_dirty(lines.__getitem__)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99)]
+
+
+def bench_comment_cascade(lines):
+    """Worst case: opening an HTML comment re-lexes until it is closed"""
+    index = LineStateIndex(len(lines))
+    index.full_relex(lines)
+    line = len(lines) // 2
+    while index.states[line] != INITIAL_STATE:
+        line += 1  # Düz HTML metni içinde bir satır seç
+    lines[line] = '<!-- ' + lines[line]
+    start = time.perf_counter()
+    index.on_insert(line, 0)
+    relexed = index.relex_dirty(lines.__getitem__)
+    return (time.perf_counter() - start) * 1000, relexed
+
+
+def bench_tk(lines, rounds=200):
+    import tkinter as tk
+    from highlighter import SyntaxHighlighter
+
+    root = tk.Tk()
+    root.geometry('1200x800')
+    text = tk.Text(root)
+    text.pack(fill=tk.BOTH, expand=True)
+    text.insert('1.0', '\n'.join(lines))
+    highlighter = SyntaxHighlighter(text)
+    while highlighter.index.frontier < len(highlighter.index):
+        root.update()
+    text.see('25000.0')
+    root.update()
+    samples = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        text.insert(f'{25000 + i % 40}.0', 'a')
+        root.update()
+        samples.append((time.perf_counter() - start) * 1000)
+    root.destroy()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, default=50000)
+    parser.add_argument('--tk', action='store_true', help='also time the Tk round trip')
+    args = parser.parse_args()
+
+    lines = build_document(args.lines)
+    print(f"document: {len(lines)} lines")
+    print(f"full re-highlight:        {bench_full(list(lines)):9.2f} ms")
+    p50, p99 = bench_incremental(list(lines))
+    print(f"incremental keystroke:    p50={p50:.4f} ms  p99={p99:.4f} ms")
+    ms, relexed = bench_comment_cascade(list(lines))
+    print(f"unclosed comment cascade: {ms:9.2f} ms ({relexed} lines re-lexed)")
+    if args.tk:
+        p50, p99 = bench_tk(list(lines))
+        print(f"Tk insert + re-tag:       p50={p50:.3f} ms  p99={p99:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Live preview latency benchmark on example_page.html
+
+Measures the time from an editor edit being submitted to the live pusher
+until the preview page's event stream receives the patch message. The
+browser's own paint time is not included (no renderer runs headless), so
+this is the edit-to-wire part of edit-to-pixel latency.
+
+Usage: python benchmarks/live_reload_latency.py [--rounds N]
+"""
+import argparse
+import http.client
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from preview_server import PreviewServer  # noqa: E402
+from live_reload import LivePusher  # noqa: E402
+
+
+def listen(server, preview_id, received, ready):
+    """Minimal EventSource client collecting (arrival_time, message)"""
+    conn = http.client.HTTPConnection(server.host, server.port)
+    conn.request('GET', f'/events/{preview_id}')
+    response = conn.getresponse()
+    ready.set()
+    while True:
+        line = response.fp.readline()
+        if not line:
+            break
+        if line.startswith(b'data: '):
+            received.put((time.perf_counter(), json.loads(line[6:])))
+
+
+def run(rounds):
+    import queue
+
+    with open(os.path.join(ROOT, 'example_page.html'), encoding='utf-8') as f:
+        page = f.read()
+
+    server = PreviewServer()
+    server.start()
+    pusher = LivePusher(server)
+    server.publish('bench', page)
+    pusher.reset('bench', page)
+
+    received = queue.Queue()
+    ready = threading.Event()
+    threading.Thread(target=listen, args=(server, 'bench', received, ready), daemon=True).start()
+    ready.wait(5)
+    while not server.has_subscribers('bench'):
+        time.sleep(0.01)
+
+    edits = {
+        'css': lambda i: page.replace('padding: 20px;', f'padding: {20 + i}px;', 1),
+        'body': lambda i: page.replace('</h1>', f' #{i}</h1>', 1),
+        'reload': lambda i: page.replace('<title>', f'<title>{i} ', 1),
+    }
+    results = {}
+    for kind, make_edit in edits.items():
+        samples = []
+        for i in range(1, rounds + 1):
+            content = make_edit(i)
+            start = time.perf_counter()
+            pusher.submit('bench', content)
+            arrived, message = received.get(timeout=5)
+            assert message['type'] == kind, message
+            samples.append((arrived - start) * 1000)
+            # Bir sonraki tur aynı temel sürümden başlasın
+            pusher.reset('bench', page)
+        samples.sort()
+        results[kind] = {
+            'p50_ms': round(statistics.median(samples), 3),
+            'p99_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 3),
+            'max_ms': round(samples[-1], 3),
+        }
+    pusher.stop()
+    server.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+    for kind, stats in run(args.rounds).items():
+        print(f"{kind:7s} p50={stats['p50_ms']:.3f} ms  p99={stats['p99_ms']:.3f} ms  max={stats['max_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,388 @@
+"""Benchmark suite for the editor and preview hot paths
+
+Drives a real WebViewer on a withdrawn Tk root (on CI run it under Xvfb:
+``xvfb-run python benchmarks/suite.py``) and measures:
+
+- tab creation for 1 / 100 / 1000 tabs (background tabs and a selected one)
+- editor insert and scroll throughput for 1 KB ... 100 MB documents
+- open and save latency through the background I/O pool
+- preview request to page served (publish + HTTP GET of page and asset)
+- background lint: full check of a 5 MB page and incremental re-checks,
+  plus a fuzz check that chained incremental updates match a full lint
+- session: saving 200 tabs and reopening them (tab strip + selected tab)
+
+Without a display the Tk benchmarks are reported as skipped. Results are
+written as JSON; ``--baseline`` compares against an earlier result file
+and exits with status 1 when a metric regressed by more than
+``--threshold`` percent. A failed correctness check also exits with 1.
+
+Usage: python benchmarks/suite.py [--quick] [--max-size MB] [--only NAME,...]
+                                  [--output FILE] [--baseline FILE] [--threshold PCT]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lint import LintIndex  # noqa: E402
+from preview_server import PreviewServer  # noqa: E402
+
+SIZES = [(1024, '1KB'), (100 * 1024, '100KB'), (1024 ** 2, '1MB'), (10 * 1024 ** 2, '10MB'),
+         (100 * 1024 ** 2, '100MB')]
+
+
+class Results:
+    """Named metrics with their unit and direction ('lower'/'higher' is better)"""
+
+    def __init__(self):
+        self.metrics = {}
+        self.skipped = {}
+        self.failed = {}
+
+    def add(self, name, value, unit, better='lower'):
+        self.metrics[name] = {'value': round(value, 4), 'unit': unit, 'better': better}
+        print(f"  {name:<34} {value:12.3f} {unit}")
+
+    def skip(self, group, reason):
+        self.skipped[group] = reason
+        print(f"  {group:<34} skipped: {reason}")
+
+    def fail(self, name, reason):
+        self.failed[name] = reason
+        print(f"  {name:<34} FAILED: {reason}")
+
+    def as_dict(self):
+        return {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'metrics': self.metrics,
+            'skipped': self.skipped,
+            'failed': self.failed,
+        }
+
+
+def build_document(size):
+    """HTML of about ``size`` bytes, made of example_page.html"""
+    with open(os.path.join(ROOT, 'example_page.html'), encoding='utf-8') as f:
+        page = f.read()
+    return (page * (size // len(page) + 1))[:size]
+
+
+# --- Tk / WebViewer -------------------------------------------------------
+
+def make_app():
+    """WebViewer on a withdrawn root, or ``(None, reason)`` without a display"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:  # ImportError / TclError (ekran yok)
+        return None, str(e).splitlines()[0]
+    import main
+    app = main.WebViewer(root)
+    # Kurulumdan sonra gizle - 'zoomed' bazı platformlarda pencereyi gösterir
+    root.withdraw()
+    root.update()
+    return app, None
+
+
+def settle(app):
+    """Let queued Tk work (layout, highlighting, redraw) finish"""
+    app.root.update()
+    app.root.update_idletasks()
+
+
+def close_all(app):
+    for tab in list(app.tabs):
+        app.close_file_tab(tab.frame)
+    settle(app)
+
+
+def bench_tabs(app, results, counts):
+    content = build_document(4 * 1024)
+    for count in counts:
+        close_all(app)
+        start = time.perf_counter()
+        for i in range(count):
+            app.add_file_tab(None, content, f"bench {i}", select=False)
+        app.add_file_tab(None, content, "bench selected")
+        settle(app)
+        elapsed = (time.perf_counter() - start) * 1000
+        results.add(f"tabs.create.{count}", elapsed, 'ms')
+        start = time.perf_counter()
+        close_all(app)
+        results.add(f"tabs.close.{count}", (time.perf_counter() - start) * 1000, 'ms')
+
+
+def bench_session(app, results, folder, count=200):
+    """Save ``count`` tabs (every fourth unsaved) as a session, then restore it"""
+    content = build_document(16 * 1024)
+    session_folder = os.path.join(folder, 'session')
+    os.makedirs(session_folder, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"session_{i}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        paths.append(path)
+    close_all(app)
+    for i, path in enumerate(paths):
+        frame = app.add_file_tab(path, content, select=i == count - 1)
+        if i % 4 == 0:
+            tab = app.tabs.get(frame)
+            tab.journal.record('insert', '1.0', '1.1', 'x')
+            tab.pending_text = 'x' + content
+    settle(app)
+    start = time.perf_counter()
+    app.save_session(session_folder)
+    results.add(f"session.save.{count}", (time.perf_counter() - start) * 1000, 'ms')
+    close_all(app)
+    start = time.perf_counter()
+    app.restore_session(session_folder)
+    settle(app)
+    results.add(f"session.restore.{count}", (time.perf_counter() - start) * 1000, 'ms')
+    close_all(app)
+
+
+def bench_editor(app, results, sizes):
+    for size, label in sizes:
+        content = build_document(size)
+        close_all(app)
+        start = time.perf_counter()
+        frame = app.add_file_tab(None, content, f"insert {label}")
+        settle(app)
+        elapsed = time.perf_counter() - start
+        results.add(f"editor.insert.{label}", size / 1024 ** 2 / elapsed, 'MB/s', 'higher')
+
+        editor = app.tabs.get(frame).editor
+        pages = 200
+        start = time.perf_counter()
+        for _ in range(pages):
+            editor.yview_scroll(1, 'pages')
+            editor.update_idletasks()
+        results.add(f"editor.scroll.{label}", pages / (time.perf_counter() - start),
+                    'pages/s', 'higher')
+    close_all(app)
+
+
+def wait_for(app, condition, timeout=120):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark step timed out")
+        app.root.update()
+        time.sleep(0.0005)
+
+
+def bench_open_save(app, results, sizes, folder):
+    for size, label in sizes:
+        path = os.path.join(folder, f"open_{label}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(build_document(size))
+        close_all(app)
+        done = []
+        start = time.perf_counter()
+        app.open_paths([path], lambda: done.append(time.perf_counter()))
+        wait_for(app, lambda: done)
+        settle(app)
+        results.add(f"file.open.{label}", (done[0] - start) * 1000, 'ms')
+
+        tab = app.current_tab()
+        if tab is None or not tab.has_editor:
+            continue  # Büyük dosya modu - salt okunur
+        tab.editor.insert('1.0', '<!-- edit -->')
+        settle(app)
+        start = time.perf_counter()
+        app.write_tab(tab, path)
+        wait_for(app, lambda: not app.file_io.is_writing(tab.tab_id))
+        results.add(f"file.save.{label}", (time.perf_counter() - start) * 1000, 'ms')
+    close_all(app)
+
+
+# --- Preview (Tk gerekmez) --------------------------------------------------
+
+def bench_preview(results, folder, rounds=50):
+    """Publish a document, then GET it and one of its assets"""
+    with open(os.path.join(ROOT, 'example_page.html'), encoding='utf-8') as f:
+        page = f.read().replace('</head>', '<link rel="stylesheet" href="site.css"></head>', 1)
+    with open(os.path.join(folder, 'site.css'), 'w', encoding='utf-8') as f:
+        f.write('body { color: #333; }\n' * 200)
+    server = PreviewServer()
+    server.start()
+    try:
+        samples = []
+        for i in range(rounds):
+            start = time.perf_counter()
+            url = server.publish('bench', page.replace('<body>', f'<body data-round="{i}">', 1),
+                                 'bench', folder)
+            with urllib.request.urlopen(url) as response:
+                response.read()
+            with urllib.request.urlopen(url + 'site.css') as response:
+                response.read()
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        results.add('preview.served.p50', statistics.median(samples), 'ms')
+        results.add('preview.served.p99', samples[int(len(samples) * 0.99)], 'ms')
+    finally:
+        server.stop()
+
+
+def bench_lint(results, size, edits=50):
+    """Full lint of a ``size`` byte page, then re-checks after single-character edits"""
+    text = build_document(size)
+    label = f"{size // 1024 ** 2}MB" if size >= 1024 ** 2 else f"{size // 1024}KB"
+    start = time.perf_counter()
+    index = LintIndex.build(text)
+    results.add(f"lint.full.{label}", (time.perf_counter() - start) * 1000, 'ms')
+    rng = random.Random(0)
+    samples = []
+    for _ in range(edits):
+        position = rng.randrange(len(text))
+        text = text[:position] + rng.choice('<>/" a') + text[position:]
+        start = time.perf_counter()
+        index = index.update(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    results.add(f"lint.update.{label}.p50", statistics.median(samples), 'ms')
+    results.add(f"lint.update.{label}.p90", samples[int(len(samples) * 0.9)], 'ms')
+
+
+# Düzenleme parçaları - yarım etiketler, tırnaklar ve yorumlar dahil
+FUZZ_PIECES = ['<', '>', '"', "'", '/', 'a', 'li', '<p>', '</div>', 'id="y"', '-->', '<!--', ' ', '\n']
+FUZZ_SEEDS = ['<p>', '</p>', '<div>', '</div>', '<li>', '<a>', '</a>', '\n', 'x', '<span id="x">',
+              '</span>', '"', "'", '<', '>', '<!--', '-->', '<style>', '</style>', '<img>']
+# Birkaç kontrol noktası aşan belgeler (varsayılan CHECKPOINT_SPACING ile)
+FUZZ_LONG_SEEDS = FUZZ_SEEDS + ['x' * 500, "</b'"]
+# Bilinen hatalar: (eski metin, yeni metin)
+_QUOTED_TAIL = '<i></i>' + 'x' * 4000 + "<div></b' \"x' <span>" + 'y' * 200 + '<div><p><tr></p></div></div>'
+LINT_REGRESSIONS = [
+    (_QUOTED_TAIL, _QUOTED_TAIL.replace('<tr>', '<tr">')),  # Tırnak, denetim noktasından önceki etiketi uzatır
+]
+
+
+def check_lint_updates(results, rounds=400, edits=30):
+    """Chains of random edits: every incremental update must equal a full lint
+
+    Short documents stress the tokenizer around a single checkpoint, long
+    ones the restart and resync across several.
+    """
+    for number, (old, new) in enumerate(LINT_REGRESSIONS):
+        index, full = LintIndex.build(old).update(new), LintIndex.build(new)
+        if index.problems != full.problems or index.ids != full.ids:
+            results.fail('lint.incremental', f"regression {number}: update differs from build")
+            return
+    for seed in range(rounds):
+        rng = random.Random(seed)
+        if seed % 4 == 3:
+            text = ''.join(rng.choice(FUZZ_LONG_SEEDS) for _ in range(200))
+        else:
+            text = ''.join(rng.choice(FUZZ_SEEDS) for _ in range(40))
+        index = LintIndex.build(text)
+        for _ in range(edits):
+            position = rng.randrange(len(text) + 1)
+            if rng.random() < 0.7:
+                text = text[:position] + rng.choice(FUZZ_PIECES) + text[position:]
+            else:
+                text = text[:position] + text[position + rng.randrange(1, 4):]
+            index = index.update(text)
+            full = LintIndex.build(text)
+            if index.problems != full.problems or index.ids != full.ids:
+                results.fail('lint.incremental', f"seed {seed}: update differs from build for {text!r}")
+                return
+    print(f"  {'lint.incremental':<34} {rounds} x {edits} edits match")
+
+
+# --- Karşılaştırma ----------------------------------------------------------
+
+def compare(current, baseline, threshold):
+    """Print the change of each metric; returns the names that regressed"""
+    regressions = []
+    print(f"\ncompared to baseline (threshold {threshold:.0f}%):")
+    for name, metric in sorted(current['metrics'].items()):
+        old = baseline.get('metrics', {}).get(name)
+        if old is None or not old['value']:
+            print(f"  {name:<34} new")
+            continue
+        change = (metric['value'] - old['value']) / old['value'] * 100
+        worse = change > threshold if metric['better'] == 'lower' else change < -threshold
+        if worse:
+            regressions.append(name)
+        print(f"  {name:<34} {old['value']:12.3f} -> {metric['value']:12.3f} {metric['unit']:<8}"
+              f" {change:+7.1f}%{'  REGRESSION' if worse else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true',
+                        help='smaller run: up to 100 tabs and 1 MB documents')
+    parser.add_argument('--max-size', type=float, default=100,
+                        help='largest editor/open document in MB (default 100)')
+    parser.add_argument('--only', default='',
+                        help='comma separated groups: tabs,editor,file,session,preview,lint')
+    parser.add_argument('--output', help='write results as JSON here')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=25.0,
+                        help='regression threshold in percent (default 25)')
+    args = parser.parse_args()
+
+    groups = set(filter(None, args.only.split(','))) or {'tabs', 'editor', 'file', 'session', 'preview', 'lint'}
+    max_size = min(args.max_size, 1) if args.quick else args.max_size
+    sizes = [(size, label) for size, label in SIZES if size <= max_size * 1024 ** 2]
+    counts = [1, 100] if args.quick else [1, 100, 1000]
+    results = Results()
+    folder = tempfile.mkdtemp(prefix='webviewer-bench-')
+    try:
+        if groups & {'tabs', 'editor', 'file', 'session'}:
+            app, reason = make_app()
+            if app is None:
+                for group in sorted(groups & {'tabs', 'editor', 'file', 'session'}):
+                    results.skip(group, f"no Tk display ({reason})")
+            else:
+                try:
+                    if 'tabs' in groups:
+                        bench_tabs(app, results, counts)
+                    if 'editor' in groups:
+                        bench_editor(app, results, sizes)
+                    if 'file' in groups:
+                        bench_open_save(app, results, sizes, folder)
+                    if 'session' in groups:
+                        bench_session(app, results, folder)
+                finally:
+                    app.file_io.shutdown()
+                    app.root.destroy()
+        if 'preview' in groups:
+            bench_preview(results, folder)
+        if 'lint' in groups:
+            bench_lint(results, int(min(max_size, 5) * 1024 ** 2))
+            check_lint_updates(results)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    current = results.as_dict()
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(current, baseline, args.threshold):
+            return 1
+    return 1 if results.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Değişiklik günlüğü - sekme başına sürüm sayacı, düzenleme kaydı ve içerik özeti"""
+import hashlib
+from collections import deque
+
+
+def content_hash(text):
+    """Short, stable hash of a buffer"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ChangeJournal:
+    """Version counter plus a bounded log of edits for one tab
+
+    Every insert/delete reported by the editor proxy bumps ``version`` and
+    is kept as ``(version, kind, start, end, text)`` (``text`` is the
+    inserted text, None for deletions). Consumers that remember a version
+    can ask for ``changes_since(version)`` instead of copying the whole
+    buffer; once old entries have been evicted the answer is None and the
+    caller falls back to a full read.
+
+    The content hash is computed lazily and cached per version, so it is
+    only paid when something (a save, a preview) actually needs it.
+    """
+
+    max_entries = 5000
+    max_chars = 4 * 1024 * 1024
+
+    def __init__(self, text=None):
+        self.version = 0
+        self.saved_version = 0
+        self.saved_hash = content_hash(text) if text is not None else None
+        self._entries = deque()
+        self._chars = 0
+        self._oldest = 0  # changes_since() bu sürümden itibaren cevaplanabilir
+        self._hash = (0, self.saved_hash)
+
+    @property
+    def dirty(self):
+        return self.version != self.saved_version
+
+    def record(self, kind, start, end, text):
+        """Proxy listener: append one edit"""
+        self.version += 1
+        if kind == 'delete':
+            text = None
+        self._entries.append((self.version, kind, start, end, text))
+        self._chars += len(text) if text else 0
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._chars > self.max_chars):
+            version, _, _, _, old_text = self._entries.popleft()
+            self._chars -= len(old_text) if old_text else 0
+            self._oldest = version
+
+    def changes_since(self, version):
+        """Edits after ``version`` in order, or None if they were evicted"""
+        if version < self._oldest:
+            return None
+        return [entry for entry in self._entries if entry[0] > version]
+
+    def hash(self, get_text):
+        """Hash of the current content; ``get_text`` is only called when stale"""
+        if self._hash[0] != self.version or self._hash[1] is None:
+            self._hash = (self.version, content_hash(get_text()))
+        return self._hash[1]
+
+    def is_unchanged_since_save(self, get_text):
+        """True when the buffer matches what was last saved or loaded"""
+        if not self.dirty:
+            return True
+        # Yazıp geri silinen içerik de kaydedilmiş sayılır
+        if self.saved_hash is not None and self.hash(get_text) == self.saved_hash:
+            self.saved_version = self.version
+            return True
+        return False
+
+    def mark_saved(self, version, text_hash=None):
+        """Remember that ``version`` (with ``text_hash``) is now on disk"""
+        self.saved_version = version
+        if text_hash is not None:
+            self.saved_hash = text_hash
+
+    def reset(self, text):
+        """Buffer was replaced wholesale (e.g. a file was loaded into it)"""
+        self.saved_version = self.version
+        self.saved_hash = content_hash(text)
+        self._hash = (self.version, self.saved_hash)
@@ -0,0 +1,124 @@
+"""Editör havuzu - sekmeler arasında yeniden kullanılan editör widget'ları"""
+import tkinter as tk
+from tkinter import scrolledtext
+
+from highlighter import SyntaxHighlighter
+
+
+class PooledEditor:
+    """A code editor (ScrolledText + highlighter) that can serve any tab"""
+
+    __slots__ = ('container', 'text', 'highlighter', 'owner', 'xscroll')
+
+    def __init__(self, container, text, highlighter):
+        self.container = container
+        self.text = text
+        self.highlighter = highlighter
+        self.owner = None  # Editörü kullanan sekmenin frame'i
+        self.xscroll = None  # Yatay kaydırma çubuğu (wrap=none iken)
+
+
+class EditorPool:
+    """Builds editor widgets on demand and recycles them between tabs
+
+    Editors are children of ``parent`` (the notebook) and are packed into a
+    tab's frame with ``pack(in_=...)``, so one widget can serve any tab.
+    A closed tab hands its editor back: up to ``max_idle`` editors are
+    cleared and kept for the next tab, the rest are destroyed.
+
+    Tk's own undo stays off; undo/redo keys are passed to
+    ``on_history(owner, 'undo' | 'redo')`` so the history can live with
+    the tab instead of the widget.
+    """
+
+    max_idle = 4
+
+    def __init__(self, parent, on_modified, on_key=None, on_history=None, **text_options):
+        self.parent = parent
+        self.on_modified = on_modified
+        self.on_key = on_key  # Tuş gecikmesi ölçümü (perf)
+        self.on_history = on_history  # Geri al / yinele
+        self.text_options = text_options
+        self._idle = []
+
+    def _create(self):
+        container = tk.Frame(self.parent, bg=self.text_options.get('bg'))
+        text = scrolledtext.ScrolledText(container, **self.text_options)
+        text.pack(fill=tk.BOTH, expand=True)
+        editor = PooledEditor(container, text, None)
+        # Tek bağlama - sahibi değişse de geçerli
+        text.bind('<<Modified>>', lambda e: self.on_modified(editor.owner))
+        if self.on_key is not None:
+            text.bind('<KeyPress>', self.on_key, add='+')
+        if self.on_history is not None:
+            text.bind('<<Undo>>', lambda e: self.on_history(editor.owner, 'undo'))
+            text.bind('<<Redo>>', lambda e: self.on_history(editor.owner, 'redo'))
+            text.bind('<Control-y>', lambda e: self.on_history(editor.owner, 'redo'))
+        editor.highlighter = SyntaxHighlighter(text)
+        return editor
+
+    def acquire(self, owner, content, wrap=None):
+        """Editor for ``owner`` (a tab frame) holding ``content``
+
+        ``wrap`` overrides the pool's wrap mode for this tab; it is set
+        before the text goes in, so long lines are never laid out wrapped.
+        """
+        editor = self._idle.pop() if self._idle else self._create()
+        editor.owner = owner
+        self.set_wrap(editor, wrap or self.default_wrap)
+        editor.text.insert('1.0', content)
+        editor.text.edit_reset()
+        editor.text.edit_modified(False)
+        editor.text.mark_set(tk.INSERT, '1.0')
+        editor.container.pack(in_=owner, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # Sonradan oluşturulan sekme frame'i editörü örtmesin
+        editor.container.lift(owner)
+        return editor
+
+    @property
+    def default_wrap(self):
+        return self.text_options.get('wrap', tk.CHAR)
+
+    def set_wrap(self, editor, wrap):
+        """Change an editor's wrap mode; ``none`` adds a horizontal scrollbar"""
+        text = editor.text
+        if str(text.cget('wrap')) == wrap:
+            return
+        text.configure(wrap=wrap)
+        if wrap == tk.NONE:
+            if editor.xscroll is None:
+                editor.xscroll = tk.Scrollbar(editor.container, orient=tk.HORIZONTAL,
+                                              command=text.xview)
+            text.configure(xscrollcommand=editor.xscroll.set)
+            editor.xscroll.pack(side=tk.BOTTOM, fill=tk.X, before=text.frame)
+        elif editor.xscroll is not None:
+            text.configure(xscrollcommand='')
+            editor.xscroll.pack_forget()
+
+    def release(self, editor):
+        """Take an editor back from a closing tab"""
+        editor.owner = None
+        editor.container.pack_forget()
+        if len(self._idle) < self.max_idle:
+            editor.text.delete('1.0', tk.END)
+            self.set_wrap(editor, self.default_wrap)
+            editor.text.edit_reset()
+            editor.text.edit_modified(False)
+            editor.text.yview_moveto(0)
+            self._idle.append(editor)
+        else:
+            self._destroy(editor)
+
+    @property
+    def idle_count(self):
+        return len(self._idle)
+
+    def _destroy(self, editor):
+        editor.highlighter.close()
+        editor.highlighter.proxy.close()
+        editor.container.destroy()
+
+    def clear(self):
+        """Destroy every idle editor"""
+        while self._idle:
+            self._destroy(self._idle.pop())
@@ -0,0 +1,128 @@
+"""Editör proxy'si - Text widget'ının insert/delete çağrılarını yakalar"""
+import tkinter as tk
+
+
+class TextChangeProxy:
+    """Intercept insert/delete/replace on a Tk Text widget
+
+    The widget's Tcl command is renamed and replaced by a Python command,
+    the same technique idlelib's redirector uses. Keystrokes, paste and
+    programmatic ``insert``/``delete`` calls all pass through here, so
+    listeners learn exactly which index range changed without reading the
+    buffer back.
+
+    Listeners are called after the change as
+    ``listener(kind, start, end, text)``:
+
+    - ``('insert', start, end, text)``: ``start``/``end`` bound the new text
+    - ``('delete', start, end, text)``: the range as it was before deleting;
+      ``text`` is the removed text when some listener asked for it with
+      ``want_deleted_text=True``, else None
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.listeners = []
+        self._want_deleted = 0
+        self._tk = widget.tk
+        self._name = widget._w
+        self._orig = self._name + "_orig"
+        self._tk.call("rename", self._name, self._orig)
+        self._tk.createcommand(self._name, self._dispatch)
+
+    @classmethod
+    def install(cls, widget):
+        """Return the widget's proxy, creating it on first use"""
+        proxy = getattr(widget, '_change_proxy', None)
+        if proxy is None:
+            proxy = cls(widget)
+            widget._change_proxy = proxy
+        return proxy
+
+    def add_listener(self, listener, want_deleted_text=False):
+        self.listeners.append(listener)
+        if want_deleted_text:
+            self._want_deleted += 1
+
+    def remove_listener(self, listener, want_deleted_text=False):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+            if want_deleted_text:
+                self._want_deleted -= 1
+
+    def call(self, *args):
+        """Call the original widget command, bypassing the listeners"""
+        return self._tk.call(self._orig, *args)
+
+    def close(self):
+        """Restore the original widget command"""
+        if self._orig is None:
+            return
+        try:
+            self._tk.deletecommand(self._name)
+            self._tk.call("rename", self._orig, self._name)
+        except tk.TclError:
+            pass  # Widget zaten yok edilmiş
+        self._orig = None
+        self.listeners = []
+        self.widget._change_proxy = None
+
+    def _dispatch(self, operation, *args):
+        try:
+            if operation == 'insert' and len(args) >= 2:
+                return self._insert(args)
+            if operation == 'delete' and args:
+                return self._delete(args)
+            if operation == 'replace' and len(args) >= 3:
+                start = self.call('index', args[0])
+                self._delete(args[:2])
+                return self._insert((start,) + args[2:])
+            return self.call(operation, *args)
+        except tk.TclError:
+            return ""
+
+    def _insert(self, args):
+        start = self.call('index', args[0])
+        if start == self.call('index', 'end'):
+            # Tk inserts before the final newline
+            start = self.call('index', 'end - 1c')
+        text = ''.join(args[1::2])
+        # Sağ yerçekimli işaret eklenen metnin sonuna kayar (Tk karakter sayımıyla)
+        self.call('mark', 'set', 'proxy_insert_end', start)
+        self.call('mark', 'gravity', 'proxy_insert_end', 'right')
+        result = self.call('insert', *args)
+        if text and self.listeners:
+            end = self.call('index', 'proxy_insert_end')
+            for listener in list(self.listeners):
+                listener('insert', start, end, text)
+        return result
+
+    def _delete(self, args):
+        start = self.call('index', args[0])
+        if len(args) > 1:
+            end = self.call('index', args[1])
+        else:
+            end = self.call('index', f"{start} + 1c")
+        last = self.call('index', 'end - 1c')
+        if self._tk.getboolean(self.call('compare', end, '>', last)):
+            end = last  # Son satır sonu silinemez
+        if self._tk.getboolean(self.call('compare', start, '>=', end)):
+            return self.call('delete', *args)
+        text = self.call('get', start, end) if self._want_deleted else None
+        result = self.call('delete', *args)
+        for listener in list(self.listeners):
+            listener('delete', start, end, text)
+        return result
+
+
+def split_index(index):
+    """'12.4' -> (12, 4)"""
+    line, col = str(index).split('.')
+    return int(line), int(col)
+
+
+def end_index(text):
+    """Tk index right after ``text`` when it starts at '1.0'"""
+    line = text.count('\n') + 1
+    column = len(text) - text.rfind('\n') - 1
+    return f"{line}.{column}"
@@ -0,0 +1,463 @@
+"""Optimize edilmiş dışa aktarma - CSS/JS gömme, küçültme, sıkıştırma"""
+import gzip
+import hashlib
+import multiprocessing
+import os
+import posixpath
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+from asset_cache import resolve_asset
+
+try:
+    import brotli  # İsteğe bağlı: pip install brotli
+except ImportError:
+    brotli = None
+
+# Bundan küçük yerel CSS/JS dosyaları sayfaya gömülür, büyükler ayrı (hash'li) dosya olur
+INLINE_LIMIT = 16 * 1024
+
+# Bu uzantılar .gz / .br olarak da yazılır
+COMPRESSIBLE = ('.html', '.htm', '.css', '.js', '.svg', '.json')
+
+# <script>/<style> görünmez ama satır içi olabilir; yanlarındaki boşluk metnin parçası
+_BLOCK_TAGS = frozenset((
+    'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'div', 'p', 'pre',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'section', 'header', 'footer', 'nav', 'main',
+    'article', 'aside', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table', 'thead', 'tbody',
+    'tfoot', 'tr', 'td', 'th', 'form', 'fieldset', 'hr', 'br', 'figure', 'figcaption',
+    'blockquote', 'option', 'select', 'noscript', '!doctype',
+))
+
+
+# --- CSS -----------------------------------------------------------------
+
+_CSS_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/|\s+|[^"\'/\s]+|/',
+                        re.DOTALL)
+_CSS_TIGHT = re.compile(r'\s*([{};,>])\s*|:\s+')
+# Bildirimdeki ':' önündeki boşluk (seçicideki ' :hover' anlamlı, ona dokunma)
+_CSS_DECLARATION_COLON = re.compile(r'\s+:(?=[^{};]*[;}])')
+_CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)', re.IGNORECASE)
+
+
+def minify_css(css):
+    """Drop comments and redundant whitespace (strings are kept as is)"""
+    parts = []
+    for token in _CSS_TOKEN.findall(css):
+        if token.startswith('/*'):
+            continue
+        if token[0] in '"\'':
+            parts.append(('s', token))
+        elif token.isspace():
+            parts.append(('t', ' '))
+        else:
+            parts.append(('t', token))
+    out = []
+    run = []
+    for kind, token in parts:
+        if kind == 's':
+            out.append(_tighten_css(''.join(run)))
+            out.append(token)
+            run = []
+        else:
+            run.append(token)
+    out.append(_tighten_css(''.join(run)))
+    return ''.join(out).strip()
+
+
+def _tighten_css(text):
+    text = re.sub(r' +', ' ', text)
+    text = _CSS_TIGHT.sub(lambda m: m.group(1) if m.group(1) else ':', text)
+    text = _CSS_DECLARATION_COLON.sub(':', text)
+    return text.replace(';}', '}')
+
+
+def rebase_css_urls(css, css_dir, page_dir=''):
+    """Rewrite relative ``url()`` references of CSS moved from ``css_dir`` into a page"""
+    if css_dir == page_dir:
+        return css
+
+    def rebase(match):
+        quote, url = match.groups()
+        if _is_external(url) or url.startswith(('/', '#')):
+            return match.group(0)
+        url = posixpath.relpath(posixpath.normpath(posixpath.join(css_dir, url)), page_dir or '.')
+        return f"url({quote}{url}{quote})"
+
+    return _CSS_URL.sub(rebase, css)
+
+
+# --- JavaScript ----------------------------------------------------------
+
+_JS_WORD = re.compile(r'[A-Za-z0-9_$\u0080-\uffff]+')
+_JS_STRING = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`', re.DOTALL)
+_JS_REGEX = re.compile(r'/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[A-Za-z]*')
+_JS_SPACE = re.compile(r'\s+')
+# Bu karakterlerden sonra satır sonu deyimi bitiremez (ASI olmaz)
+_JS_JOIN_AFTER = frozenset('{;,(=:[&|?*%<>!~^')
+_JS_JOIN_BEFORE = frozenset('});,:.?]')
+# Bunlardan sonra gelen '/' bir düzenli ifade başlatır
+_JS_REGEX_AFTER = frozenset('(,=:[!&|?{};+-*%<>~^')
+_JS_REGEX_KEYWORDS = frozenset(('return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+                                'delete', 'void', 'throw', 'yield', 'await'))
+
+
+def minify_js(js):
+    """Conservative JS minifier: comments and whitespace only
+
+    Newlines are kept wherever automatic semicolon insertion could depend
+    on them, so the output behaves like the input without parsing it.
+    """
+    out = []
+    last = ''  # Son anlamlı token
+    position = 0
+    length = len(js)
+    pending_space = pending_newline = False
+    while position < length:
+        char = js[position]
+        if char.isspace():
+            end = _JS_SPACE.match(js, position).end()
+            pending_newline = pending_newline or '\n' in js[position:end]
+            pending_space = True
+            position = end
+            continue
+        if js.startswith('//', position):
+            end = js.find('\n', position)
+            position = length if end < 0 else end
+            continue
+        if js.startswith('/*', position):
+            end = js.find('*/', position + 2)
+            comment = js[position:length if end < 0 else end + 2]
+            pending_newline = pending_newline or '\n' in comment
+            pending_space = True
+            position = length if end < 0 else end + 2
+            continue
+        if char in '"\'`':
+            match = _JS_STRING.match(js, position)
+            token = match.group() if match else js[position:]
+        elif char == '/' and (not last or last[-1] in _JS_REGEX_AFTER or last in _JS_REGEX_KEYWORDS):
+            match = _JS_REGEX.match(js, position)
+            token = match.group() if match else char
+        else:
+            match = _JS_WORD.match(js, position)
+            token = match.group() if match else char
+        if out and (pending_space or pending_newline):
+            previous, following = last[-1], token[0]
+            if pending_newline and previous not in _JS_JOIN_AFTER and following not in _JS_JOIN_BEFORE:
+                out.append('\n')
+            elif ((_JS_WORD.match(previous) and _JS_WORD.match(following))
+                  or (previous in '+-' and following == previous)
+                  or (previous == '/' and following == '/')):
+                out.append(' ')
+        out.append(token)
+        last = token
+        position += len(token)
+        pending_space = pending_newline = False
+    return ''.join(out)
+
+
+# --- HTML ----------------------------------------------------------------
+
+_HTML_RAW = re.compile(
+    r'<!--.*?-->|<(script|style|pre|textarea)\b[^>]*>.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL)
+_SPACE_AFTER_TAG = re.compile(r'(</?([!A-Za-z][^\s/>]*)[^>]*>) ')
+_SPACE_BEFORE_TAG = re.compile(r' (</?([!A-Za-z][^\s/>]*))')
+_ATTR = re.compile(r'([^\s=/>]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s>]+))?')
+_SCRIPT_OPEN = re.compile(r'<script\b([^>]*)>', re.IGNORECASE)
+_STYLE_OPEN = re.compile(r'<style\b([^>]*)>', re.IGNORECASE)
+_LINK = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+_STYLE_BLOCK = re.compile(r'<style\b[^>]*>.*?</style\s*>', re.IGNORECASE | re.DOTALL)
+_SRC_REF = re.compile(r'<(?:img|source|video|audio|link|script|iframe|embed)\b[^>]*?\s(?:src|href)\s*=\s*'
+                      r'("[^"]*"|\'[^\']*\'|[^\s>]+)', re.IGNORECASE)
+
+
+def parse_attributes(tag):
+    """Attributes of an opening tag as a dict (names lowercased)"""
+    body = re.sub(r'^<[^\s>]+|/?>$', '', tag)
+    attributes = {}
+    for name, value in _ATTR.findall(body):
+        if value[:1] in '"\'':
+            value = value[1:-1]
+        attributes[name.lower()] = value
+    return attributes
+
+
+def _is_external(url):
+    parts = urlsplit(url)
+    return bool(parts.scheme or parts.netloc) or url.startswith('data:')
+
+
+def _is_js_type(attributes):
+    return attributes.get('type', '').lower() in ('', 'text/javascript', 'application/javascript',
+                                                  'module')
+
+
+def minify_html(html):
+    """Collapse whitespace, drop comments, minify inline <style>/<script>"""
+    out = []
+    position = 0
+    for match in _HTML_RAW.finditer(html):
+        out.append(_minify_html_text(html[position:match.start()]))
+        raw = match.group()
+        tag = (match.group(1) or '').lower()
+        if raw.startswith('<!--'):
+            if raw.startswith('<!--[if'):
+                out.append(raw)  # IE koşullu yorumları kalsın
+        elif tag == 'style':
+            open_tag = _STYLE_OPEN.match(raw)
+            body = raw[open_tag.end():raw.lower().rindex('</style')]
+            out.append(f"<style{open_tag.group(1)}>{minify_css(body)}</style>")
+        elif tag == 'script':
+            open_tag = _SCRIPT_OPEN.match(raw)
+            body = raw[open_tag.end():raw.lower().rindex('</script')]
+            if _is_js_type(parse_attributes(open_tag.group())) and body.strip():
+                body = minify_js(body)
+            out.append(f"<script{open_tag.group(1)}>{body}</script>")
+        else:
+            out.append(raw)  # <pre>, <textarea>: boşluklar anlamlı
+        position = match.end()
+        if tag in _BLOCK_TAGS:
+            # Blok öğelerin yanındaki boşluk görünmez; diğerlerinde tek boşluk kalır
+            out[-2] = out[-2].rstrip(' ')
+            while position < len(html) and html[position].isspace():
+                position += 1
+    out.append(_minify_html_text(html[position:]))
+    return ''.join(out).strip()
+
+
+def _minify_html_text(text):
+    """Whitespace runs become one space; next to block-level tags none"""
+    text = re.sub(r'\s+', ' ', text)
+
+    def strip(match):
+        return match.group(1) if match.group(2).lower() in _BLOCK_TAGS else match.group()
+
+    return _SPACE_BEFORE_TAG.sub(strip, _SPACE_AFTER_TAG.sub(strip, text))
+
+
+def dedupe_styles(html):
+    """Remove <style> blocks repeated later in the page; returns (html, removed)
+
+    The last copy is kept: it is the one that won over any rules between
+    the copies, so the cascade stays the same.
+    """
+    matches = list(_STYLE_BLOCK.finditer(html))
+    last = {match.group().strip(): match.start() for match in matches}
+    out = []
+    position = removed = 0
+    for match in matches:
+        if last[match.group().strip()] != match.start():
+            out.append(html[position:match.start()])
+            position = match.end()
+            removed += 1
+    out.append(html[position:])
+    return ''.join(out), removed
+
+
+# --- Pipeline ------------------------------------------------------------
+
+def hashed_name(relpath, data):
+    """'css/site.css' -> 'css/site.1a2b3c4d.css'"""
+    stem, ext = posixpath.splitext(relpath)
+    return f"{stem}.{hashlib.blake2b(data, digest_size=4).hexdigest()}{ext}"
+
+
+def write_output(path, data, stats):
+    """Write ``data`` and its .gz (and .br when brotli is installed)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(data)
+    stats['output'] += len(data)
+    if path.lower().endswith(COMPRESSIBLE):
+        compressed = gzip.compress(data, 9, mtime=0)
+        with open(path + '.gz', 'wb') as file:
+            file.write(compressed)
+        stats['gzip'] += len(compressed)
+        if brotli is not None:
+            compressed = brotli.compress(data)
+            with open(path + '.br', 'wb') as file:
+                file.write(compressed)
+            stats['brotli'] += len(compressed)
+    stats['files'].append(path)
+
+
+def export_document(html, base_dir, out_dir, name, inline_limit=INLINE_LIMIT):
+    """Build one page into ``out_dir``; returns a stats dict
+
+    Stages: inline small local stylesheets/scripts (larger ones become
+    minified, content-hashed files), minify the HTML with its inline
+    CSS/JS, drop duplicate <style> blocks, copy other local assets it and
+    its stylesheets reference, then write the results with gzip/brotli
+    siblings.
+    """
+    start = time.perf_counter()
+    stats = {'source': name, 'original': len(html.encode('utf-8')), 'output': 0, 'gzip': 0,
+             'brotli': 0, 'files': [], 'inlined': 0, 'bundled': 0, 'deduped': 0, 'copied': 0}
+    page_dir = posixpath.dirname(name)
+    assets = {}  # hedef göreli yol -> bayt
+    stylesheets = []  # (css, klasörü) - url() varlıkları da kopyalanır
+
+    def local_asset(url, base=page_dir):
+        if not url or _is_external(url) or url.startswith(('/', '#')):
+            return None, None
+        relpath = posixpath.normpath(posixpath.join(base, unquote(urlsplit(url).path)))
+        path = resolve_asset(base_dir, relpath)
+        if path is None or not os.path.isfile(path):
+            return None, None
+        return path, relpath
+
+    def inline_link(match):
+        attributes = parse_attributes(match.group())
+        if 'stylesheet' not in attributes.get('rel', '').lower().split():
+            return match.group()
+        path, relpath = local_asset(attributes.get('href'))
+        if path is None:
+            return match.group()
+        with open(path, encoding='utf-8', errors='replace') as file:
+            css = file.read()
+        stats['original'] += len(css.encode('utf-8'))
+        css = minify_css(css)
+        if len(css) <= inline_limit:
+            stats['inlined'] += 1
+            media = attributes.get('media')
+            media = f' media="{media}"' if media else ''
+            css = rebase_css_urls(css, posixpath.dirname(relpath), page_dir)
+            return f"<style{media}>{css}</style>"
+        data = css.encode('utf-8')
+        target = hashed_name(relpath, data)
+        assets[target] = data
+        stylesheets.append((css, posixpath.dirname(relpath)))
+        stats['bundled'] += 1
+        return match.group().replace(attributes['href'],
+                                     posixpath.relpath(target, page_dir or '.'))
+
+    def inline_script(match):
+        attributes = parse_attributes(match.group(1))
+        path, relpath = local_asset(attributes.get('src'))
+        if path is None or not _is_js_type(attributes):
+            return match.group()
+        with open(path, encoding='utf-8', errors='replace') as file:
+            js = file.read()
+        stats['original'] += len(js.encode('utf-8'))
+        js = minify_js(js)
+        if len(js) <= inline_limit and '</script' not in js.lower() and 'async' not in attributes \
+                and 'defer' not in attributes:
+            stats['inlined'] += 1
+            kept = ''.join(f' {key}="{value}"' if value else f' {key}'
+                           for key, value in attributes.items() if key not in ('src',))
+            return f"<script{kept}>{js}</script>"
+        data = js.encode('utf-8')
+        target = hashed_name(relpath, data)
+        assets[target] = data
+        stats['bundled'] += 1
+        return match.group().replace(attributes['src'], posixpath.relpath(target, page_dir or '.'))
+
+    html = _LINK.sub(inline_link, html)
+    html = re.sub(r'(<script\b[^>]*\ssrc\s*=[^>]*>)\s*</script\s*>', inline_script, html,
+                  flags=re.IGNORECASE)
+    html = minify_html(html)
+    html, stats['deduped'] = dedupe_styles(html)
+
+    # Diğer yerel varlıklar (resimler, ikonlar, CSS url()'leri...) olduğu gibi kopyalanır;
+    # gömülen CSS'in yolları sayfaya göre yeniden yazıldı, ayrı dosyalarınki kendi klasörüne göre
+    references = [(match.group(1).strip('"\''), page_dir) for match in _SRC_REF.finditer(html)]
+    references.extend((match.group(2), page_dir) for match in _CSS_URL.finditer(html))
+    for css, css_dir in stylesheets:
+        references.extend((match.group(2), css_dir) for match in _CSS_URL.finditer(css))
+    for url, base in references:
+        path, relpath = local_asset(url, base)
+        if path is not None and relpath not in assets:
+            target = os.path.join(out_dir, *relpath.split('/'))
+            if not os.path.exists(target):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copy2(path, target)
+                stats['copied'] += 1
+
+    for relpath, data in assets.items():
+        write_output(os.path.join(out_dir, *relpath.split('/')), data, stats)
+    write_output(os.path.join(out_dir, *name.split('/')), html.encode('utf-8'), stats)
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def run_job(job):
+    """Process-pool entry point: ``(source_path, text, base_dir, out_dir, name)``"""
+    source_path, text, base_dir, out_dir, name = job
+    try:
+        if text is None:
+            with open(source_path, encoding='utf-8', errors='replace') as file:
+                text = file.read()
+        return export_document(text, base_dir, out_dir, name)
+    except Exception as e:
+        return {'source': name, 'error': str(e)}
+
+
+def run_jobs(jobs):
+    """Run a chunk of jobs in one worker call (less pickling per page)"""
+    return [run_job(job) for job in jobs]
+
+
+class ExportRun:
+    """Runs export jobs in the background and collects their stats
+
+    Pages go to a process pool (spawn context, as for the renderer) in
+    chunks, so per-task overhead stays small next to the minify work; a
+    single page - or a single CPU - uses a worker thread instead.
+    ``poll()`` returns the stats of jobs finished since the last call.
+    """
+
+    def __init__(self, jobs, max_workers=None):
+        self.jobs = jobs
+        self.results = []
+        self.started = time.perf_counter()
+        self.elapsed = None
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        if workers > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='export')
+        # Her işçiye ~4 parça düşsün; sonuçlar parça parça akar
+        size = max(1, min(32, len(jobs) // (workers * 4)))
+        self.futures = [self.executor.submit(run_jobs, jobs[start:start + size])
+                        for start in range(0, len(jobs), size)]
+
+    def poll(self):
+        finished = [future for future in self.futures if future.done()]
+        self.futures = [future for future in self.futures if not future.done()]
+        stats = []
+        for future in finished:
+            try:
+                stats.extend(future.result())
+            except Exception as e:  # Süreç çöktü
+                stats.append({'source': '?', 'error': str(e)})
+        self.results.extend(stats)
+        if self.done and self.elapsed is None:
+            self.elapsed = time.perf_counter() - self.started
+            self.executor.shutdown(wait=False)
+        return stats
+
+    @property
+    def done(self):
+        return not self.futures
+
+    def cancel(self):
+        for future in self.futures:
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+    def summary(self):
+        """Totals over the finished jobs"""
+        ok = [stats for stats in self.results if 'error' not in stats]
+        return {
+            'pages': len(ok),
+            'errors': len(self.results) - len(ok),
+            'original': sum(stats['original'] for stats in ok),
+            'output': sum(stats['output'] for stats in ok),
+            'gzip': sum(stats['gzip'] for stats in ok),
+            'brotli': sum(stats['brotli'] for stats in ok),
+        }
@@ -0,0 +1,183 @@
+"""Arka plan dosya işlemleri - okuma/yazma iş parçacığı havuzu"""
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from perf import recorder
+
+
+# İşlem umask'ı - bir kez okunur (os.umask iş parçacığı güvenli değil)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(path, text, encoding='utf-8'):
+    """Write to a temp file next to ``path``, fsync, then rename over it
+
+    Readers only ever see the old or the new file, never a half-written
+    one. The original permissions are kept (new files get the usual
+    ``0o666 & ~umask``), a symlink is written through to its target and
+    newlines are translated as ``open(path, 'w')`` would.
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp',
+                                     dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            shutil.copymode(path, temp_path)
+        except OSError:
+            # Yeni dosya - mkstemp'in 0600'ü yerine normal izinler
+            os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return len(text.encode(encoding))
+
+
+def read_text(path, encoding='utf-8'):
+    with open(path, 'r', encoding=encoding) as file:
+        return file.read()
+
+
+class FileIOPool:
+    """Thread pool for file reads and writes
+
+    Work runs on worker threads; callbacks are always invoked on the Tk
+    thread (results are handed over through a queue drained with
+    ``root.after``). Writes are coalesced per key: while a save of a tab is
+    in flight, further saves of the same tab only replace the pending
+    content, so a burst of saves results in at most one extra write.
+    """
+
+    poll_interval = 30  # ms
+
+    def __init__(self, root, max_workers=4):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='file-io')
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._writes = {}  # key -> pending write (None while only one is running)
+        self._active = 0
+        self._poll_job = None
+
+    def read(self, path, callback, error_callback=None, loader=read_text):
+        """Read a text file; ``callback(path, content)`` on the Tk thread
+
+        ``loader(path)`` does the reading - e.g. to decompress a buffer
+        stored elsewhere in the file.
+        """
+        self._submit(loader, (path,),
+                     lambda content, elapsed: callback(path, content),
+                     lambda error: error_callback and error_callback(path, error))
+
+    def write(self, key, path, text, callback=None, error_callback=None):
+        """Atomically write ``text``; ``callback(path, size, elapsed)`` when done
+
+        Returns False when the write was coalesced into one already queued.
+        """
+        request = (path, text, callback, error_callback)
+        with self._lock:
+            if key in self._writes:
+                # Bir yazma sürüyor - sadece en son içeriği sakla
+                self._writes[key] = request
+                return False
+            self._writes[key] = None
+        self._start_write(key, request)
+        return True
+
+    def is_writing(self, key):
+        with self._lock:
+            return key in self._writes
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self._active > 0
+
+    def _start_write(self, key, request):
+        path, text, callback, error_callback = request
+
+        def done(size, elapsed):
+            if callback:
+                callback(path, size, elapsed)
+            self._write_finished(key)
+
+        def failed(error):
+            if error_callback:
+                error_callback(path, error)
+            self._write_finished(key)
+
+        self._submit(atomic_write, (path, text), done, failed)
+
+    def _write_finished(self, key):
+        with self._lock:
+            pending = self._writes.pop(key, None)
+            if pending is not None:
+                self._writes[key] = None
+        if pending is not None:
+            self._start_write(key, pending)
+
+    def _submit(self, func, args, on_done, on_error):
+        with self._lock:
+            self._active += 1
+
+        def task():
+            start = time.perf_counter()
+            try:
+                result = func(*args)
+            except Exception as e:
+                self._results.put((on_error, (e,)))
+            else:
+                end = time.perf_counter()
+                recorder.record(func.__name__, start, end, 'io', {'path': args[0]})
+                self._results.put((on_done, (result, end - start)))
+
+        self.executor.submit(task)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            try:
+                self._poll_job = self.root.after(self.poll_interval, self._poll)
+            except Exception:
+                pass  # Tk penceresi kapandı
+
+    def _poll(self):
+        """Run finished callbacks on the Tk thread"""
+        self._poll_job = None
+        while True:
+            try:
+                handler, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._active -= 1
+            if handler is not None:
+                try:
+                    handler(*args)
+                except Exception as e:
+                    print(f"File I/O callback error: {e}")
+        if self.busy:
+            self._schedule_poll()
+
+    def shutdown(self, wait=True):
+        """Finish queued writes (e.g. on exit) and stop the workers"""
+        if wait:
+            deadline = time.time() + 10
+            while self.busy and time.time() < deadline:
+                self._poll()
+                time.sleep(0.01)
+        self.executor.shutdown(wait=wait)
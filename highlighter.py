@@ -0,0 +1,500 @@
+"""Sözdizimi renklendirme - artımlı HTML/CSS/JS renklendirici
+
+The lexer is a resumable, line-based state machine: ``lex_line`` takes a
+line and the state at its start and returns the tokens plus the state at
+its end. Only the start state of each line is remembered, so an edit
+re-lexes the changed lines and stops as soon as the end state matches
+what the next line already started with.
+"""
+import re
+import time
+
+from editor_proxy import TextChangeProxy, split_index
+from long_lines import TAIL_TAG
+
+# Lexer modes
+TEXT, TAG, ATTR_DQ, ATTR_SQ, COMMENT, CSS, CSS_COMMENT, JS, JS_COMMENT, JS_TEMPLATE = range(10)
+
+# Embedded content that follows an opening tag
+EMBED_NONE, EMBED_CSS, EMBED_JS = range(3)
+
+# Paylaşılan durum nesneleri (satır başına yeni tuple üretme)
+_STATES = {}
+
+
+def _state(mode, extra=0):
+    key = (mode, extra)
+    return _STATES.setdefault(key, key)
+
+
+INITIAL_STATE = _state(TEXT)
+
+# Token tags and their colors on the dark theme
+TAG_COLORS = {
+    'hl_tag': '#60a5fa',
+    'hl_attr': '#93c5fd',
+    'hl_string': '#a5d6a7',
+    'hl_comment': '#6b7280',
+    'hl_doctype': '#9ca3af',
+    'hl_entity': '#fbbf24',
+    'hl_selector': '#f472b6',
+    'hl_property': '#67e8f9',
+    'hl_number': '#fca5a5',
+    'hl_keyword': '#c084fc',
+}
+HIGHLIGHT_TAGS = tuple(TAG_COLORS)
+
+_TEXT_RE = re.compile(r'<!--|<!|</?[A-Za-z][\w:-]*|&#?\w+;')
+_TAG_RE = re.compile(r'\s+|/?>|=|"|\'|[^\s=>/"\']+|/')
+_CSS_TOP_RE = re.compile(r'(?i:</style\b)|/\*|\{|\}|@[-\w]+|[.#]?[-\w]+|"(?:[^"\\]|\\.)*"?|\'(?:[^\'\\]|\\.)*\'?')
+_CSS_BLOCK_RE = re.compile(r'(?i:</style\b)|/\*|\{|\}|"(?:[^"\\]|\\.)*"?|\'(?:[^\'\\]|\\.)*\'?'
+                           r'|[-\w]+(?=\s*:)|#[0-9a-fA-F]{3,8}\b|!important\b'
+                           r'|-?(?:\d+\.?\d*|\.\d+)(?:px|em|rem|vh|vw|vmin|vmax|s|ms|deg|fr|%)?')
+_JS_KEYWORDS = ('async await break case catch class const continue default delete do else '
+                'export extends false finally for function if import in instanceof let new '
+                'null of return switch this throw true try typeof undefined var void while yield')
+_JS_RE = re.compile(r'(?i:</script\b)|//|/\*|`|"(?:[^"\\]|\\.)*"?|\'(?:[^\'\\]|\\.)*\'?'
+                    r'|\b(?:' + '|'.join(_JS_KEYWORDS.split()) + r')\b'
+                    r'|\b\d+(?:\.\d+)?\b')
+_TEMPLATE_END_RE = re.compile(r'(?:[^`\\]|\\.)*`')
+_SCRIPT_CLOSE_RE = re.compile(r'</script\b', re.IGNORECASE)
+
+
+def lex_line(line, state):
+    """Tokenize one line starting in ``state``
+
+    Returns ``(tokens, end_state)`` where tokens are
+    ``(start_col, end_col, tag)`` tuples.
+    """
+    tokens = []
+    mode, extra = state
+    pos = 0
+    n = len(line)
+    while pos < n:
+        if mode == TEXT:
+            m = _TEXT_RE.search(line, pos)
+            if m is None:
+                break
+            tok = m.group()
+            if tok == '<!--':
+                end = line.find('-->', m.end())
+                if end < 0:
+                    tokens.append((m.start(), n, 'hl_comment'))
+                    mode = COMMENT
+                    break
+                tokens.append((m.start(), end + 3, 'hl_comment'))
+                pos = end + 3
+            elif tok == '<!':
+                end = line.find('>', m.end())
+                end = n if end < 0 else end + 1
+                tokens.append((m.start(), end, 'hl_doctype'))
+                pos = end
+            elif tok[0] == '<':
+                tokens.append((m.start(), m.end(), 'hl_tag'))
+                name = tok.lstrip('</').lower()
+                extra = EMBED_NONE
+                if tok[1] != '/':
+                    if name == 'style':
+                        extra = EMBED_CSS
+                    elif name == 'script':
+                        extra = EMBED_JS
+                mode = TAG
+                pos = m.end()
+            else:
+                tokens.append((m.start(), m.end(), 'hl_entity'))
+                pos = m.end()
+
+        elif mode == TAG:
+            after_eq = False
+            while pos < n:
+                m = _TAG_RE.match(line, pos)
+                tok = m.group()
+                first = tok[0]
+                if tok == '>' or tok == '/>':
+                    tokens.append((m.start(), m.end(), 'hl_tag'))
+                    pos = m.end()
+                    if tok == '/>' or extra == EMBED_NONE:
+                        mode = TEXT
+                    elif extra == EMBED_CSS:
+                        mode, extra = CSS, 0
+                    else:
+                        mode, extra = JS, 0
+                    break
+                if first == '"' or first == "'":
+                    end = line.find(first, m.end())
+                    if end < 0:
+                        tokens.append((m.start(), n, 'hl_string'))
+                        mode = ATTR_DQ if first == '"' else ATTR_SQ
+                        pos = n
+                        break
+                    tokens.append((m.start(), end + 1, 'hl_string'))
+                    pos = end + 1
+                    after_eq = False
+                elif first == '=':
+                    after_eq = True
+                    pos = m.end()
+                elif first.isspace() or first == '/':
+                    pos = m.end()
+                else:
+                    tokens.append((m.start(), m.end(), 'hl_string' if after_eq else 'hl_attr'))
+                    after_eq = False
+                    pos = m.end()
+
+        elif mode == ATTR_DQ or mode == ATTR_SQ:
+            end = line.find('"' if mode == ATTR_DQ else "'", pos)
+            if end < 0:
+                tokens.append((pos, n, 'hl_string'))
+                break
+            tokens.append((pos, end + 1, 'hl_string'))
+            pos = end + 1
+            mode = TAG
+
+        elif mode == COMMENT or mode == CSS_COMMENT or mode == JS_COMMENT:
+            terminator = '-->' if mode == COMMENT else '*/'
+            end = line.find(terminator, pos)
+            if end < 0:
+                tokens.append((pos, n, 'hl_comment'))
+                break
+            tokens.append((pos, end + len(terminator), 'hl_comment'))
+            pos = end + len(terminator)
+            mode = TEXT if mode == COMMENT else CSS if mode == CSS_COMMENT else JS
+
+        elif mode == CSS:
+            m = (_CSS_BLOCK_RE if extra else _CSS_TOP_RE).search(line, pos)
+            if m is None:
+                break
+            tok = m.group()
+            start = m.start()
+            pos = m.end()
+            if tok[0] == '<':
+                tokens.append((start, pos, 'hl_tag'))
+                mode, extra = TAG, EMBED_NONE
+            elif tok == '/*':
+                end = line.find('*/', pos)
+                if end < 0:
+                    tokens.append((start, n, 'hl_comment'))
+                    mode = CSS_COMMENT
+                    break
+                tokens.append((start, end + 2, 'hl_comment'))
+                pos = end + 2
+            elif tok == '{':
+                extra = 1
+            elif tok == '}':
+                extra = 0
+            elif tok[0] == '"' or tok[0] == "'":
+                tokens.append((start, pos, 'hl_string'))
+            elif not extra:
+                tokens.append((start, pos, 'hl_keyword' if tok[0] == '@' else 'hl_selector'))
+            elif tok[0] == '#' or tok.lstrip('-.')[:1].isdigit():
+                tokens.append((start, pos, 'hl_number'))
+            elif tok[0] == '!':
+                tokens.append((start, pos, 'hl_keyword'))
+            else:
+                tokens.append((start, pos, 'hl_property'))
+
+        elif mode == JS:
+            m = _JS_RE.search(line, pos)
+            if m is None:
+                break
+            tok = m.group()
+            start = m.start()
+            pos = m.end()
+            first = tok[0]
+            if first == '<':
+                tokens.append((start, pos, 'hl_tag'))
+                mode, extra = TAG, EMBED_NONE
+            elif tok == '//':
+                close = _SCRIPT_CLOSE_RE.search(line, pos)
+                end = close.start() if close else n
+                tokens.append((start, end, 'hl_comment'))
+                pos = end
+            elif tok == '/*':
+                end = line.find('*/', pos)
+                if end < 0:
+                    tokens.append((start, n, 'hl_comment'))
+                    mode = JS_COMMENT
+                    break
+                tokens.append((start, end + 2, 'hl_comment'))
+                pos = end + 2
+            elif first == '`':
+                m = _TEMPLATE_END_RE.match(line, pos)
+                if m is None:
+                    tokens.append((start, n, 'hl_string'))
+                    mode = JS_TEMPLATE
+                    break
+                tokens.append((start, m.end(), 'hl_string'))
+                pos = m.end()
+            elif first == '"' or first == "'":
+                tokens.append((start, pos, 'hl_string'))
+            elif first.isdigit():
+                tokens.append((start, pos, 'hl_number'))
+            else:
+                tokens.append((start, pos, 'hl_keyword'))
+
+        elif mode == JS_TEMPLATE:
+            m = _TEMPLATE_END_RE.match(line, pos)
+            if m is None:
+                tokens.append((pos, n, 'hl_string'))
+                break
+            tokens.append((pos, m.end(), 'hl_string'))
+            pos = m.end()
+            mode = JS
+
+        else:
+            break
+    return tokens, _state(mode, extra)
+
+
+class LineStateIndex:
+    """Start state of every line plus dirty bookkeeping
+
+    Line numbers are 0-based here. ``frontier`` is the first line that has
+    never been lexed; everything before it has a known start state.
+    """
+
+    def __init__(self, line_count=1):
+        self.states = [INITIAL_STATE] + [None] * (line_count - 1)
+        self.tagged = bytearray(line_count)  # 1 = Tk tags are current
+        self.dirty = set()
+        self.frontier = 0
+
+    def __len__(self):
+        return len(self.states)
+
+    def on_insert(self, line, added_lines):
+        """Text was inserted on ``line`` creating ``added_lines`` new lines"""
+        if added_lines:
+            self.states[line + 1:line + 1] = [None] * added_lines
+            self.tagged[line + 1:line + 1] = bytes(added_lines)
+            self.dirty = {d + added_lines if d > line else d for d in self.dirty}
+            if self.frontier > line:
+                self.frontier += added_lines
+        self.dirty.update(range(line, line + added_lines + 1))
+        self.tagged[line] = 0
+
+    def on_delete(self, first, last):
+        """Text from ``first`` to ``last`` was deleted (lines joined)"""
+        removed = last - first
+        if removed:
+            del self.states[first + 1:last + 1]
+            del self.tagged[first + 1:last + 1]
+            self.dirty = {d - removed if d > last else d
+                          for d in self.dirty if not first < d <= last}
+            if self.frontier > last:
+                self.frontier -= removed
+            elif self.frontier > first:
+                self.frontier = first + 1
+        self.dirty.add(first)
+        self.tagged[first] = 0
+
+    def relex_dirty(self, get_line):
+        """Re-lex changed lines behind the frontier; return lines re-lexed"""
+        count = 0
+        total = len(self.states)
+        for line in sorted(self.dirty):
+            if line >= self.frontier or line not in self.dirty:
+                continue
+            state = self.states[line]
+            while True:
+                _, end_state = lex_line(get_line(line), state)
+                self.dirty.discard(line)
+                self.tagged[line] = 0
+                count += 1
+                line += 1
+                if line >= total:
+                    break
+                if line >= self.frontier:
+                    self.states[line] = end_state
+                    break
+                if self.states[line] == end_state and line not in self.dirty:
+                    break
+                self.states[line] = end_state
+                state = end_state
+        self.dirty = {d for d in self.dirty if d >= self.frontier}
+        return count
+
+    def advance(self, lines, start):
+        """Lex ``lines`` (text of lines start, start+1, ...) past the frontier"""
+        total = len(self.states)
+        line = start
+        for text in lines:
+            if line >= total:
+                break
+            _, end_state = lex_line(text, self.states[line])
+            self.tagged[line] = 0
+            line += 1
+            if line < total:
+                self.states[line] = end_state
+        self.frontier = max(self.frontier, min(line, total))
+        self.dirty = {d for d in self.dirty if d >= self.frontier}
+
+    def full_relex(self, lines):
+        """Re-lex every line from scratch (used by the benchmark)"""
+        self.states = [INITIAL_STATE] + [None] * (len(lines) - 1)
+        self.tagged = bytearray(len(lines))
+        self.dirty.clear()
+        self.frontier = 0
+        self.advance(lines, 0)
+
+
+class SyntaxHighlighter:
+    """Incremental highlighter bound to a Tk Text widget
+
+    Changes are tracked through the widget's TextChangeProxy (exact
+    insert/delete indices) and ``<<Modified>>``; work runs on idle so a
+    keystroke only pays for re-lexing the lines it touched. Tags are
+    applied to the visible region plus ``margin`` lines; the rest of the
+    file is lexed in small time-boxed chunks. Truncated long lines (see
+    long_lines) are only lexed and tagged up to their hidden tail.
+    """
+
+    margin = 60
+    chunk_budget = 0.004  # saniye - her arka plan adımının süre sınırı
+    chunk_lines = 500
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.proxy = TextChangeProxy.install(widget)
+        widget._highlighter = self  # expand_line yeniden etiketletir
+        self.index = LineStateIndex(self._line_count())
+        self._update_job = None
+        self._frontier_job = None
+
+        for tag, color in TAG_COLORS.items():
+            widget.tag_configure(tag, foreground=color)
+        widget.tag_raise('sel')
+
+        self.proxy.add_listener(self.on_change)
+        widget.bind('<<Modified>>', self.schedule_update, add='+')
+        widget.bind('<Configure>', self.schedule_update, add='+')
+
+        # Kaydırma: görünür bölge değişince etiketle
+        self._yscroll = widget.cget('yscrollcommand')
+        widget.configure(yscrollcommand=self._on_yscroll)
+        self.schedule_update()
+
+    def _line_count(self):
+        return int(self.proxy.call('index', 'end - 1c').split('.')[0])
+
+    def _get_line(self, line):
+        return self.proxy.call('get', f'{line + 1}.0', f'{line + 1}.end')
+
+    def on_change(self, kind, start, end, text):
+        start_line = split_index(start)[0] - 1
+        end_line = split_index(end)[0] - 1
+        if kind == 'insert':
+            self.index.on_insert(start_line, end_line - start_line)
+        else:
+            self.index.on_delete(start_line, end_line)
+        self.schedule_update()
+
+    def _on_yscroll(self, *args):
+        if self._yscroll:
+            self.widget.tk.call(self._yscroll, *args)
+        self.schedule_update()
+
+    def schedule_update(self, event=None):
+        if self._update_job is None:
+            self._update_job = self.widget.after_idle(self.update)
+
+    def visible_range(self):
+        """0-based [first, last] lines of the visible region plus margin"""
+        first = split_index(self.proxy.call('index', '@0,0'))[0] - 1
+        height = self.widget.winfo_height()
+        last = split_index(self.proxy.call('index', f'@0,{height}'))[0] - 1
+        return max(0, first - self.margin), min(len(self.index) - 1, last + self.margin)
+
+    def update(self):
+        """Re-lex dirty lines and re-tag the visible region"""
+        self._update_job = None
+        try:
+            self.index.relex_dirty(self._get_line)
+            first, last = self.visible_range()
+            if self.index.frontier <= last:
+                self._schedule_frontier()
+            self.apply_tags(first, min(last, self.index.frontier - 1))
+        except Exception as e:
+            # Widget kapanırken olabilir
+            print(f"Highlight error: {e}")
+
+    def _schedule_frontier(self):
+        if self._frontier_job is None:
+            self._frontier_job = self.widget.after(1, self._advance_frontier)
+
+    def _advance_frontier(self):
+        """Lex the next chunks of never-seen lines within the time budget"""
+        self._frontier_job = None
+        deadline = time.perf_counter() + self.chunk_budget
+        total = len(self.index)
+        while self.index.frontier < total and time.perf_counter() < deadline:
+            start = self.index.frontier
+            stop = min(total, start + self.chunk_lines)
+            text = self.proxy.call('get', f'{start + 1}.0', f'{stop}.end')
+            self.index.advance(text.split('\n'), start)
+        if self.index.frontier < total:
+            self._schedule_frontier()
+        self.schedule_update()
+
+    def retag(self, line):
+        """Tag 1-based ``line`` again (its visible part changed, e.g. it was expanded)"""
+        if 0 < line <= len(self.index):
+            self.index.tagged[line - 1] = 0
+            self.schedule_update()
+
+    def _hidden_tails(self, first, last):
+        """``{line: column}`` where the elided tail of a truncated line starts, lines first..last"""
+        tails = {}
+        index = f'{first + 1}.0'
+        stop = f'{last + 2}.0'
+        while True:
+            found = self.widget.tk.splitlist(self.proxy.call('tag', 'nextrange', TAIL_TAG, index, stop))
+            if not found:
+                return tails
+            line, column = split_index(str(found[0]))
+            tails[line - 1] = column
+            index = str(found[1])
+
+    def apply_tags(self, first, last):
+        """(Re)apply tags on stale lines between first and last"""
+        tagged = self.index.tagged
+        states = self.index.states
+        ranges = {tag: [] for tag in HIGHLIGHT_TAGS}
+        stale_runs = []
+        tails = self._hidden_tails(first, last)
+        line = first
+        while line <= last:
+            if tagged[line]:
+                line += 1
+                continue
+            run_start = line
+            while line <= last and not tagged[line]:
+                if line in tails:
+                    # Kısaltılmış satır: gizli kuyruk ne lex edilir ne etiketlenir
+                    text = self.proxy.call('get', f'{line + 1}.0', f'{line + 1}.{tails[line]}')
+                else:
+                    text = self._get_line(line)
+                tokens, _ = lex_line(text, states[line])
+                for start, end, tag in tokens:
+                    ranges[tag].append(f'{line + 1}.{start}')
+                    ranges[tag].append(f'{line + 1}.{end}')
+                tagged[line] = 1
+                line += 1
+            stale_runs.append((run_start, line))
+        if not stale_runs:
+            return
+        for run_start, run_end in stale_runs:
+            for tag in HIGHLIGHT_TAGS:
+                self.proxy.call('tag', 'remove', tag, f'{run_start + 1}.0', f'{run_end + 1}.0')
+        for tag, indices in ranges.items():
+            if indices:
+                self.proxy.call('tag', 'add', tag, *indices)
+
+    def close(self):
+        for job in (self._update_job, self._frontier_job):
+            if job:
+                try:
+                    self.widget.after_cancel(job)
+                except Exception:
+                    pass
+        self.proxy.remove_listener(self.on_change)
+        self.widget._highlighter = None
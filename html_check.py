@@ -0,0 +1,150 @@
+"""HTML denetimi - doğrulama, basit lint kuralları ve DOM anlık görüntüsü (Tk gerektirmez)"""
+import hashlib
+import re
+from html.parser import HTMLParser
+
+# Kapanış etiketi olmayan öğeler
+VOID_TAGS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param',
+    'source', 'track', 'wbr',
+))
+
+# Kapanış etiketi atlanabilen öğeler (HTML5 optional end tags)
+OPTIONAL_END_TAGS = frozenset((
+    'html', 'head', 'body', 'p', 'li', 'dt', 'dd', 'tr', 'td', 'th', 'thead', 'tbody',
+    'tfoot', 'option', 'optgroup', 'colgroup', 'caption', 'rt', 'rp',
+))
+
+# Bu etiketlerin href/src'si önizlemede dosyadan yüklenir
+REFERENCE_ATTRIBUTES = {
+    'link': 'href', 'script': 'src', 'img': 'src', 'source': 'src', 'video': 'src',
+    'audio': 'src', 'iframe': 'src', 'embed': 'src', 'track': 'src',
+}
+
+_SPACE = re.compile(r'\s+')
+
+
+class Issue:
+    """One problem found in a document"""
+
+    __slots__ = ('line', 'column', 'severity', 'code', 'message')
+
+    def __init__(self, line, column, severity, code, message):
+        self.line = line
+        self.column = column
+        self.severity = severity  # 'error' | 'warning'
+        self.code = code
+        self.message = message
+
+    def as_dict(self):
+        return {'line': self.line, 'column': self.column, 'severity': self.severity,
+                'code': self.code, 'message': self.message}
+
+
+class HTMLChecker(HTMLParser):
+    """Single-pass document pass built on ``html.parser``
+
+    Collects the document-level issues (missing doctype/title/lang), the
+    local resources the page references and a normalized outline of the
+    DOM used as a snapshot. Markup and CSS rules (nesting, unclosed or
+    stray tags, duplicate ids, ``alt``) belong to lint.LintIndex, so the
+    editor and ``--batch`` report the same problems.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.issues = []
+        self.stack = []  # (tag, line, column)
+        self.references = []  # (line, column, url)
+        self.outline = []
+        self.title = None
+        self.doctype = False
+        self.lang = None
+        self._in_title = False
+        self._title_parts = []
+        self._raw = None  # <script>/<style> içi - metin anlık görüntüye girmez
+
+    def issue(self, severity, code, message, position=None):
+        line, column = position or self.getpos()
+        self.issues.append(Issue(line, column + 1, severity, code, message))
+
+    def handle_decl(self, decl):
+        if decl.lower().startswith('doctype'):
+            self.doctype = True
+
+    def handle_starttag(self, tag, attrs):
+        self._element(tag, attrs)
+        if tag not in VOID_TAGS:
+            line, column = self.getpos()
+            self.stack.append((tag, line, column))
+            if tag == 'title':
+                self._in_title = True
+            elif tag in ('script', 'style'):
+                self._raw = tag
+
+    def handle_startendtag(self, tag, attrs):
+        self._element(tag, attrs)
+
+    def _element(self, tag, attrs):
+        attributes = dict(attrs)
+        if tag == 'html':
+            self.lang = attributes.get('lang')
+        reference = REFERENCE_ATTRIBUTES.get(tag)
+        if reference and attributes.get(reference):
+            if tag != 'link' or 'stylesheet' in (attributes.get('rel') or '').lower().split() \
+                    or 'icon' in (attributes.get('rel') or '').lower().split():
+                line, column = self.getpos()
+                self.references.append((line, column + 1, attributes[reference]))
+        shown = ''.join(f" {name}" if value is None else f" {name}=\"{_SPACE.sub(' ', value)}\""
+                        for name, value in sorted(attrs))
+        self.outline.append(f"{'  ' * len(self.stack)}<{tag}{shown}>")
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                break
+        else:
+            return  # Eşleşmeyen kapanış - lint bildirir
+        del self.stack[depth:]
+        if tag == 'title':
+            self._in_title = False
+            self.title = _SPACE.sub(' ', ''.join(self._title_parts)).strip()
+        elif tag == self._raw:
+            self._raw = None
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+        if self._raw is None:
+            text = _SPACE.sub(' ', data).strip()
+            if text:
+                self.outline.append(f"{'  ' * len(self.stack)}{text}")
+
+    def close(self):
+        super().close()
+        self.stack = []
+        if not self.doctype:
+            self.issue('warning', 'missing-doctype', "No <!DOCTYPE html> declaration", (1, 0))
+        if not self.title:
+            self.issue('warning', 'missing-title', "Document has no <title>", (1, 0))
+        if self.doctype and not self.lang:
+            self.issue('warning', 'missing-lang', "<html> has no lang attribute", (1, 0))
+
+    def snapshot(self):
+        """Normalized DOM outline (tags, sorted attributes, collapsed text)"""
+        return '\n'.join(self.outline) + '\n'
+
+
+def check_html(text):
+    """Run the document pass over a whole page; returns the finished HTMLChecker"""
+    checker = HTMLChecker()
+    checker.feed(text)
+    checker.close()
+    checker.issues.sort(key=lambda issue: (issue.line, issue.column))
+    return checker
+
+
+def snapshot_hash(snapshot):
+    return hashlib.blake2b(snapshot.encode('utf-8'), digest_size=8).hexdigest()
@@ -0,0 +1,79 @@
+"""Anahtarlı arka plan işçisi - sekme başına en son isteği bir iş parçacığında işler"""
+import queue
+import threading
+import time
+
+
+class KeyedWorker:
+    """Runs ``work(*args)`` on a background thread, newest request per key
+
+    ``submit(key, version, *args)`` replaces any request of the same key
+    that has not started yet, so a burst of edits costs one run. Results
+    are handed to the Tk thread: while any request is outstanding the
+    worker polls its queue with ``root.after`` and calls
+    ``on_result(key, version, result, seconds)``. ``work`` must leave its
+    arguments untouched - the Tk thread keeps reading the previous result
+    while the next one is built from it.
+    """
+
+    def __init__(self, root, name, work, on_result, poll_interval=30):
+        self.root = root
+        self.name = name
+        self.work = work
+        self.on_result = on_result
+        self.poll_interval = poll_interval  # ms
+        self.results = queue.Queue()
+        self._requests = {}
+        self._outstanding = {}  # key -> beklenen sonuç sayısı (yalnızca Tk iş parçacığı)
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._poll_job = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, key, version, *args):
+        with self._condition:
+            replaced = key in self._requests
+            self._requests[key] = (version, args)
+            self._condition.notify()
+        if not replaced:
+            self._outstanding[key] = self._outstanding.get(key, 0) + 1
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._requests and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                key = next(iter(self._requests))
+                version, args = self._requests.pop(key)
+            start = time.perf_counter()
+            try:
+                result = self.work(*args)
+            except Exception as e:  # Sonuç yok - bekleyen sayısı yine de düşsün
+                print(f"{self.name.capitalize()} error: {e}")
+                result = None
+            self.results.put((key, version, result, time.perf_counter() - start))
+
+    def _poll(self):
+        self._poll_job = None
+        while True:
+            try:
+                key, version, result, seconds = self.results.get_nowait()
+            except queue.Empty:
+                break
+            count = self._outstanding.pop(key, 1) - 1
+            if count > 0:
+                self._outstanding[key] = count
+            if result is not None:
+                self.on_result(key, version, result, seconds)
+        if self._outstanding and self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
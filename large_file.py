@@ -0,0 +1,309 @@
+"""Büyük dosya modu - mmap ile pencereli (lazy) görüntüleme"""
+import bisect
+import mmap
+import os
+import re
+import threading
+import tkinter as tk
+from array import array
+
+# Bu boyutun üzerindeki dosyalar büyük dosya modunda açılır
+LARGE_FILE_THRESHOLD = 20 * 1024 * 1024  # 20 MB
+
+# Tek satırın pencerede gösterilecek en fazla karakteri
+MAX_DISPLAY_COLUMNS = 10000
+
+
+class LargeFileDocument:
+    """Memory-mapped file with a line-offset index built in the background
+
+    ``offsets[i]`` is the byte offset where line ``i`` (0-based) starts.
+    Lines can be read as soon as their offset is indexed; the index keeps
+    growing until ``complete`` is set.
+    """
+
+    chunk_size = 16 * 1024 * 1024
+
+    def __init__(self, path, encoding='utf-8'):
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap boş dosyayı açamaz
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.offsets = array('Q', [0])
+        self.complete = False
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start_indexing(self):
+        """Build the line index on a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._build_index,
+                                            name="large-file-index", daemon=True)
+            self._thread.start()
+
+    def _build_index(self):
+        mm = self.mm
+        pos = 0
+        newline = re.compile(b'\n')
+        while pos < self.size and not self._cancel.is_set():
+            end = min(self.size, pos + self.chunk_size)
+            found = array('Q', (m.end() for m in newline.finditer(mm, pos, end)))
+            # Dosya sonundaki satır sonu yeni bir (boş) satır başlatmaz
+            if found and found[-1] == self.size:
+                found.pop()
+            with self._lock:
+                self.offsets.extend(found)
+            pos = end
+        self.complete = not self._cancel.is_set()
+
+    @property
+    def progress(self):
+        """Fraction of the file indexed so far"""
+        if self.complete or not self.size:
+            return 1.0
+        with self._lock:
+            return self.offsets[-1] / self.size
+
+    @property
+    def line_count(self):
+        with self._lock:
+            return len(self.offsets)
+
+    def line_span(self, line):
+        """Byte range (start, end) of a line, without the newline"""
+        with self._lock:
+            start = self.offsets[line]
+            end = self.offsets[line + 1] - 1 if line + 1 < len(self.offsets) else None
+        if end is None:
+            end = self.mm.find(b'\n', start) if self.size else -1
+            if end < 0:
+                end = self.size
+        if end > start and self.mm[end - 1:end] == b'\r':
+            end -= 1
+        return start, end
+
+    def get_lines(self, start, count, max_columns=None):
+        """Decode ``count`` lines beginning at ``start``"""
+        lines = []
+        for line in range(start, min(start + count, self.line_count)):
+            begin, end = self.line_span(line)
+            truncated = max_columns is not None and end - begin > max_columns
+            if truncated:
+                end = begin + max_columns * 4  # UTF-8 karakter başına en fazla 4 bayt
+            text = self.mm[begin:end].decode(self.encoding, errors='replace')
+            if truncated and len(text) > max_columns:
+                text = text[:max_columns] + ' …'
+            lines.append(text)
+        return lines
+
+    def line_of_offset(self, offset):
+        with self._lock:
+            return bisect.bisect_right(self.offsets, offset) - 1
+
+    def search(self, pattern, start_offset=0, regex=False, ignore_case=True):
+        """Find the next match at or after ``start_offset``
+
+        Returns ``(line, column, byte_offset)`` or None. The search runs over
+        the mapped bytes directly and wraps around once.
+        """
+        if not self.size:
+            return None
+        expr = pattern if regex else re.escape(pattern)
+        compiled = re.compile(expr.encode(self.encoding), re.IGNORECASE if ignore_case else 0)
+        match = compiled.search(self.mm, start_offset) or compiled.search(self.mm, 0, start_offset)
+        if match is None:
+            return None
+        offset = match.start()
+        # İndeks henüz oraya ulaşmadıysa bekle
+        while not self.complete and self.offsets[-1] < offset and not self._cancel.is_set():
+            self._thread.join(0.05)
+        line = self.line_of_offset(offset)
+        column = len(self.mm[self.offsets[line]:offset].decode(self.encoding, errors='replace'))
+        return line, column, offset
+
+    def close(self):
+        self._cancel.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        try:
+            if self.size:
+                self.mm.close()
+            self._file.close()
+        except Exception:
+            pass
+
+
+class LargeFileView(tk.Frame):
+    """Read-only view showing only a sliding window of a LargeFileDocument
+
+    The text widget holds just the lines that fit on screen; the scrollbar,
+    keyboard navigation, "go to line" and search all work in document
+    line numbers against the index.
+    """
+
+    def __init__(self, parent, document, on_status=None, **kwargs):
+        super().__init__(parent, bg='#2a2a2a')
+        self.document = document
+        self.on_status = on_status
+        self.top = 0  # İlk görünen belge satırı
+        self.visible_lines = 50
+        self.last_search = None
+        self._search_offset = 0
+
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(self, wrap=tk.NONE, **kwargs)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.tag_configure('search_hit', background='#1e40af', foreground='#ffffff')
+
+        # Salt okunur (disabled); dikey gezinmeyi pencere üzerinden biz yapıyoruz
+        self.text.bind('<Key>', self.on_key)
+        self.text.bind('<Button-1>', lambda e: self.text.focus_set())
+        self.text.bind('<MouseWheel>', lambda e: self.scroll_lines(-3 if e.delta > 0 else 3))
+        self.text.bind('<Button-4>', lambda e: self.scroll_lines(-3))
+        self.text.bind('<Button-5>', lambda e: self.scroll_lines(3))
+        self.text.bind('<Configure>', self.on_resize)
+        self.text.bind('<Control-f>', lambda e: self.prompt_search())
+        self.text.bind('<F3>', lambda e: self.search_next())
+        self.text.bind('<Control-g>', lambda e: self.prompt_goto())
+
+        document.start_indexing()
+        self.render()
+        self.after(200, self.poll_index)
+
+    def poll_index(self):
+        """Refresh scrollbar and status while the index is being built"""
+        self.update_scrollbar()
+        if self.document.complete:
+            self.status(f"📚 {self.document.line_count:,} lines indexed (read-only large file mode)")
+        else:
+            self.status(f"⏳ Indexing lines... {self.document.progress:.0%}")
+            if self.top + self.visible_lines >= self.document.line_count - 1:
+                self.render()
+            self.after(200, self.poll_index)
+
+    def status(self, text):
+        if self.on_status:
+            self.on_status(text)
+
+    def on_resize(self, event=None):
+        line_height = max(1, self.text.tk.call('font', 'metrics', self.text.cget('font'), '-linespace'))
+        visible = max(1, self.text.winfo_height() // int(line_height) + 1)
+        if visible != self.visible_lines:
+            self.visible_lines = visible
+            self.render()
+
+    def render(self):
+        """Replace the widget contents with the lines of the current window"""
+        lines = self.document.get_lines(self.top, self.visible_lines, MAX_DISPLAY_COLUMNS)
+        self.text.config(state=tk.NORMAL)
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', '\n'.join(lines))
+        self.text.config(state=tk.DISABLED)
+        if self.last_search is not None:
+            line, column, length = self.last_search
+            if self.top <= line < self.top + self.visible_lines:
+                row = line - self.top + 1
+                self.text.tag_add('search_hit', f'{row}.{column}', f'{row}.{column + length}')
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        total = max(1, self.document.line_count)
+        first = self.top / total
+        last = min(1.0, (self.top + self.visible_lines) / total)
+        self.scrollbar.set(first, last)
+
+    def scroll_to(self, line):
+        max_top = max(0, self.document.line_count - self.visible_lines + 1)
+        line = max(0, min(line, max_top))
+        if line != self.top:
+            self.top = line
+            self.render()
+
+    def scroll_lines(self, delta):
+        self.scroll_to(self.top + delta)
+        return 'break'
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * self.document.line_count))
+        elif action == 'scroll':
+            step = self.visible_lines - 1 if unit == 'pages' else 1
+            self.scroll_lines(int(amount) * step)
+
+    def on_key(self, event):
+        keys = {
+            'Up': -1, 'Down': 1,
+            'Prior': -(self.visible_lines - 1), 'Next': self.visible_lines - 1,
+        }
+        if event.keysym in keys:
+            return self.scroll_lines(keys[event.keysym])
+        if event.keysym == 'Home' and event.state & 0x4:
+            self.scroll_to(0)
+        elif event.keysym == 'End' and event.state & 0x4:
+            self.scroll_to(self.document.line_count)
+        else:
+            return None  # Diğer tuşlar (kopyalama, yatay kaydırma) serbest
+        return 'break'
+
+    def prompt_goto(self):
+        from tkinter import simpledialog
+        line = simpledialog.askinteger("Go to line", f"Line (1 - {self.document.line_count:,}):",
+                                       parent=self, minvalue=1)
+        if line:
+            self.scroll_to(line - 1)
+        return 'break'
+
+    def prompt_search(self):
+        from tkinter import simpledialog
+        pattern = simpledialog.askstring("Search", "Find:", parent=self)
+        if pattern:
+            self._pattern = pattern
+            self._search_offset = self.document.offsets[self.top] if self.top < self.document.line_count else 0
+            self.search_next()
+        return 'break'
+
+    def search_next(self):
+        """Search in a worker thread and jump to the hit"""
+        pattern = getattr(self, '_pattern', None)
+        if not pattern:
+            return 'break'
+        self.status(f"🔍 Searching for '{pattern}'...")
+        result = {}
+
+        def worker():
+            try:
+                result['hit'] = self.document.search(pattern, self._search_offset)
+            except Exception as e:
+                result['error'] = e
+
+        thread = threading.Thread(target=worker, name="large-file-search", daemon=True)
+        thread.start()
+
+        def wait():
+            if thread.is_alive():
+                self.after(30, wait)
+                return
+            if 'error' in result:
+                self.status(f"❌ Search error: {result['error']}")
+                return
+            hit = result.get('hit')
+            if hit is None:
+                self.last_search = None
+                self.status(f"🔍 '{pattern}' not found")
+                return
+            line, column, offset = hit
+            self._search_offset = offset + 1
+            self.last_search = (line, column, len(pattern))
+            self.top = -1  # Yeniden çizimi zorla
+            self.scroll_to(max(0, line - self.visible_lines // 3))
+            self.status(f"🔍 Found at line {line + 1:,}")
+
+        wait()
+        return 'break'
+
+    def close(self):
+        self.document.close()
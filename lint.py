@@ -0,0 +1,602 @@
+"""Arka plan lint - artımlı HTML/CSS denetimi ve editörde altı çizili sorunlar"""
+import bisect
+import re
+
+from html_check import OPTIONAL_END_TAGS, VOID_TAGS, Issue
+
+# Belirli aralıklarla, bir etiket sınırında yeniden başlama noktası saklanır
+CHECKPOINT_SPACING = 4096
+# Editörde en fazla bu kadar sorun işaretlenir
+MAX_MARKS = 2000
+
+ERROR_TAG = 'lint_error'
+WARNING_TAG = 'lint_warning'
+
+# Tüm seçenekler '<' ile başlar - başarısız denemeler ilk karakterde biter
+# Etiket adında tırnak olmaz: yoksa sonradan gelen bir tırnak önceki eşleşmeyi geri izlemeyle değiştirir
+_TOKEN = re.compile(
+    r'<(?:!--.*?(?:-->|\Z)'
+    r'|((?i:script|style|textarea))\b([^>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^>"\']*)*)>(.*?)(</(?i:\1)\s*>|\Z)'
+    r'|![^>]*>?'
+    r'|(/?)([A-Za-z][^\s/>"\']*)([^>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^>"\']*)*)>)',
+    re.DOTALL)
+# Eşleşmeyen '<ad' denemesi kapanmayan tırnak / '>' arayarak metnin sonuna kadar okur
+_NAMED_TAG = re.compile(r'</?[A-Za-z]')
+# id / style içeren etiketlerin öznitelikleri ayrıştırılır, diğerleri atlanır
+_INTERESTING = re.compile(r'(?<![-\w])(?:id|style)\s*=', re.IGNORECASE)
+_ATTRIBUTE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s"\'>]+))?')
+_CSS_COMMENT = re.compile(r'/\*.*?(?:\*/|\Z)', re.DOTALL)
+# "ad: değer" - değerden sonra '{' gelirse seçicidir (a:hover {), bildirim değil
+_CSS_DECLARATION = re.compile(r'[{;]\s*(-?[A-Za-z_][-\w]*)\s*:[^;{}]*(?=[;}])')
+
+# Blok öğeler - açık bir <p> öğesini örtük olarak kapatır
+_BLOCK = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'details', 'dialog', 'div', 'dl', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+    'hgroup', 'hr', 'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul',
+))
+# Yalnızca satır içi içerik alabilen öğeler
+_PHRASING_ONLY = frozenset((
+    'abbr', 'b', 'bdi', 'bdo', 'button', 'cite', 'code', 'data', 'dfn', 'em', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'i', 'kbd', 'label', 'mark', 'q', 's', 'samp', 'small', 'span', 'strong',
+    'sub', 'sup', 'time', 'u', 'var',
+))
+# Öğe -> içinde bulunması gereken ebeveynler
+_REQUIRED_PARENT = {
+    'li': frozenset(('ul', 'ol', 'menu')),
+    'tr': frozenset(('table', 'thead', 'tbody', 'tfoot')),
+    'td': frozenset(('tr',)),
+    'th': frozenset(('tr',)),
+    'thead': frozenset(('table',)),
+    'tbody': frozenset(('table',)),
+    'tfoot': frozenset(('table',)),
+    'caption': frozenset(('table',)),
+    'colgroup': frozenset(('table',)),
+    'dt': frozenset(('dl', 'div')),
+    'dd': frozenset(('dl', 'div')),
+    'option': frozenset(('select', 'datalist', 'optgroup')),
+    'optgroup': frozenset(('select',)),
+    'figcaption': frozenset(('figure',)),
+    'legend': frozenset(('fieldset',)),
+    'summary': frozenset(('details',)),
+}
+# Öğe -> içinde bulunamayacağı atalar (etkileşimli öğeler iç içe geçemez)
+_FORBIDDEN_ANCESTORS = {
+    'a': ('a', 'button'),
+    'button': ('a', 'button'),
+    'form': ('form',),
+    'label': ('label',),
+}
+# Açılan öğe -> örtük olarak kapattığı açık öğeler (kapanış etiketi isteğe bağlı)
+_IMPLIED_END = {
+    'li': frozenset(('li',)),
+    'dt': frozenset(('dt', 'dd')),
+    'dd': frozenset(('dt', 'dd')),
+    'option': frozenset(('option',)),
+    'tr': frozenset(('tr', 'td', 'th')),
+    'td': frozenset(('td', 'th')),
+    'th': frozenset(('td', 'th')),
+    'thead': frozenset(('thead', 'tbody', 'tfoot', 'tr', 'td', 'th')),
+    'tbody': frozenset(('thead', 'tbody', 'tfoot', 'tr', 'td', 'th')),
+    'tfoot': frozenset(('thead', 'tbody', 'tfoot', 'tr', 'td', 'th')),
+}
+
+# Açılışında kural denetlenen öğeler
+_CHECKED = frozenset(_BLOCK | _REQUIRED_PARENT.keys() | _FORBIDDEN_ANCESTORS.keys() | _IMPLIED_END.keys())
+
+CSS_PROPERTIES = frozenset('''
+accent-color align-content align-items align-self all animation animation-composition
+animation-delay animation-direction animation-duration animation-fill-mode
+animation-iteration-count animation-name animation-play-state animation-timeline
+animation-timing-function appearance aspect-ratio backdrop-filter backface-visibility background
+background-attachment background-blend-mode background-clip background-color background-image
+background-origin background-position background-position-x background-position-y
+background-repeat background-size block-size border border-block border-block-color
+border-block-end border-block-end-color border-block-end-style border-block-end-width
+border-block-start border-block-start-color border-block-start-style border-block-start-width
+border-block-style border-block-width border-bottom border-bottom-color
+border-bottom-left-radius border-bottom-right-radius border-bottom-style border-bottom-width
+border-collapse border-color border-end-end-radius border-end-start-radius border-image
+border-image-outset border-image-repeat border-image-slice border-image-source
+border-image-width border-inline border-inline-color border-inline-end border-inline-end-color
+border-inline-end-style border-inline-end-width border-inline-start border-inline-start-color
+border-inline-start-style border-inline-start-width border-inline-style border-inline-width
+border-left border-left-color border-left-style border-left-width border-radius border-right
+border-right-color border-right-style border-right-width border-spacing border-start-end-radius
+border-start-start-radius border-style border-top border-top-color border-top-left-radius
+border-top-right-radius border-top-style border-top-width border-width bottom
+box-decoration-break box-shadow box-sizing break-after break-before break-inside caption-side
+caret-color clear clip clip-path color color-scheme column-count column-fill column-gap
+column-rule column-rule-color column-rule-style column-rule-width column-span column-width
+columns contain contain-intrinsic-block-size contain-intrinsic-height
+contain-intrinsic-inline-size contain-intrinsic-size contain-intrinsic-width container
+container-name container-type content content-visibility counter-increment counter-reset
+counter-set cursor direction display empty-cells fill fill-opacity fill-rule filter flex
+flex-basis flex-direction flex-flow flex-grow flex-shrink flex-wrap float flood-color
+flood-opacity font font-display font-family font-feature-settings font-kerning
+font-language-override font-optical-sizing font-palette font-size font-size-adjust
+font-stretch font-style font-synthesis font-variant font-variant-alternates
+font-variant-caps font-variant-east-asian font-variant-ligatures font-variant-numeric
+font-variant-position font-variation-settings font-weight forced-color-adjust gap grid
+grid-area grid-auto-columns grid-auto-flow grid-auto-rows grid-column grid-column-end
+grid-column-gap grid-column-start grid-gap grid-row grid-row-end grid-row-gap grid-row-start
+grid-template grid-template-areas grid-template-columns grid-template-rows
+hanging-punctuation height hyphenate-character hyphens image-orientation image-rendering
+inline-size inset inset-block inset-block-end inset-block-start inset-inline
+inset-inline-end inset-inline-start isolation justify-content justify-items justify-self left
+letter-spacing lighting-color line-break line-clamp line-height list-style list-style-image
+list-style-position list-style-type margin margin-block margin-block-end margin-block-start
+margin-bottom margin-inline margin-inline-end margin-inline-start margin-left margin-right
+margin-top marker marker-end marker-mid marker-start mask mask-border mask-clip
+mask-composite mask-image mask-mode mask-origin mask-position mask-repeat mask-size mask-type
+math-depth math-style max-block-size max-height max-inline-size max-width min-block-size
+min-height min-inline-size min-width mix-blend-mode object-fit object-position offset
+offset-anchor offset-distance offset-path offset-position offset-rotate opacity order orphans
+outline outline-color outline-offset outline-style outline-width overflow overflow-anchor
+overflow-block overflow-clip-margin overflow-inline overflow-wrap overflow-x overflow-y
+overscroll-behavior overscroll-behavior-block overscroll-behavior-inline
+overscroll-behavior-x overscroll-behavior-y padding padding-block padding-block-end
+padding-block-start padding-bottom padding-inline padding-inline-end padding-inline-start
+padding-left padding-right padding-top page page-break-after page-break-before
+page-break-inside paint-order perspective perspective-origin place-content place-items
+place-self pointer-events position print-color-adjust quotes r resize right rotate row-gap
+ruby-align ruby-position rx ry scale scroll-behavior scroll-margin scroll-margin-block
+scroll-margin-block-end scroll-margin-block-start scroll-margin-bottom scroll-margin-inline
+scroll-margin-inline-end scroll-margin-inline-start scroll-margin-left scroll-margin-right
+scroll-margin-top scroll-padding scroll-padding-block scroll-padding-block-end
+scroll-padding-block-start scroll-padding-bottom scroll-padding-inline
+scroll-padding-inline-end scroll-padding-inline-start scroll-padding-left
+scroll-padding-right scroll-padding-top scroll-snap-align scroll-snap-stop scroll-snap-type
+scroll-timeline scroll-timeline-axis scroll-timeline-name scrollbar-color scrollbar-gutter
+scrollbar-width shape-image-threshold shape-margin shape-outside shape-rendering stop-color
+stop-opacity stroke stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin
+stroke-miterlimit stroke-opacity stroke-width tab-size table-layout text-align
+text-align-last text-anchor text-combine-upright text-decoration text-decoration-color
+text-decoration-line text-decoration-skip-ink text-decoration-style
+text-decoration-thickness text-emphasis text-emphasis-color text-emphasis-position
+text-emphasis-style text-indent text-justify text-orientation text-overflow text-rendering
+text-shadow text-size-adjust text-transform text-underline-offset text-underline-position
+text-wrap top touch-action transform transform-box transform-origin transform-style
+transition transition-behavior transition-delay transition-duration transition-property
+transition-timing-function translate unicode-bidi user-select vector-effect vertical-align
+view-timeline view-transition-name visibility white-space white-space-collapse widows width
+will-change word-break word-spacing word-wrap writing-mode x y z-index zoom
+'''.split())
+
+# @font-face / @page vb. kurallarındaki tanımlayıcılar
+CSS_DESCRIPTORS = frozenset((
+    'src', 'unicode-range', 'size', 'ascent-override', 'descent-override', 'line-gap-override',
+    'size-adjust', 'font-named-instance', 'syntax', 'inherits', 'initial-value', 'bleed', 'marks',
+    'base-palette', 'override-colors', 'navigation', 'types', 'system', 'symbols',
+    'additive-symbols', 'negative', 'prefix', 'suffix', 'range', 'pad', 'speak-as', 'fallback',
+))
+
+
+def _is_known_property(name):
+    name = name.lower()
+    return (name in CSS_PROPERTIES or name in CSS_DESCRIPTORS
+            or name.startswith('--') or name[0] == '-' or name.startswith('mso-'))
+
+
+def css_problems(css, offset, problems):
+    """Append an unknown-property problem for each declaration ``css`` has"""
+    if '/*' in css:
+        # Yorumları aynı uzunlukta boşlukla değiştir - konumlar kaymasın
+        css = _CSS_COMMENT.sub(lambda m: ' ' * len(m.group()), css)
+    for match in _CSS_DECLARATION.finditer(css):
+        name = match.group(1)
+        if not _is_known_property(name):
+            start = offset + match.start(1)
+            problems.append((start, start + len(name), 'warning', 'unknown-css-property',
+                             f"Unknown CSS property \"{name}\""))
+
+
+def _common_prefix(old, new):
+    """Length of the common prefix, compared in large slices (memcmp speed)"""
+    limit = min(len(old), len(new))
+    position = 0
+    step = 1 << 16
+    while position < limit:
+        end = min(position + step, limit)
+        if old[position:end] != new[position:end]:
+            break
+        position = end
+    else:
+        return limit
+    # Farklı dilim içinde ikili arama
+    low, high = position, min(position + step, limit)
+    while low < high:
+        middle = (low + high) // 2
+        if old[position:middle + 1] == new[position:middle + 1]:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _common_suffix(old, new, limit):
+    """Length of the common suffix, at most ``limit`` characters"""
+    length = 0
+    step = 1 << 16
+    old_end, new_end = len(old), len(new)
+    while length < limit:
+        size = min(step, limit - length)
+        if old[old_end - length - size:old_end - length] != new[new_end - length - size:new_end - length]:
+            break
+        length += size
+    else:
+        return limit
+    low, high = length, min(length + step, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[old_end - middle:old_end - length] == new[new_end - middle:new_end - length]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _shift_stack(stack, old_end, delta):
+    """An old open-element stack in the coordinates of the edited text"""
+    return tuple((name, start + delta if start >= old_end else start, end + delta if end >= old_end else end)
+                 for name, start, end in stack)
+
+
+def _position(index):
+    line, column = index.split('.')
+    return int(line), int(column)
+
+
+class LintIndex:
+    """Lint problems of one HTML buffer, updated incrementally
+
+    The tokenizer is a single regex scan; every ``CHECKPOINT_SPACING``
+    characters it stores a checkpoint at a token boundary (offset, open
+    element stack, problem and id counts). After an edit ``update()``
+    finds the changed range by comparing the old and new text, restarts
+    at the last checkpoint before it - and before any ``<name`` that
+    matched no token (an unclosed quote makes the tokenizer read from there
+    to the end, so the edit may complete it) - and stops as soon as it
+    reaches an old checkpoint with the same open elements: everything after that is
+    the old result, shifted by the size of the edit. Duplicate ids are
+    the only document-wide rule and are resolved from the id list after
+    each scan.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.problems = []  # (başlangıç, bitiş, önem, kod, mesaj) - bulunma sırasıyla
+        self.ids = []  # (başlangıç, bitiş, id)
+        self.checkpoints = []  # (ofset, yığın, sorun sayısı, id sayısı, örtük </p>)
+        self.strays = []  # Hiçbir belirteçle eşleşmeyen '<ad' ofsetleri
+        self.marks = []  # (başlangıç 'satır.sütun', bitiş, önem, kod, mesaj) - sıralı
+        self._starts = []  # İşaretlerin (satır, sütun) başlangıçları
+        self.error_count = 0
+        self.warning_count = 0
+        self.scanned = 0  # Son taramada okunan karakter sayısı
+
+    @classmethod
+    def build(cls, text):
+        index = cls(text)
+        index._scan(0, [], False, None)
+        index._finish()
+        return index
+
+    def update(self, text):
+        """Index of ``text``, re-scanning only around the changed range"""
+        old = self.text
+        if text == old:
+            return self
+        prefix = _common_prefix(old, text)
+        suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+        offsets = [checkpoint[0] for checkpoint in self.checkpoints]
+        # Değişiklikten hemen önceki '<' (ör. '</' + yeni harf) yeni bir belirteç başlatabilir
+        restart = prefix - 2
+        if self.strays and self.strays[0] < restart:
+            restart = self.strays[0]
+        position = bisect.bisect_left(offsets, restart) - 1
+        if position < 0:
+            return LintIndex.build(text)
+        offset, stack, problem_count, id_count, implied_p = self.checkpoints[position]
+        index = LintIndex(text)
+        index.problems = self.problems[:problem_count]
+        index.ids = self.ids[:id_count]
+        index.checkpoints = self.checkpoints[:position]
+        index.strays = self.strays[:bisect.bisect_left(self.strays, offset)]
+        old_end = len(old) - suffix
+        # Değişikliğin ardından gelen ilk eski kontrol noktası
+        following = bisect.bisect_left(offsets, old_end, position + 1)
+        index._scan(offset, list(stack), implied_p, (self, following, old_end, len(text) - len(old)))
+        index._finish()
+        return index
+
+    def _scan(self, offset, stack, implied_p, resync):
+        """Tokenize from ``offset`` with ``stack`` open; ``resync`` allows stopping early
+
+        ``implied_p`` tells whether a block element has closed a ``<p>``
+        implicitly, which explains a later stray ``</p>``.
+        """
+        text = self.text
+        problems = self.problems
+        ids = self.ids
+        checkpoints = self.checkpoints
+        next_checkpoint = offset
+        target = float('inf')
+        if resync is not None:
+            old, following, old_end, delta = resync
+            old_checkpoints = old.checkpoints
+            if following < len(old_checkpoints):
+                target = old_checkpoints[following][0] + delta
+        last_end = offset
+        for match in _TOKEN.finditer(text, offset):
+            start = match.start()
+            if start != last_end:
+                self._find_strays(last_end, start)
+            last_end = match.end()
+            if start >= target:
+                # Eski bir kontrol noktasına aynı yığınla ulaşıldıysa gerisi değişmedi
+                while following < len(old_checkpoints) and old_checkpoints[following][0] + delta < start:
+                    following += 1
+                if following < len(old_checkpoints):
+                    target = old_checkpoints[following][0] + delta
+                    checkpoint = old_checkpoints[following]
+                    if target == start and implied_p == checkpoint[4] \
+                            and tuple(stack) == _shift_stack(checkpoint[1], old_end, delta):
+                        self._splice(old, following, old_end, delta)
+                        self.scanned = start - offset
+                        return
+                else:
+                    target = float('inf')
+            if start >= next_checkpoint:
+                checkpoints.append((start, tuple(stack), len(problems), len(ids), implied_p))
+                next_checkpoint = start + CHECKPOINT_SPACING
+            raw, closing, name, attributes = match.group(1, 5, 6, 7)
+            if name is None:
+                if raw is not None:
+                    self._raw_element(match, raw.lower(), stack, problems, ids)
+                continue  # Yorum / doctype
+            name = name.lower()
+            if closing:
+                if stack and stack[-1][0] == name:
+                    stack.pop()  # En sık durum: son açılan öğe kapanıyor
+                elif name not in VOID_TAGS:
+                    self._close(name, start, match.end(), stack, implied_p, problems)
+                continue
+            end = match.end()
+            if name in _CHECKED:
+                implied_p = self._open(name, start, end, stack, problems) or implied_p
+            if attributes:
+                if name == 'img' or _INTERESTING.search(attributes):
+                    self._check_attributes(name, attributes, match.start(7), start, problems, ids)
+            elif name == 'img':
+                problems.append((start, start + 4, 'warning', 'img-alt', "<img> without alt attribute"))
+            if name not in VOID_TAGS and not attributes.endswith('/'):
+                stack.append((name, start, end))
+        self._find_strays(last_end, len(text))
+        for open_name, open_start, open_end in stack:
+            if open_name not in OPTIONAL_END_TAGS:
+                problems.append((open_start, open_end, 'error', 'unclosed-tag',
+                                 f"<{open_name}> is never closed"))
+        self.scanned = len(text) - offset
+
+    def _find_strays(self, start, end):
+        """Remember each ``<name`` between two tokens (a tag the tokenizer could not finish)"""
+        text = self.text
+        position = text.find('<', start, end)
+        while position >= 0:
+            if _NAMED_TAG.match(text, position):
+                self.strays.append(position)
+            position = text.find('<', position + 1, end)
+
+    def _raw_element(self, match, name, stack, problems, ids):
+        """``<script>``, ``<style>``, ``<textarea>`` - their content is not markup"""
+        start = match.start()
+        content_start = match.start(3)
+        if stack:
+            self._check_nesting(name, start, content_start, stack, problems)
+        attributes = match.group(2)
+        if attributes and _INTERESTING.search(attributes):
+            self._check_attributes(name, attributes, match.start(2), start, problems, ids)
+        if not match.group(4):
+            problems.append((start, content_start, 'error', 'unclosed-tag', f"<{name}> is never closed"))
+        elif name == 'style':
+            css_problems(match.group(3), content_start, problems)
+
+    def _open(self, name, start, end, stack, problems):
+        """Rules for a start tag; returns True when it closed a ``<p>`` implicitly"""
+        closed_p = False
+        # Kapanışı isteğe bağlı kardeşleri örtük kapatır
+        implied = _IMPLIED_END.get(name)
+        if implied is not None:
+            while stack and stack[-1][0] in implied:
+                stack.pop()
+        if stack and stack[-1][0] == 'p' and name in _BLOCK:
+            stack.pop()
+            closed_p = True
+        if stack:
+            self._check_nesting(name, start, end, stack, problems)
+        elif name in _REQUIRED_PARENT:
+            parents = '>, <'.join(sorted(_REQUIRED_PARENT[name]))
+            problems.append((start, end, 'error', 'invalid-nesting', f"<{name}> must be inside <{parents}>"))
+        return closed_p
+
+    def _close(self, name, start, end, stack, implied_p, problems):
+        """An end tag that does not close the innermost element"""
+        for depth in range(len(stack) - 1, -1, -1):
+            if stack[depth][0] == name:
+                break
+        else:
+            if name == 'p' and implied_p:
+                problems.append((start, end, 'error', 'invalid-nesting',
+                                 "</p> has no open <p> - a block element inside <p> closed it"))
+            else:
+                problems.append((start, end, 'error', 'stray-end-tag', f"</{name}> has no matching open tag"))
+            return
+        for open_name, open_start, open_end in stack[depth + 1:]:
+            if open_name not in OPTIONAL_END_TAGS:
+                problems.append((open_start, open_end, 'error', 'unclosed-tag',
+                                 f"<{open_name}> is not closed before </{name}>"))
+        del stack[depth:]
+
+    def _check_nesting(self, name, start, end, stack, problems):
+        parent = stack[-1][0]
+        required = _REQUIRED_PARENT.get(name)
+        if required is not None and parent not in required and parent != 'template':
+            problems.append((start, end, 'error', 'invalid-nesting',
+                             f"<{name}> cannot be a child of <{parent}>"))
+        elif name in _BLOCK and parent in _PHRASING_ONLY:
+            problems.append((start, end, 'error', 'invalid-nesting',
+                             f"Block element <{name}> inside inline <{parent}>"))
+        forbidden = _FORBIDDEN_ANCESTORS.get(name)
+        if forbidden is not None:
+            for ancestor, _, _ in stack:
+                if ancestor in forbidden:
+                    problems.append((start, end, 'error', 'invalid-nesting',
+                                     f"<{name}> cannot be inside <{ancestor}>"))
+                    break
+
+    def _check_attributes(self, name, attributes, offset, start, problems, ids):
+        has_alt = False
+        for match in _ATTRIBUTE.finditer(attributes):
+            attribute = match.group(1).lower()
+            value = match.group(2)
+            if attribute == 'alt':
+                has_alt = True
+            elif value is None:
+                continue
+            elif attribute == 'id':
+                quoted = value[0] in '"\''
+                value_start = offset + match.start(2) + quoted
+                value = value[1:-1] if quoted else value
+                if value:
+                    ids.append((value_start, value_start + len(value), value))
+            elif attribute == 'style':
+                quoted = value[0] in '"\''
+                # Başa ';' eklenir ki ilk bildirim de eşleşsin, sona da ';'
+                css_problems(';' + (value[1:-1] if quoted else value) + ';',
+                             offset + match.start(2) + quoted - 1, problems)
+        if name == 'img' and not has_alt:
+            problems.append((start, start + 4, 'warning', 'img-alt', "<img> without alt attribute"))
+
+    def _splice(self, old, position, old_end, delta):
+        """Reuse the old result from checkpoint ``position`` on, shifted by ``delta``"""
+        old_offset, _, problem_count, id_count, _ = old.checkpoints[position]
+        self.strays.extend(stray + delta for stray in old.strays[bisect.bisect_left(old.strays, old_offset):])
+        problem_base = len(self.problems) - problem_count
+        id_base = len(self.ids) - id_count
+        self.checkpoints.extend(
+            (offset + delta, _shift_stack(stack, old_end, delta), problems + problem_base, count + id_base,
+             implied_p)
+            for offset, stack, problems, count, implied_p in old.checkpoints[position:])
+        # Sorunlar değişiklikten önce açılmış öğelere de işaret edebilir
+        self.problems.extend(
+            (start + delta if start >= old_end else start, end + delta if end >= old_end else end,
+             severity, code, message)
+            for start, end, severity, code, message in old.problems[problem_count:])
+        self.ids.extend((start + delta, end + delta, value) for start, end, value in old.ids[id_count:])
+
+    def _finish(self):
+        """Duplicate ids, then every problem as sorted Tk indices"""
+        problems = list(self.problems)
+        seen = {}
+        for start, end, value in self.ids:
+            first = seen.setdefault(value, start)
+            if first != start:
+                problems.append((start, end, 'error', 'duplicate-id', f"id \"{value}\" is already used"))
+        problems.sort(key=lambda problem: problem[0])
+        text = self.text
+        line = 1
+        position = 0
+        marks = []
+        errors = 0
+        for start, end, severity, code, message in problems:
+            line += text.count('\n', position, start)
+            position = start
+            column = start - text.rfind('\n', 0, start) - 1
+            end_lines = text.count('\n', start, end)
+            if end_lines:
+                end_column = end - text.rfind('\n', 0, end) - 1
+                end_index = f"{line + end_lines}.{end_column}"
+            else:
+                end_index = f"{line}.{column + end - start}"
+            marks.append((f"{line}.{column}", end_index, severity, code, message))
+            errors += severity == 'error'
+        self.marks = marks
+        self._starts = [_position(mark[0]) for mark in marks]
+        self.error_count = errors
+        self.warning_count = len(marks) - errors
+
+    def issues(self):
+        """Problems as html_check Issues (1-based columns)"""
+        result = []
+        for start, _, severity, code, message in self.marks:
+            line, column = start.split('.')
+            result.append(Issue(int(line), int(column) + 1, severity, code, message))
+        return result
+
+    def problem_at(self, line, column):
+        """The mark covering ``line.column``, or None"""
+        keys = self._starts
+        position = bisect.bisect_right(keys, (line, column)) - 1
+        while position >= 0:
+            mark = self.marks[position]
+            if _position(mark[1]) > (line, column):
+                return mark
+            if keys[position][0] < line:
+                break
+            position -= 1
+        return None
+
+    def next_mark(self, line, column):
+        """First mark after ``line.column``, wrapping to the first one"""
+        if not self.marks:
+            return None
+        position = bisect.bisect_right(self._starts, (line, column))
+        return self.marks[position % len(self.marks)]
+
+
+def lint_index(text, previous=None):
+    """Lint of ``text`` - an update of ``previous`` when there is one (KeyedWorker job)"""
+    return LintIndex.build(text) if previous is None else previous.update(text)
+
+
+# --- Editör işaretleri --------------------------------------------------------
+
+def show_marks(text, index, on_hover=None):
+    """Underline the problems of ``index`` in a Text (replacing older marks)
+
+    Each tag gets its ranges in a single ``tag add`` call; at most
+    ``MAX_MARKS`` problems are shown. ``on_hover(mark)`` is called when
+    the mouse moves over one.
+    """
+    text.tag_configure(ERROR_TAG, underline=True)
+    text.tag_configure(WARNING_TAG, underline=True)
+    try:
+        text.tag_configure(ERROR_TAG, underlinefg='#ef4444')
+        text.tag_configure(WARNING_TAG, underlinefg='#f59e0b')
+    except Exception:
+        pass  # Tk < 8.6.6 - alt çizgi metin renginde
+    if on_hover is not None and not getattr(text, '_lint_hover', False):
+        def hover(event):
+            line, column = _position(text.index(f"@{event.x},{event.y}"))
+            current = getattr(text, '_lint_index', None)
+            mark = current.problem_at(line, column) if current is not None else None
+            if mark is not None:
+                on_hover(mark)
+
+        for tag in (ERROR_TAG, WARNING_TAG):
+            text.tag_bind(tag, '<Enter>', hover)
+        text._lint_hover = True
+    text._lint_index = index
+    clear_marks(text)
+    ranges = {ERROR_TAG: [], WARNING_TAG: []}
+    for start, end, severity, _, _ in index.marks[:MAX_MARKS]:
+        ranges[ERROR_TAG if severity == 'error' else WARNING_TAG].extend((start, end))
+    for tag, indices in ranges.items():
+        if indices:
+            text.tag_add(tag, *indices)
+
+
+def clear_marks(text):
+    text.tag_remove(ERROR_TAG, '1.0', 'end')
+    text.tag_remove(WARNING_TAG, '1.0', 'end')
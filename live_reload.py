@@ -0,0 +1,143 @@
+"""Canlı önizleme - düzenlemeleri farklarına göre açık önizlemeye iter"""
+import queue
+import re
+import threading
+
+_STYLE_RE = re.compile(r'(<style\b[^>]*>)(.*?)(</style\s*>)', re.IGNORECASE | re.DOTALL)
+_BODY_RE = re.compile(r'(<body\b[^>]*>)(.*)(</body\s*>)', re.IGNORECASE | re.DOTALL)
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+
+
+def split_document(content):
+    """Split a page into (skeleton, styles, body)
+
+    The skeleton is the page with every ``<style>`` block and the body
+    content blanked out; two versions with the same skeleton differ only
+    in CSS and/or body markup. ``styles`` holds the text of every
+    ``<style>`` in document order (in-body ones too); ``body`` is the body
+    exactly as written, so patching it keeps its stylesheets.
+    """
+    styles = []
+
+    def blank_style(match):
+        styles.append(match.group(2))
+        return match.group(1) + match.group(3)
+
+    body_match = _BODY_RE.search(content)
+    if body_match is None:
+        return _STYLE_RE.sub(blank_style, content), styles, None
+    body = body_match.group(2)
+    head = _STYLE_RE.sub(blank_style, content[:body_match.start(2)])
+    styles.extend(match.group(2) for match in _STYLE_RE.finditer(body))
+    tail = _STYLE_RE.sub(blank_style, content[body_match.end(2):])
+    return head + tail, styles, body
+
+
+def _body_markup(body):
+    """Body with its ``<style>`` contents blanked (CSS edits are pushed as styles)"""
+    return _STYLE_RE.sub(lambda match: match.group(1) + match.group(3), body)
+
+
+def diff_documents(old, new):
+    """Describe how to bring a preview of ``old`` up to date with ``new``
+
+    Returns None when nothing changed, otherwise a message for the live
+    client: ``{'type': 'css', 'styles': [...]}`` for stylesheet-only edits,
+    ``{'type': 'body', 'html': ..., 'styles': [...]}`` for body edits that
+    can be patched into the DOM and ``{'type': 'reload'}`` for the rest.
+    """
+    if old == new:
+        return None
+    if old is None:
+        return {'type': 'reload'}
+    old_skeleton, old_styles, old_body = split_document(old)
+    new_skeleton, new_styles, new_body = split_document(new)
+
+    if old_skeleton != new_skeleton or len(old_styles) != len(new_styles):
+        return {'type': 'reload'}
+    if old_body == new_body or (old_body is not None and new_body is not None
+                                and _body_markup(old_body) == _body_markup(new_body)):
+        return {'type': 'css', 'styles': new_styles}
+    if new_body is None or _SCRIPT_RE.findall(old_body) != _SCRIPT_RE.findall(new_body):
+        # Scriptler innerHTML ile çalışmaz - sayfayı yenile
+        return {'type': 'reload'}
+
+    message = {'type': 'body', 'html': new_body}
+    if old_styles != new_styles:
+        message['styles'] = new_styles
+    return message
+
+
+class LivePusher:
+    """Background worker that diffs and pushes buffers to the preview server
+
+    ``submit`` never blocks the caller: the latest content per tab is
+    queued, older pending versions are dropped, and diffing happens on the
+    worker thread.
+    """
+
+    def __init__(self, server, on_pushed=None):
+        self.server = server
+        self.on_pushed = on_pushed  # called from the worker thread
+        self._last_sent = {}  # preview_id -> content
+        self._pending = {}  # preview_id -> (content, title, submitted_at)
+        self._lock = threading.Lock()
+        self._wakeup = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="live-pusher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._wakeup.put(None)
+            self._thread = None
+
+    def reset(self, preview_id, content):
+        """Record what a freshly opened preview is showing"""
+        with self._lock:
+            self._last_sent[str(preview_id)] = content
+
+    def forget(self, preview_id):
+        with self._lock:
+            self._last_sent.pop(str(preview_id), None)
+            self._pending.pop(str(preview_id), None)
+
+    def submit(self, preview_id, content, title=None, submitted_at=None):
+        """Queue the latest buffer of a tab for pushing"""
+        self.start()
+        with self._lock:
+            self._pending[str(preview_id)] = (content, title, submitted_at)
+        self._wakeup.put(str(preview_id))
+
+    def _run(self):
+        while True:
+            preview_id = self._wakeup.get()
+            if preview_id is None:
+                break
+            with self._lock:
+                pending = self._pending.pop(preview_id, None)
+                previous = self._last_sent.get(preview_id)
+            if pending is None:
+                continue  # Daha yeni bir sürüm zaten itildi
+            content, title, submitted_at = pending
+            try:
+                self.push_now(preview_id, content, title, previous)
+            except Exception as e:
+                print(f"Live preview error: {e}")
+                continue
+            if self.on_pushed is not None:
+                self.on_pushed(preview_id, submitted_at)
+
+    def push_now(self, preview_id, content, title=None, previous=None):
+        """Diff against ``previous`` and push synchronously"""
+        message = diff_documents(previous, content)
+        # Tam yenileme de güncel içeriği alsın
+        self.server.publish(preview_id, content, title)
+        with self._lock:
+            self._last_sent[str(preview_id)] = content
+        if message is not None:
+            self.server.push(preview_id, message)
+        return message
@@ -0,0 +1,122 @@
+"""Uzun satır modu - minify edilmiş satırları kısaltarak gösterir, okunabilir görünüm üretir"""
+import re
+import tkinter as tk
+from tkinter import scrolledtext
+
+from html_check import VOID_TAGS
+
+# Bu uzunluktan uzun satırlar kaydırmasız (wrap=none) moda geçirir
+LONG_LINE_LIMIT = 5000
+# Kısaltılmış satırın görünen kısmı (karakter)
+VISIBLE_PREFIX = 2000
+
+TAIL_TAG = 'long_tail'
+MARKER_TAG = 'long_marker'
+
+_TOKEN = re.compile(
+    r'<!--.*?-->|<(script|style|pre|textarea)\b[^>]*>.*?</\1\s*>|<![^>]*>|</?[A-Za-z][^>]*>',
+    re.IGNORECASE | re.DOTALL)
+_TAG_NAME = re.compile(r'</?([A-Za-z][^\s/>]*)')
+# Kapanışı isteğe bağlı öğeler - aynı öğe yeniden açılınca öncekini kapatır
+_SELF_CLOSING_SIBLINGS = frozenset(('li', 'p', 'option', 'tr', 'td', 'th', 'dt', 'dd'))
+# Açık bir <p> öğesini kapatan blok öğeler
+_CLOSES_P = frozenset(('address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset', 'footer',
+                       'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'main', 'nav',
+                       'ol', 'p', 'pre', 'section', 'table', 'ul'))
+
+
+def find_long_lines(text, limit=LONG_LINE_LIMIT):
+    """``[(line, length)]`` of the lines longer than ``limit`` characters"""
+    found = []
+    line = 1
+    position = 0
+    for match in re.finditer(r'[^\n]{%d,}' % (limit + 1), text):
+        line += text.count('\n', position, match.start())
+        position = match.start()
+        found.append((line, match.end() - match.start()))
+    return found
+
+
+def truncate_long_lines(text, long_lines, visible=VISIBLE_PREFIX):
+    """Elide everything after ``visible`` characters of each long line
+
+    Tk skips elided text when it lays out a line, so a megabyte line costs
+    no more to display than its prefix. The last visible character is
+    marked; clicking it shows the whole line (``expand_line``). The buffer
+    is unchanged - ``get()`` and saving still see every character.
+    """
+    text.tag_configure(TAIL_TAG, elide=True)
+    text.tag_configure(MARKER_TAG, background='#7c3aed', foreground='#ffffff')
+    text.tag_bind(MARKER_TAG, '<Button-1>',
+                  lambda e: expand_line(text, int(text.index(f"@{e.x},{e.y}").split('.')[0])))
+    text.tag_bind(MARKER_TAG, '<Enter>', lambda e: text.config(cursor='hand2'))
+    text.tag_bind(MARKER_TAG, '<Leave>', lambda e: text.config(cursor='xterm'))
+    for line, _ in long_lines:
+        text.tag_add(MARKER_TAG, f"{line}.{visible - 1}", f"{line}.{visible}")
+        text.tag_add(TAIL_TAG, f"{line}.{visible}", f"{line}.0 lineend")
+
+
+def is_truncated(text, index):
+    return TAIL_TAG in text.tag_names(index)
+
+
+def expand_line(text, line):
+    """Show the hidden part of a truncated line"""
+    text.tag_remove(TAIL_TAG, f"{line}.0", f"{line}.0 lineend")
+    text.tag_remove(MARKER_TAG, f"{line}.0", f"{line}.0 lineend")
+    highlighter = getattr(text, '_highlighter', None)
+    if highlighter is not None:
+        highlighter.retag(line)  # Artık görünen kuyruk renklendirilsin
+    return 'break'
+
+
+def pretty_print_html(html, indent='  '):
+    """One tag or text run per line, indented by nesting depth
+
+    Meant for reading minified pages: whitespace in text is collapsed,
+    comments and script/style/pre/textarea blocks are kept verbatim.
+    """
+    out = []
+    stack = []
+    position = 0
+
+    def add_text(segment):
+        segment = ' '.join(segment.split())
+        if segment:
+            out.append(indent * len(stack) + segment)
+
+    for match in _TOKEN.finditer(html):
+        add_text(html[position:match.start()])
+        position = match.end()
+        token = match.group()
+        if match.group(1) or token.startswith('<!'):
+            out.append(indent * len(stack) + token)  # Ham blok / yorum / doctype
+            continue
+        name = _TAG_NAME.match(token).group(1).lower()
+        if token.startswith('</'):
+            if name in stack:
+                # Kapanmamış iç öğeleri de kapat
+                del stack[len(stack) - 1 - stack[::-1].index(name):]
+            out.append(indent * len(stack) + token)
+            continue
+        if name in _SELF_CLOSING_SIBLINGS and name in stack[-2:]:
+            del stack[len(stack) - 1 - stack[::-1].index(name):]  # <tr> ... <td> ... <tr>
+        elif name in _CLOSES_P and stack and stack[-1] == 'p':
+            stack.pop()
+        out.append(indent * len(stack) + token)
+        if name not in VOID_TAGS and not token.endswith('/>'):
+            stack.append(name)
+    add_text(html[position:])
+    return '\n'.join(out) + '\n'
+
+
+class PrettyView(scrolledtext.ScrolledText):
+    """Read-only formatted copy of a buffer, placed over its editor"""
+
+    def __init__(self, parent, content, **options):
+        super().__init__(parent, wrap=tk.NONE, **options)
+        self.insert('1.0', content)
+        long_lines = find_long_lines(content)
+        if long_lines:
+            truncate_long_lines(self, long_lines)  # Ham script/style blokları
+        self.configure(state=tk.DISABLED)
@@ -1,26 +1,39 @@
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-import os
-from pathlib import Path
-import tempfile
-import threading
-import webbrowser
 import time
-import subprocess
-import platform
+STARTUP_STARTED = time.perf_counter()  # --profile-startup için
+
 import sys
 
-# WebView import'unu try-except ile yapalım
-try:
-    import webview
-    WEBVIEW_AVAILABLE = True
-except ImportError:
-    WEBVIEW_AVAILABLE = False
-    print("Uyarı: pywebview kütüphanesi bulunamadı. Tarayıcıda açma modu kullanılacak.")
+if __name__ == '__main__' and '--batch' in sys.argv[1:]:
+    # Başsız mod tkinter olmadan da çalışsın (python3-tk kurulu olmayan CI); batch.py ana
+    # modül olur ki spawn işçileri de main.py'yi (ve Tk'yı) içe aktarmasın
+    import runpy
+    runpy.run_module('batch', run_name='__main__', alter_sys=True)
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import os
+import itertools
+
+# WebView ayrı süreçte yüklenir - burada sadece varlığını kontrol et
+import importlib.util
+WEBVIEW_AVAILABLE = importlib.util.find_spec('webview') is not None
+
+# Önizleme (http.server, multiprocessing), çalışma alanı, arama ve dışa aktarma
+# modülleri ilk kullanımda içe aktarılır - ilk pencere onları beklemesin
+from large_file import LARGE_FILE_THRESHOLD
+from file_io import FileIOPool
+from change_journal import ChangeJournal, content_hash
+from editor_proxy import TextChangeProxy, end_index
+from autosave import AutosaveJournal, replay_changes
+from tab_model import Tab, ClosedTab, TabRegistry
+from editor_pool import EditorPool
+from startup_profile import StartupProfile
+from perf import recorder
 
 class WebViewer:
-    def __init__(self, root):
+    def __init__(self, root, profile=None):
         self.root = root
+        self.profile = profile  # --profile-startup ile StartupProfile
         self.root.title("🚀 Web Görüntüleyici - Modern HTML/CSS/JS Editörü")
         
         # Tam ekran yap ve boyutlandırmayı sabit tut
@@ -127,30 +140,90 @@ class WebViewer:
         except Exception as e:
             print(f"Stil ayarlama hatası: {e}")
             pass
+        self.mark_startup('styles')
         
         self.current_file = None
         self.temp_file = None
         self.browser_process = None
-        self.open_files = {}  # Açık dosyaları takip et
+        self.tabs = TabRegistry()  # Açık sekmeler (widget yolu -> Tab)
+        self.file_io = FileIOPool(self.root)  # Arka plan okuma/yazma
+        self.autosave = None  # Çökme kurtarma günlüğü (ilk kareden sonra açılır)
+        self.session_saved = False  # Kapanışta oturum yazıldıysa kurtarma verisi silinebilir
+        self.tab_ids = itertools.count(1)
+        self.preview_server = None  # İlk önizlemede başlatılır
+        self.previews = {}  # tab_id -> PreviewProcess (sekme başına bir pencere)
+        self.exiting_renderers = 0  # Kapatılmış, henüz çıkmamış renderer süreçleri
+        self.preview_poll_job = None
+        self.live_preview = False  # Canlı önizleme modu
+        self.live_pusher = None
+        self.live_delay = 250  # ms - yazarken bekleme süresi
+        self.live_jobs = {}  # tab_id -> bekleyen after id
+        self.workspace = None  # Açık klasörün arka plan dizinleyicisi
+        self.workspace_generation = 0
+        self.find_panel = None  # Dosyalarda bul paneli (ilk kullanımda)
+        self.search_versions = {}  # tab_id -> aramadaki sürüm
+        self.search_loaded = {}  # tab_id -> arama iş parçacığının okuduğu oturum sekmesi metni
+        self.export_run = None  # Süren optimize dışa aktarma
+        self.perf_hud = None  # Durum çubuğundaki performans göstergesi (F12)
+        self.preview_requested = {}  # tab_id -> önizleme isteği zamanı (perf_counter)
+        self.outline_panel = None  # Ana hat + mini harita (Ctrl+Shift+O)
+        self.outline_worker = None  # Arka plan ayrıştırıcı (ilk kullanımda)
+        self.outlines = {}  # tab_id -> (sürüm, OutlineIndex)
+        self.outline_actions = {}  # tab_id -> güncel ana hatla çağrılacak işlev
+        self.outline_job = None
+        self.split_preview = None  # Editörün yanındaki önizleme (Ctrl+\)
+        self.responsive = None  # Duyarlı matris penceresi (Ctrl+Shift+R)
+        self.responsive_viewports = None  # Son kullanılan görünüm alanı boyutları
+        self.lint_worker = None  # Arka plan lint (ilk editör sekmesinde başlar)
+        self.lints = {}  # tab_id -> (sürüm, LintIndex)
+        self.lint_jobs = {}  # tab_id -> bekleyen after id
+        self.lint_delay = 150  # ms - yazarken bekleme süresi
+        self.restoring = {}  # tab_id -> diskten okunan oturum sekmesinin yer tutucusu
         self.setup_ui()
         
     def setup_ui(self):
-        # Main toolbar (always visible)
-        self.setup_main_toolbar()
+        """Stage 1: only what the first frame shows"""
+        # Main toolbar (always visible) - düğmeler ilk kareden sonra eklenir
+        self.main_toolbar = tk.Frame(self.root, bg='#1a1a1a', height=80)
+        self.main_toolbar.pack(fill=tk.X, padx=0, pady=0)
+        self.main_toolbar.pack_propagate(False)
         
         # Main notebook (tab container) - modern design
-        notebook_frame = tk.Frame(self.root, bg='#0a0a0a')
-        notebook_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(10, 15))
-        
-        self.notebook = ttk.Notebook(notebook_frame, style='Modern.TNotebook')
-        self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook_frame = tk.Frame(self.root, bg='#0a0a0a')
+        self.notebook_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(10, 15))
+        
+        # Editör | önizleme bölmesi - önizleme tarafı ilk açılışta eklenir
+        self.split_pane = ttk.PanedWindow(self.notebook_frame, orient=tk.HORIZONTAL)
+        self.split_pane.pack(fill=tk.BOTH, expand=True)
+        
+        self.notebook = ttk.Notebook(self.split_pane, style='Modern.TNotebook')
+        self.split_pane.add(self.notebook, weight=1)
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        
+        # Sekmeler arasında paylaşılan editör widget'ları
+        self.editor_pool = EditorPool(
+            self.notebook,
+            self.on_editor_modified,
+            self.on_editor_key,
+            self.undo_redo,
+            wrap=tk.WORD,
+            font=('Cascadia Code', 12),
+            bg='#2a2a2a',
+            fg='#ffffff',
+            insertbackground='#60a5fa',
+            selectbackground='#1e40af',
+            relief='flat',
+            borderwidth=0,
+            padx=15,
+            pady=15
+        )
         
         # Modern durum çubuğu
-        status_frame = tk.Frame(self.root, bg='#1a1a1a', height=30)
-        status_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        status_frame.pack_propagate(False)
+        self.status_frame = tk.Frame(self.root, bg='#1a1a1a', height=30)
+        self.status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_frame.pack_propagate(False)
         
-        self.status_bar = tk.Label(status_frame, 
+        self.status_bar = tk.Label(self.status_frame, 
                                   text="🚀 Web Viewer Ready", 
                                   font=('Segoe UI', 10),
                                   bg='#1a1a1a',
@@ -159,13 +232,64 @@ class WebViewer:
         
         # Varsayılan dosya var mı kontrol et
         self.check_default_file()
+        self.mark_startup('first tab')
+        
+        # Gerisi pencere ilk kez çizildikten sonra
+        self.first_map_binding = self.root.bind('<Map>', self.on_first_map, add='+')
+        
+    def on_first_map(self, event):
+        """The window is on screen - build the rest when idle"""
+        if event.widget is not self.root:
+            return
+        self.root.unbind('<Map>', self.first_map_binding)
+        self.mark_startup('first frame')
+        self.root.after_idle(self.setup_deferred_ui)
+        
+    def setup_deferred_ui(self):
+        """Stage 2: toolbar buttons, shortcuts and crash recovery"""
+        self.setup_main_toolbar()
+        
+        # Sekme kısayolları: taşıma ve kapatılanı geri açma
+        self.root.bind('<Control-Shift-Prior>', lambda e: self.move_current_tab(-1))
+        self.root.bind('<Control-Shift-Next>', lambda e: self.move_current_tab(1))
+        self.root.bind('<Control-Shift-T>', lambda e: self.restore_closed_tab())
+        self.root.bind('<Control-Shift-t>', lambda e: self.restore_closed_tab())
+        self.root.bind('<Control-p>', lambda e: self.show_go_to_file())
+        self.root.bind('<Control-Shift-F>', lambda e: self.show_find_panel())
+        self.root.bind('<Control-Shift-f>', lambda e: self.show_find_panel())
+        self.root.bind('<F12>', lambda e: self.toggle_perf_hud())
+        self.root.bind('<Shift-F12>', lambda e: self.export_perf_trace())
+        # Ana hat ve katlama
+        self.root.bind('<Control-Shift-O>', lambda e: self.toggle_outline_panel())
+        self.root.bind('<Control-Shift-o>', lambda e: self.toggle_outline_panel())
+        self.root.bind('<Control-braceleft>', lambda e: self.fold_at_cursor())
+        self.root.bind('<Control-braceright>', lambda e: self.unfold_at_cursor())
+        self.root.bind('<Control-backslash>', lambda e: self.toggle_split_preview())
+        self.root.bind('<Control-Shift-R>', lambda e: self.show_responsive_matrix())
+        self.root.bind('<Control-Shift-r>', lambda e: self.show_responsive_matrix())
+        self.root.bind('<F8>', lambda e: self.next_lint_problem())
+        self.root.protocol('WM_DELETE_WINDOW', self.on_app_close)
+
+        try:
+            self.autosave = AutosaveJournal()  # Çökme kurtarma günlüğü
+        except OSError as e:
+            print(f"Autosave disabled: {e}")
+            self.autosave = None
+        if self.autosave is not None:
+            self.offer_autosave_recovery()
+            self.root.after(self.autosave.flush_interval, self.autosave_tick)
+        self.mark_startup('deferred UI')
+        if self.profile is not None:
+            self.profile.report()
+        
+    def mark_startup(self, label):
+        if self.profile is not None:
+            self.profile.mark(label)
         
     def setup_main_toolbar(self):
         """Modern main toolbar"""
-        # Main toolbar frame (gradient background)
-        main_toolbar = tk.Frame(self.root, bg='#1a1a1a', height=80)
-        main_toolbar.pack(fill=tk.X, padx=0, pady=0)
-        main_toolbar.pack_propagate(False)
+        # Main toolbar frame (gradient background) - setup_ui'de boş olarak çizildi
+        main_toolbar = self.main_toolbar
         
         # Inner frame
         inner_frame = tk.Frame(main_toolbar, bg='#1a1a1a')
@@ -198,10 +322,24 @@ class WebViewer:
                                 self.create_new_file, '#1e40af')
         self.create_modern_button(buttons_frame, "📁 Open File", 
                                 self.open_file, '#3b82f6')
+        self.create_modern_button(buttons_frame, "📂 Open Folder", 
+                                self.open_workspace, '#3b82f6')
+        self.create_modern_button(buttons_frame, "🔍 Find", 
+                                self.show_find_panel, '#3b82f6')
         self.create_modern_button(buttons_frame, "🔄 Preview", 
                                 self.show_preview, '#60a5fa')
+        self.live_button = self.create_modern_button(buttons_frame, "⚡ Live: Off", 
+                                self.toggle_live_preview, '#333333')
+        self.create_modern_button(buttons_frame, "◫ Split", 
+                                self.toggle_split_preview, '#60a5fa')
+        self.create_modern_button(buttons_frame, "📱 Responsive", 
+                                self.show_responsive_matrix, '#60a5fa')
         self.create_modern_button(buttons_frame, "💾 Save", 
                                 self.save_file, '#4f46e5')
+        self.create_modern_button(buttons_frame, "💾 Save All", 
+                                self.save_all_files, '#4f46e5')
+        self.create_modern_button(buttons_frame, "📦 Export", 
+                                self.export_optimized, '#4f46e5')
         
     def create_modern_button(self, parent, text, command, color):
         """Create modern button"""
@@ -230,11 +368,136 @@ class WebViewer:
             button['bg'] = color
         button.bind('<Enter>', on_enter)
         button.bind('<Leave>', on_leave)
+        return button
         
     def check_default_file(self):
-        """Create empty file on first startup"""
-        # Always start with an empty file
-        self.create_empty_editor_tab()
+        """Reopen the last session, or create an empty file on first startup"""
+        # Kurtarma setup_deferred_ui'de
+        if not self.restore_session():
+            self.create_empty_editor_tab()
+            
+    def restore_session(self, folder=None):
+        """Rebuild the tab strip of the last session; buffers are read when first needed"""
+        from session import load_session
+        
+        session = load_session(folder)
+        if session is None or not session[0]:
+            return False
+        entries, selected = session
+        with recorder.span('session.restore', 'startup', tabs=len(entries)):
+            frames = []
+            for entry in entries:
+                if entry.large:
+                    try:
+                        frames.append(self.add_large_file_tab(entry.path))
+                    except (OSError, ValueError) as e:
+                        print(f"Session tab not restored: {entry.path}: {e}")
+                    continue
+                frame = self.add_file_tab(entry.path, None, entry.title, select=False)
+                tab = self.tabs.get(frame)
+                tab.restore = tab.view = entry
+                if entry.dirty:
+                    tab.journal.saved_version = -1
+                    tab.journal.saved_hash = entry.saved_hash
+                    self.update_tab_title(tab)
+                frames.append(frame)
+            if not frames:
+                return False
+            frame = frames[min(max(selected, 0), len(frames) - 1)]
+            self.notebook.select(frame)
+            self.materialize_tab(self.tabs.get(frame))
+        self.status_bar.config(text=f"♻️ {len(frames)} tab(s) restored from the last session")
+        return True
+        
+    def save_session(self, folder=None):
+        """Keep the open tabs, their positions and unsaved buffers for the next start"""
+        from session import SessionTab, save_session
+        
+        tabs = []
+        unread = []
+        for tab in self.tabs:
+            if tab.large_file is not None:
+                tabs.append((SessionTab(tab.path, tab.title, large=True), None))
+                continue
+            if not tab.has_editor:
+                continue
+            entry = SessionTab(tab.path, tab.title, dirty=tab.dirty,
+                               saved_hash=tab.journal.saved_hash if tab.dirty else None)
+            if tab.materialized:
+                editor = tab.editor
+                entry.cursor = editor.index(tk.INSERT)
+                entry.top = editor.index('@0,0')
+                selection = editor.tag_ranges('sel')
+                if selection:
+                    entry.selection = (str(selection[0]), str(selection[1]))
+            elif tab.view is not None:
+                # Hiç gösterilmemiş oturum sekmesi - konumu aynen kalır
+                entry.cursor, entry.top, entry.selection = tab.view.cursor, tab.view.top, tab.view.selection
+            buffer = None
+            if tab.dirty or not tab.path:
+                if tab.restore is not None and tab.restore.span is not None:
+                    try:
+                        buffer = tab.restore.raw()  # Açmadan, sıkıştırılmış haliyle taşı
+                    except OSError:
+                        buffer = tab.get_text()
+                else:
+                    buffer = tab.get_text()
+            tabs.append((entry, buffer))
+            if tab.restore is not None and buffer is not None:
+                unread.append((tab, entry))
+        try:
+            selected = self.notebook.index('current') if self.notebook.tabs() else 0
+        except tk.TclError:
+            selected = 0
+        with recorder.span('session.save', 'io', tabs=len(tabs)):
+            save_session(tabs, selected, folder)
+        for tab, entry in unread:
+            # Eski anlık görüntü silindi - okunmamış sekmeler yenisinden okunur
+            tab.restore = entry
+            
+            
+    def offer_autosave_recovery(self):
+        """Restore unsaved tabs left behind by a crashed session"""
+        entries = self.autosave.find_recoverable()
+        if not entries:
+            return
+        titles = "\n".join(f"• {entry[2].get('title') or 'Untitled'}" for entry in entries[:10])
+        if messagebox.askyesno("♻️ Recover unsaved work",
+                               f"{len(entries)} unsaved tab(s) were found from a previous session:\n\n"
+                               f"{titles}\n\nRestore them?"):
+            # Kayıtları gizli bir Text üzerinde yeniden oynat (Tk indeksleriyle birebir)
+            scratch = tk.Text(self.root)
+            for _, _, snapshot, changes in entries:
+                try:
+                    text = replay_changes(scratch, snapshot, changes)
+                except tk.TclError as e:
+                    print(f"Autosave replay error: {e}")
+                    text = snapshot.get('text', '')
+                frame = self.add_file_tab(snapshot.get('path'), text,
+                                          f"♻️ {snapshot.get('title') or 'Recovered'}",
+                                          select=False)
+                # Diskteki sürümle aynı değil - kaydedilmemiş say
+                tab = self.tabs.get(frame)
+                tab.journal.saved_version = -1
+                tab.journal.saved_hash = None
+                self.update_tab_title(tab)
+            scratch.destroy()
+            self.status_bar.config(text=f"♻️ {len(entries)} unsaved tab(s) restored")
+        self.autosave.clear_recoverable(entries)
+        
+    def autosave_tick(self):
+        """Flush edits of modified tabs to the recovery journal (batched)"""
+        for tab in self.tabs:
+            journal = tab.journal
+            if journal is None or tab.restore is not None:
+                continue  # Okunmamış oturum sekmesi - içeriği zaten oturum kaydında
+            key = tab.tab_id
+            if journal.dirty:
+                self.autosave.collect(key, journal, {'path': tab.path, 'title': tab.title},
+                                      tab.get_text)
+            elif self.autosave.is_tracked(key):
+                self.autosave.discard(key)
+        self.root.after(self.autosave.flush_interval, self.autosave_tick)
         
     def create_empty_editor_tab(self):
         """Create empty editor tab"""
@@ -314,33 +577,43 @@ class WebViewer:
         
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    
+                # Büyük dosyalar kendi (salt okunur) sekmelerinde açılır
+                if os.path.getsize(file_path) >= LARGE_FILE_THRESHOLD:
+                    self.add_large_file_tab(file_path)
+                    return
+            except OSError as e:
+                messagebox.showerror("❌ Error", f"Error loading file: {str(e)}")
+                return
+                
+            def loaded(path, content):
                 # Dosya bilgilerini güncelle
-                file_info = self.open_files.get(frame)
-                if file_info and 'editor' in file_info:
+                tab = self.tabs.get(frame)
+                if tab and tab.has_editor:
                     # Editör içeriğini güncelle
-                    file_info['editor'].delete(1.0, tk.END)
-                    file_info['editor'].insert(1.0, content)
+                    if tab.materialized:
+                        tab.editor.delete(1.0, tk.END)
+                        tab.editor.insert(1.0, content)
+                        tab.editor.edit_modified(False)
+                    else:
+                        tab.pending_text = content
+                    tab.journal.reset(content)
                     
                     # Dosya bilgilerini güncelle
-                    file_info['path'] = file_path
-                    file_info['title'] = os.path.basename(file_path)
+                    tab.path = path
+                    tab.title = os.path.basename(path)
                     
                     # Sekme başlığını güncelle
-                    tab_index = self.notebook.index(frame)
-                    self.notebook.tab(tab_index, text=file_info['title'])
+                    self.update_tab_title(tab)
                     
-                    self.status_bar.config(text=f"✅ File loaded: {file_path}")
+                    self.status_bar.config(text=f"✅ File loaded: {path}")
                     
-            except Exception as e:
-                messagebox.showerror("❌ Error", f"Error loading file: {str(e)}")
+            self.status_bar.config(text=f"⏳ Loading {os.path.basename(file_path)}...")
+            self.file_io.read(file_path, loaded, self.on_file_read_error)
         
     def create_new_file_from_welcome(self):
         """Create new file from welcome screen"""
         # Create new file tab
-        self.add_file_tab(None, "", f"New File {len(self.open_files) + 1}")
+        self.add_file_tab(None, "", f"New File {len(self.tabs) + 1}")
         self.status_bar.config(text="📄 New file created")
         
         # Close welcome tab
@@ -352,7 +625,7 @@ class WebViewer:
         self.open_file()
         
         # Close welcome tab if file opened
-        if len(self.open_files) > 0 and hasattr(self, 'welcome_frame'):
+        if len(self.tabs) > 0 and hasattr(self, 'welcome_frame'):
             self.notebook.forget(self.welcome_frame)
         
     def create_example_file(self):
@@ -495,33 +768,91 @@ class WebViewer:
         # Create main editor tab
         self.add_file_tab(None, default_html, "📝 Main Editor")
         
-    def add_file_tab(self, file_path, content, custom_title=None):
-        """Add new file tab"""
+    @recorder.timed()
+    def add_file_tab(self, file_path, content, custom_title=None, index=None, select=True):
+        """Add new file tab (at ``index`` in the tab strip, default last)
+        
+        Background tabs (``select=False``) only keep their text until they
+        are first shown.
+        """
         # Tab title
         if custom_title:
             tab_title = custom_title
         else:
-            tab_title = os.path.basename(file_path) if file_path else f"New File {len(self.open_files) + 1}"
+            tab_title = os.path.basename(file_path) if file_path else f"New File {len(self.tabs) + 1}"
         
         # Create new frame
         file_frame = ttk.Frame(self.notebook)
-        self.notebook.add(file_frame, text=tab_title)
+        self.insert_notebook_tab(file_frame, tab_title, index)
         
         # Store file info
-        self.open_files[file_frame] = {
-            'path': file_path,
-            'title': tab_title,
-            'content': content
-        }
+        tab = self.tabs.add(Tab(file_frame, next(self.tab_ids), file_path, tab_title), index)
+        recorder.count('open tabs')
+        tab.pending_text = content
+        tab.journal = ChangeJournal(content)
         
-        # Create tab content
-        self.setup_file_tab(file_frame, content)
+        if select:
+            # Make tab active (editor is created here)
+            self.notebook.select(file_frame)
+            self.materialize_tab(tab)
         
-        # Make tab active
-        self.notebook.select(file_frame)
+        return file_frame
+        
+    def add_large_file_tab(self, file_path, index=None):
+        """Open a huge file in read-only, memory-mapped large file mode"""
+        from large_file import LargeFileDocument, LargeFileView
+        
+        tab_title = f"📚 {os.path.basename(file_path)}"
+        document = LargeFileDocument(file_path)
+        
+        file_frame = ttk.Frame(self.notebook)
+        self.insert_notebook_tab(file_frame, tab_title, index)
+        tab = self.tabs.add(Tab(file_frame, next(self.tab_ids), file_path, tab_title), index)
+        recorder.count('open tabs')
+        tab.large_file = document
+        
+        # Modern top toolbar
+        toolbar_frame = tk.Frame(file_frame, bg='#1a1a1a', height=50)
+        toolbar_frame.pack(fill=tk.X, pady=(0, 5))
+        toolbar_frame.pack_propagate(False)
+        inner_toolbar = tk.Frame(toolbar_frame, bg='#1a1a1a')
+        inner_toolbar.pack(fill=tk.BOTH, padx=15, pady=10)
+        self.create_modern_button(inner_toolbar, "❌ Close", 
+                                lambda: self.close_file_tab(file_frame), '#ef4444')
+        self.create_modern_button(inner_toolbar, "🔍 Find", 
+                                lambda: viewer.prompt_search(), '#3b82f6')
+        self.create_modern_button(inner_toolbar, "↪ Go to Line", 
+                                lambda: viewer.prompt_goto(), '#3b82f6')
+        size_mb = document.size / (1024 * 1024)
+        file_label = tk.Label(inner_toolbar, 
+                             text=f"📄 {file_path} ({size_mb:.1f} MB, read-only)", 
+                             font=('Segoe UI', 10, 'bold'),
+                             bg='#1a1a1a',
+                             fg='#ffffff')
+        file_label.pack(side=tk.RIGHT, padx=(0, 10))
         
+        viewer = LargeFileView(
+            file_frame,
+            document,
+            on_status=lambda text: self.status_bar.config(text=text),
+            font=('Cascadia Code', 12),
+            bg='#2a2a2a',
+            fg='#ffffff',
+            insertbackground='#60a5fa',
+            selectbackground='#1e40af',
+            relief='flat',
+            borderwidth=0,
+            padx=15,
+            pady=15
+        )
+        viewer.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        tab.viewer = viewer
+        
+        self.notebook.select(file_frame)
+        self.status_bar.config(text=f"📚 Large file opened: {file_path}")
         return file_frame
         
+    @recorder.timed()
     def setup_file_tab(self, frame, content):
         """Create modern file tab content"""
         # Modern top toolbar
@@ -537,92 +868,482 @@ class WebViewer:
         self.create_modern_button(inner_toolbar, "❌ Close", 
                                 lambda: self.close_file_tab(frame), '#ef4444')
         
+        # Minify edilmiş sayfalar: çok uzun satırlar kaydırmasız ve kısaltılmış gösterilir
+        from long_lines import find_long_lines, truncate_long_lines
+        tab = self.tabs.get(frame)
+        tab.long_lines = find_long_lines(content or '')
+        if tab.long_lines:
+            self.create_modern_button(inner_toolbar, "🪄 Pretty",
+                                      lambda: self.toggle_pretty_view(tab), '#7c3aed')
+        
         # File path label
-        file_info = self.open_files[frame]
         file_label = tk.Label(inner_toolbar, 
-                             text=f"📄 {file_info['title']}", 
+                             text=f"📄 {tab.title}", 
                              font=('Segoe UI', 10, 'bold'),
                              bg='#1a1a1a',
                              fg='#ffffff')
         file_label.pack(side=tk.RIGHT, padx=(0, 10))
         
-        # Modern code editor
-        editor_frame = tk.Frame(frame, bg='#2a2a2a')
-        editor_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # Modern code editor (havuzdan - varsa yeniden kullanılır)
+        pooled = self.editor_pool.acquire(frame, content, tk.NONE if tab.long_lines else None)
         
-        code_editor = scrolledtext.ScrolledText(
-            editor_frame,
-            wrap=tk.WORD,
-            font=('Cascadia Code', 12),
-            bg='#2a2a2a',
-            fg='#ffffff',
-            insertbackground='#60a5fa',
-            selectbackground='#1e40af',
-            relief='flat',
-            borderwidth=0,
-            padx=15,
-            pady=15
-        )
-        code_editor.pack(fill=tk.BOTH, expand=True)
+        # Store editor reference
+        tab.pooled_editor = pooled
+        tab.editor = pooled.text
+        # Değişiklik günlüğü: sürüm sayacı + düzenleme kayıtları
+        TextChangeProxy.install(tab.editor).add_listener(tab.journal.record)
+        self.attach_history(tab)
+        if tab.long_lines:
+            truncate_long_lines(tab.editor, tab.long_lines)
+            longest = max(length for _, length in tab.long_lines)
+            self.status_bar.config(
+                text=f"↔️ {len(tab.long_lines):,} long line(s) (up to {longest:,} characters) shown "
+                     f"truncated - click the marker to expand, 🪄 Pretty for a formatted view")
+        self.schedule_lint(tab)
+        
+    def toggle_pretty_view(self, tab):
+        """Formatted, read-only view of a minified buffer (the buffer itself is kept)"""
+        if not tab.materialized:
+            return
+        if tab.pretty_view is not None:
+            tab.pretty_view.frame.destroy()
+            tab.pretty_view = None
+            tab.editor.focus_set()
+            self.status_bar.config(text=f"📝 Editing {tab.title}")
+            return
+        import queue
+        import threading
+        from long_lines import pretty_print_html
+        
+        results = queue.Queue()
+        text = tab.get_text()
+        
+        def work():
+            try:
+                results.put(pretty_print_html(text))
+            except Exception as e:
+                results.put(e)
         
-        # Load content
-        code_editor.delete(1.0, tk.END)
-        code_editor.insert(1.0, content)
+        def poll():
+            try:
+                pretty = results.get_nowait()
+            except queue.Empty:
+                self.root.after(30, poll)
+                return
+            if not tab.materialized or tab.pretty_view is not None:
+                return  # Sekme kapandı / görünüm zaten açık
+            if isinstance(pretty, Exception):
+                self.status_bar.config(text=f"❌ Could not format: {pretty}")
+                return
+            self.show_pretty_view(tab, pretty)
+        
+        self.status_bar.config(text=f"⏳ Formatting {tab.title}...")
+        threading.Thread(target=work, name='pretty-print', daemon=True).start()
+        poll()
+        
+    def show_pretty_view(self, tab, pretty):
+        from long_lines import PrettyView
+        
+        view = PrettyView(self.notebook, pretty,
+                          font=('Cascadia Code', 12),
+                          bg='#1f2937',
+                          fg='#e5e7eb',
+                          selectbackground='#1e40af',
+                          relief='flat',
+                          borderwidth=0,
+                          padx=15,
+                          pady=15)
+        # Editörün üstüne yerleşir; sekme gizlenince onunla birlikte gizlenir
+        container = tab.pooled_editor.container
+        view.place(in_=container, relx=0, rely=0, relwidth=1, relheight=1)
+        view.frame.lift(container)
+        view.focus_set()
+        tab.pretty_view = view
+        self.status_bar.config(
+            text=f"🪄 Pretty view of {tab.title} ({pretty.count(chr(10)):,} lines, read-only) - "
+                 f"saving keeps the original text; 🪄 Pretty again to edit")
+        
+    def materialize_tab(self, tab):
+        """Build the widgets of a lazily created editor tab"""
+        if tab is not None and tab.has_editor and not tab.materialized:
+            if tab.restore is not None and tab.restore.span is None:
+                self.read_restored_tab(tab)  # Editör dosya okununca kurulur
+                return
+            # Oturum anlık görüntüsündeki içerik burada açılır
+            content, tab.pending_text = tab.get_text(), None
+            self.setup_file_tab(tab.frame, content)
+            if tab.view is not None:
+                self.apply_session_view(tab)
+                
+    def read_restored_tab(self, tab):
+        """First look at a session tab kept on disk - read it on the I/O pool"""
+        restore = tab.restore
+        if tab.tab_id in self.restoring:
+            return
+        try:
+            large = os.path.getsize(restore.path) >= LARGE_FILE_THRESHOLD
+        except OSError:
+            large = False  # Okuma hatası aşağıda bildirilir
+        if large:
+            # Oturumdan bu yana büyümüş - salt okunur büyük dosya sekmesi olarak aç
+            index = self.tabs.index(tab)
+            self.notebook.forget(tab.frame)
+            self.tabs.remove(tab)
+            tab.frame.destroy()
+            recorder.count('open tabs', -1)
+            try:
+                self.add_large_file_tab(restore.path, index)
+            except (OSError, ValueError) as e:
+                self.on_file_read_error(restore.path, e)
+            return
+        placeholder = tk.Label(tab.frame, text=f"⏳ Loading {tab.title}...", font=('Segoe UI', 11),
+                               bg='#1a1a1a', fg='#a0a0a0')
+        placeholder.pack(expand=True)
+        self.restoring[tab.tab_id] = placeholder
+        
+        def loaded(path, content):
+            self.restoring.pop(tab.tab_id).destroy()
+            if tab not in self.tabs or tab.materialized:
+                return
+            if tab.restore is restore:  # Bu arada başka bir yol okumuş olabilir
+                tab.load_restored(content)
+            if tab is self.current_tab():
+                self.materialize_tab(tab)
+                
+        def failed(path, error):
+            restore.error = error
+            loaded(path, '')
+            
+        self.file_io.read(restore.path, loaded, failed)
         
-        # Store editor reference
-        self.open_files[frame]['editor'] = code_editor
+    def apply_session_view(self, tab):
+        """Put cursor, selection and scroll position back where the last session left them"""
+        view, tab.view = tab.view, None
+        editor = tab.editor
+        try:
+            editor.mark_set(tk.INSERT, view.cursor)
+            if view.selection:
+                editor.tag_add('sel', *view.selection)
+            editor.yview(view.top)
+        except tk.TclError:
+            pass  # Dosya diskte değişmiş olabilir
+        if view.error is not None:
+            self.status_bar.config(text=f"⚠️ Could not reopen {tab.title}: {view.error}")
+            
+    @recorder.timed(category='event')
+    def on_tab_changed(self, event=None):
+        """Editors are only built when a tab is first shown"""
+        self.materialize_tab(self.current_tab())
+        if self.split_preview is not None and self.split_preview.active:
+            self.show_split_preview()
+        if self.responsive is not None:
+            tab = self.current_tab()
+            if tab is not None and tab.has_editor:
+                self.publish_tab(tab)
+                self.responsive.show(tab.tab_id)
+        if self.outline_visible():
+            self.show_current_outline()
+        
+    def on_editor_modified(self, frame):
+        """Editor content changed - schedule a debounced live push"""
+        tab = self.tabs.get(frame)
+        if not tab or not tab.materialized:
+            return
+        editor = tab.editor
+        if not editor.edit_modified():
+            return
+        editor.edit_modified(False)
+        self.update_tab_title(tab)
+        if self.outline_visible():
+            self.schedule_outline(tab)
+        self.schedule_lint(tab)
+        if self.split_preview is not None and self.split_preview.active:
+            self.split_preview.request_render(tab.tab_id, lambda: self.preview_content(tab), tab.title)
+        if self.responsive is not None:
+            self.responsive.request_render(tab.tab_id, lambda: self.preview_content(tab), tab.title)
+
+        if self.live_preview:
+            # Debounce: sadece son tuş vuruşundan sonra gönder
+            job = self.live_jobs.pop(tab.tab_id, None)
+            if job:
+                self.root.after_cancel(job)
+            self.live_jobs[tab.tab_id] = self.root.after(self.live_delay,
+                                                         lambda: self.push_live_preview(tab))
+            
+    def update_tab_title(self, tab):
+        """Show an unsaved marker on modified tabs"""
+        tab = self.tabs.get(tab)
+        if not tab or tab.journal is None:
+            return
+        text = f"● {tab.title}" if tab.dirty else tab.title
+        if tab.tab_text != text:
+            tab.tab_text = text
+            self.notebook.tab(tab.frame, text=text)
+            
+    def push_live_preview(self, tab):
+        """Hand the current buffer to the live pusher (never blocks)"""
+        self.live_jobs.pop(tab.tab_id, None)
+        if not self.live_preview or tab not in self.tabs or not tab.has_editor:
+            return
+        journal = tab.journal
+        if tab.preview_version == journal.version:
+            return
+        self.get_live_pusher().submit(tab.tab_id, tab.get_text(), tab.title)
+        tab.preview_version = journal.version
+        
+    def get_live_pusher(self):
+        """Create the live pusher on first use"""
+        if self.live_pusher is None:
+            from live_reload import LivePusher
+            self.live_pusher = LivePusher(self.get_preview_server())
+        return self.live_pusher
+        
+    def toggle_split_preview(self):
+        """Editor and rendered page side by side (Ctrl+\\)"""
+        if self.split_preview is None:
+            from split_preview import SplitPreview
+            self.split_preview = SplitPreview(
+                self.split_pane,
+                self.get_preview_server(),
+                self.get_live_pusher(),
+                WEBVIEW_AVAILABLE
+            )
+        if self.split_preview.active:
+            self.split_pane.forget(self.split_preview)
+            self.split_preview.deactivate()
+            self.status_bar.config(text="◫ Split preview closed")
+            return 'break'
+        self.split_pane.add(self.split_preview, weight=1)
+        self.root.after_idle(lambda: self.split_pane.sashpos(0, self.split_pane.winfo_width() // 2))
+        self.split_preview.activate()
+        self.show_split_preview()
+        return 'break'
+        
+    def show_split_preview(self):
+        """Point the split view at the selected tab"""
+        tab = self.current_tab()
+        if tab is None or not tab.has_editor:
+            self.split_preview.clear()
+            return
+        url = self.publish_tab(tab)
+        self.split_preview.show(tab.tab_id, url, lambda: self.preview_content(tab))
+        self.status_bar.config(text=f"◫ {tab.title} - preview updates as you type")
+        
+    def show_responsive_matrix(self):
+        """The current tab at several viewport sizes side by side (Ctrl+Shift+R)"""
+        tab = self.current_tab()
+        if tab is None or not tab.has_editor:
+            messagebox.showwarning("⚠️ Warning", "No HTML tab to preview!")
+            return 'break'
+        if self.responsive is None:
+            from responsive import DEFAULT_VIEWPORTS, ResponsiveMatrix
+            self.responsive = ResponsiveMatrix(
+                self.root,
+                self.get_preview_server(),
+                self.get_live_pusher(),
+                self.responsive_viewports or DEFAULT_VIEWPORTS,
+                WEBVIEW_AVAILABLE,
+                on_close=self.on_responsive_closed
+            )
+        else:
+            self.responsive.lift()
+        self.publish_tab(tab)
+        self.responsive.show(tab.tab_id)
+        self.status_bar.config(text=f"📱 {tab.title} at {len(self.responsive.viewports)} viewport sizes")
+        return 'break'
+        
+    def on_responsive_closed(self, viewports):
+        self.responsive_viewports = viewports
+        self.responsive = None
+        self.reap_renderers()
+        
+    def publish_tab(self, tab):
+        """Publish a tab's buffer unless the server already has this version; returns its URL"""
+        server = self.get_preview_server()
+        if tab.preview_version != tab.journal.version or not server.get_document(tab.tab_id):
+            content = tab.get_text()
+            server.publish(tab.tab_id, content, tab.title, self.preview_base_dir(tab))
+            # Canlı farklar bu sürümü temel alır
+            self.get_live_pusher().reset(tab.tab_id, content)
+            tab.preview_version = tab.journal.version
+        return server.url_for(tab.tab_id)
+        
+    def preview_content(self, tab):
+        """Buffer for a throttled re-render (read when the frame is drawn, not per keystroke)"""
+        tab.preview_version = tab.journal.version
+        return tab.get_text()
+        
+    def toggle_live_preview(self):
+        """Canlı önizleme modunu aç/kapat"""
+        self.live_preview = not self.live_preview
+        if self.live_preview:
+            self.live_button.config(text="⚡ Live: On")
+            self.status_bar.config(text="⚡ Live preview enabled - edits are pushed to the open preview")
+        else:
+            for job in self.live_jobs.values():
+                self.root.after_cancel(job)
+            self.live_jobs.clear()
+            self.live_button.config(text="⚡ Live: Off")
+            self.status_bar.config(text="⏸️ Live preview disabled")
+        
+    def current_tab(self):
+        """Tab of the selected notebook page (None for the welcome page)"""
+        return self.tabs.get(self.notebook.select())
+        
+    def insert_notebook_tab(self, frame, text, index=None):
+        """Add a page to the notebook, optionally at a position"""
+        if index is None or index >= len(self.notebook.tabs()):
+            self.notebook.add(frame, text=text)
+        else:
+            self.notebook.insert(index, frame, text=text)
+            
+    def move_current_tab(self, delta):
+        """Move the active tab left/right (Ctrl+Shift+PageUp/PageDown)"""
+        tab = self.current_tab()
+        if tab is None:
+            return 'break'
+        index = self.tabs.move(tab, self.tabs.index(tab) + delta)
+        # Notebook sırasını modelle aynı tut
+        self.notebook.insert(index, tab.frame)
+        return 'break'
+        
+    def restore_closed_tab(self):
+        """Reopen the most recently closed tab (Ctrl+Shift+T)"""
+        closed = self.tabs.pop_closed()
+        if closed is None:
+            self.status_bar.config(text="ℹ️ No closed tabs to restore")
+            return 'break'
+        if closed.text is not None:
+            # Kaydedilmemiş içerik bellekte saklandı
+            frame = self.add_file_tab(closed.path, closed.text, closed.title, closed.index)
+            if closed.path:
+                tab = self.tabs.get(frame)
+                tab.journal.saved_version = -1
+                tab.journal.saved_hash = None
+                self.update_tab_title(tab)
+            self.status_bar.config(text=f"↩️ {closed.title} restored")
+        else:
+            def loaded(path, content):
+                self.add_file_tab(path, content, closed.title, closed.index)
+                self.status_bar.config(text=f"↩️ {closed.title} restored")
+                
+            self.file_io.read(closed.path, loaded, self.on_file_read_error)
+        return 'break'
         
     def show_preview(self):
         """Aktif sekmeden embedded görüntüleme"""
-        # Aktif sekmeyi bul
-        current_tab = self.notebook.select()
-        if current_tab:
-            # Aktif sekmenin frame'ini bul
-            for frame in self.open_files:
-                if str(frame) == current_tab:
-                    file_info = self.open_files[frame]
-                    if 'editor' in file_info:
-                        content = file_info['editor'].get(1.0, tk.END)
-                        if content.strip():
-                            self.create_embedded_preview(content, file_info['title'])
-                        else:
-                            messagebox.showwarning("⚠️ Warning", "No HTML content found to preview!")
-                    return
+        tab = self.current_tab()
+        if tab is not None:
+            self.show_file_preview(tab)
         else:
             messagebox.showwarning("⚠️ Warning", "No active tab found!")
             
     def show_file_preview(self, frame):
         """Dosya sekmesinden embedded görüntüleme"""
-        file_info = self.open_files.get(frame)
-        if file_info and 'editor' in file_info:
-            content = file_info['editor'].get(1.0, tk.END)
+        tab = self.tabs.get(frame)
+        if tab and tab.large_file is not None:
+            self.preview_large_file(tab)
+        elif tab and tab.has_editor:
+            journal = tab.journal
+            base_dir = self.preview_base_dir(tab)
+            if (tab.preview_version == journal.version and self.preview_server
+                    and self.preview_server.get_document(tab.tab_id)):
+                # Değişiklik yok - yayınlanmış sürümü tekrar kullan
+                self.create_embedded_preview(None, tab.title, tab.tab_id, base_dir)
+                return
+            content = tab.get_text()
             if content.strip():
-                self.create_embedded_preview(content, file_info['title'])
+                self.create_embedded_preview(content, tab.title, tab.tab_id, base_dir)
+                tab.preview_version = journal.version
             else:
                 messagebox.showwarning("⚠️ Warning", "No HTML content found to preview!")
                 
-    def create_embedded_preview(self, content, title):
+    def preview_base_dir(self, tab):
+        """Directory the relative links of a tab resolve against"""
+        if tab.path:
+            return os.path.dirname(os.path.abspath(tab.path))
+        if self.workspace is not None:
+            return self.workspace.root
+        return ''  # Kaydedilmemiş - göreli varlık yok
+        
+    def get_preview_server(self):
+        """Start the local preview server on first use"""
+        if self.preview_server is None:
+            from preview_server import PreviewServer
+            self.preview_server = PreviewServer()
+        self.preview_server.start()
+        return self.preview_server
+        
+    def preview_large_file(self, tab):
+        """Large files are previewed straight from disk"""
+        from pathlib import Path
+        import webbrowser
+        from preview_process import PreviewProcess
+        
+        url = Path(tab.path).resolve().as_uri()
+        if WEBVIEW_AVAILABLE:
+            preview = self.previews.get(tab.tab_id)
+            if preview is not None and preview.is_alive():
+                preview.reload()
+            else:
+                self.previews[tab.tab_id] = PreviewProcess(
+                    url,
+                    title=f"🌐 {tab.title} - Web Viewer",
+                    width=self.root.winfo_screenwidth(),
+                    height=self.root.winfo_screenheight(),
+                    x=0,
+                    y=0,
+                    resizable=True,
+                    text_select=True,
+                    background_color='#ffffff'
+                ).start()
+                self.schedule_preview_poll()
+        else:
+            webbrowser.open(url)
+        self.status_bar.config(text=f"🌐 {tab.title} opened from disk")
+        
+    @recorder.timed(category='preview')
+    def create_embedded_preview(self, content, title, tab_id='default', base_dir=None):
         """Program içinde ayrı pencerede görüntüleme"""
+        import webbrowser
+        from preview_process import PreviewProcess
+        
         try:
-            # Geçici dosya oluştur
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
+            if content is None:
+                # İçerik zaten sunucuda
+                url = self.get_preview_server().url_for(tab_id)
+                if base_dir is not None:
+                    self.preview_server.set_base_dir(tab_id, base_dir)
+            else:
+                # İçeriği bellekten sun - geçici dosya yok; göreli bağlantılar belgenin klasöründen
+                url = self.get_preview_server().publish(tab_id, content, title, base_dir)
+                # Canlı farklar bu sürümü temel alır
+                self.get_live_pusher().reset(tab_id, content)
             
             if WEBVIEW_AVAILABLE:
+                # Gidiş-dönüş: istekten renderer'ın 'loaded' olayına kadar
+                self.preview_requested[tab_id] = time.perf_counter()
                 try:
+                    # Reuse this tab's preview window: navigate or reload only
+                    preview = self.previews.get(tab_id)
+                    if preview is not None and preview.is_alive():
+                        if preview.url == url:
+                            # Belge aynı olsa da varlıklar değişmiş olabilir - 304'lerle ucuz
+                            preview.reload()
+                        else:
+                            preview.load_url(url)
+                        preview.set_title(f"🌐 {title} - Web Viewer")
+                        self.status_bar.config(text=f"🔄 {title} preview refreshed")
+                        return
+                    
                     # Get screen dimensions
                     screen_width = self.root.winfo_screenwidth()
                     screen_height = self.root.winfo_screenheight()
                     
-                    # Calculate window position (center)
-                    x_position = 0  # Left edge
-                    y_position = 0  # Top edge
-                    
-                    # Create WebView window - full screen but top bar preserved
-                    webview.create_window(
+                    # WebView runs in its own process - the editor stays responsive
+                    self.previews[tab_id] = PreviewProcess(
+                        url,
                         title=f"🌐 {title} - Web Viewer",
-                        url=f'file://{temp_file_path}',
                         width=screen_width,     # Screen width
                         height=screen_height,   # Screen height
                         x=0,                    # Left edge
@@ -635,113 +1356,592 @@ class WebViewer:
                         fullscreen=False,       # Not fullscreen, top bar preserved
                         on_top=True,            # Keep on top and lock
                         background_color='#ffffff'
-                    )
-                    
-                    # Start WebView
-                    def start_webview():
-                        try:
-                            # Start WebView
-                            webview.start(debug=False)
-                        except Exception as e:
-                            print(f"WebView error: {e}")
-                            # Open in browser if error occurs
-                            webbrowser.open(f'file://{temp_file_path}')
-                        finally:
-                            # Return main window to full screen when WebView closes
-                            try:
-                                # Make main window full screen again
-                                self.root.state('zoomed')
-                                # Reset sizing
-                                self.root.resizable(True, True)
-                                self.root.minsize(1200, 800)
-                            except:
-                                pass
-                            # Clean up temporary file
-                            try:
-                                os.unlink(temp_file_path)
-                            except:
-                                pass
-                    
-                    # Keep main window fixed
-                    try:
-                        self.root.resizable(True, True)
-                        self.root.minsize(1200, 800)
-                    except:
-                        pass
-                    
-                    # Run in main thread
-                    self.root.after(100, start_webview)
+                    ).start()
+                    self.schedule_preview_poll()
                     self.status_bar.config(text=f"🌐 {title} opened in screen size (top bar preserved)")
                     
                 except Exception as e:
                     # Open in browser if WebView fails
-                    webbrowser.open(f'file://{temp_file_path}')
+                    webbrowser.open(url)
                     messagebox.showinfo("ℹ️ Info", f"WebView not available, opened in browser.\nError: {str(e)}")
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_file_path)
-                    except:
-                        pass
             else:
                 # Open in browser if WebView not available
-                webbrowser.open(f'file://{temp_file_path}')
+                webbrowser.open(url)
                 self.status_bar.config(text=f"🌐 {title} opened in browser")
-                messagebox.showinfo("ℹ️ Info", "pywebview library not found. Opened in browser.")
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
             
         except Exception as e:
             messagebox.showerror("❌ Error", f"Error opening preview window: {str(e)}")
+            
+    def schedule_preview_poll(self):
+        """Poll renderer processes while any preview is open (or still exiting)"""
+        if self.preview_poll_job is None and (self.previews or self.exiting_renderers):
+            try:
+                self.preview_poll_job = self.root.after(200, self.poll_preview_processes)
+            except tk.TclError:
+                pass  # Tk penceresi kapandı (çıkışta run() bekler)
+            
+    def poll_preview_processes(self):
+        """Handle events coming back from renderer processes"""
+        import webbrowser
+        
+        self.preview_poll_job = None
+        for tab_id, preview in list(self.previews.items()):
+            for event in preview.poll():
+                if event[0] == 'error':
+                    print(f"WebView error: {event[1]}")
+                    if not preview.ready:
+                        # Open in browser if the renderer could not start
+                        webbrowser.open(preview.url)
+                        self.status_bar.config(text="🌐 WebView failed - preview opened in browser")
+                elif event[0] == 'loaded':
+                    requested = self.preview_requested.pop(tab_id, None)
+                    if requested is not None and len(event) > 1:
+                        recorder.record('preview.roundtrip', requested, event[1], 'preview')
+                elif event[0] == 'crashed':
+                    self.status_bar.config(text=f"⚠️ Preview renderer crashed (exit code {event[1]})")
+            if preview.closed:
+                # Kullanıcı pencereyi kapattı - borunun ucunu kapat, süreç sonra toplanır
+                preview.close()
+                del self.previews[tab_id]
+        self.reap_renderers()
+        
+    def reap_renderers(self):
+        """Keep polling until closed renderer processes have exited (no zombies)"""
+        from preview_process import reap_closed
+        
+        self.exiting_renderers = reap_closed()
+        self.schedule_preview_poll()
+        
+    def close_all_previews(self):
+        """Close every renderer process"""
+        for preview in self.previews.values():
+            preview.close()
+        self.previews.clear()
+        
+    def open_workspace(self):
+        """Open a folder as workspace and index it in the background"""
+        folder = filedialog.askdirectory(title="Select Workspace Folder")
+        if not folder:
+            return
+        from workspace import WorkspaceIndexer
+        
+        if self.workspace is not None:
+            self.workspace.stop()
+        self.workspace = WorkspaceIndexer(folder).start()
+        self.workspace_generation = 0
+        self.status_bar.config(text=f"⏳ Indexing workspace {folder}...")
+        self.poll_workspace()
+        
+    def poll_workspace(self):
+        """Report indexer progress in the status bar"""
+        workspace = self.workspace
+        if workspace is None:
+            return
+        if workspace.error is not None:
+            self.status_bar.config(text=f"❌ Workspace index error: {workspace.error}")
+            return
+        if workspace.generation != self.workspace_generation:
+            self.workspace_generation = workspace.generation
+            added, changed, removed, seconds = workspace.last_scan
+            self.status_bar.config(
+                text=f"📂 {os.path.basename(workspace.root)}: {len(workspace.paths):,} files indexed "
+                     f"(+{added} ~{changed} -{removed} in {seconds:.2f}s) - Ctrl+P to go to file")
+        self.root.after(500, self.poll_workspace)
+        
+    def show_go_to_file(self):
+        """Fuzzy "go to file" over the workspace index (Ctrl+P)"""
+        workspace = self.workspace
+        if workspace is None:
+            self.status_bar.config(text="ℹ️ Open a folder first (📂 Open Folder)")
+            return 'break'
+        from workspace import FuzzyFinder
+        
+        dialog = tk.Toplevel(self.root, bg='#1a1a1a')
+        dialog.title("Go to File")
+        dialog.transient(self.root)
+        dialog.geometry(f"700x420+{self.root.winfo_rootx() + 100}+{self.root.winfo_rooty() + 80}")
+        query = tk.Entry(dialog, font=('Cascadia Code', 12), bg='#2a2a2a', fg='#ffffff',
+                         insertbackground='#60a5fa', relief='flat')
+        query.pack(fill=tk.X, padx=10, pady=10)
+        results = tk.Listbox(dialog, font=('Cascadia Code', 11), bg='#2a2a2a', fg='#ffffff',
+                             selectbackground='#1e40af', relief='flat', activestyle='none')
+        results.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        state = {'finder': None, 'generation': None, 'job': None}
+        
+        def refresh():
+            state['job'] = None
+            if state['generation'] != workspace.generation:
+                # İndeks güncellendi - yeni yol listesiyle ara
+                state['generation'] = workspace.generation
+                state['finder'] = FuzzyFinder(workspace.paths)
+            results.delete(0, tk.END)
+            for path in state['finder'].search(query.get()):
+                results.insert(tk.END, path)
+            if results.size():
+                results.selection_set(0)
+                
+        def schedule(event=None):
+            if event is not None and event.keysym in ('Up', 'Down', 'Return', 'Escape'):
+                return
+            if state['job'] is None:
+                state['job'] = dialog.after(80, refresh)
+                
+        def move(delta):
+            if results.size():
+                current = results.curselection()
+                index = max(0, min(results.size() - 1, (current[0] if current else -1) + delta))
+                results.selection_clear(0, tk.END)
+                results.selection_set(index)
+                results.see(index)
+            return 'break'
+            
+        def choose(event=None):
+            current = results.curselection()
+            if current:
+                path = workspace.abspath(results.get(current[0]))
+                dialog.destroy()
+                self.open_path(path)
+            return 'break'
+            
+        query.bind('<KeyRelease>', schedule)
+        query.bind('<Up>', lambda e: move(-1))
+        query.bind('<Down>', lambda e: move(1))
+        query.bind('<Return>', choose)
+        results.bind('<Double-Button-1>', choose)
+        dialog.bind('<Escape>', lambda e: dialog.destroy())
+        query.focus_set()
+        refresh()
+        return 'break'
+        
+    def open_path(self, path, location=None):
+        """Select the tab of ``path`` or open it; ``location`` is (line, column, length)"""
+        for tab in self.tabs:
+            if tab.path and os.path.abspath(tab.path) == os.path.abspath(path):
+                self.notebook.select(tab.frame)
+                if location:
+                    self.goto_location(tab, *location)
+                return
+                
+        def opened():
+            for tab in self.tabs:
+                if tab.path == path and location:
+                    self.goto_location(tab, *location)
+                    
+        self.open_paths([path], opened)
+        
+    def show_find_panel(self):
+        """Find / replace across open tabs and the workspace (Ctrl+Shift+F)"""
+        if self.find_panel is None:
+            from search import FindPanel
+            self.find_panel = FindPanel(
+                self.root,
+                self.get_search_sources,
+                self.open_search_result,
+                self.apply_buffer_replacement,
+                on_status=lambda text: self.status_bar.config(text=text)
+            )
+        if not self.find_panel.winfo_ismapped():
+            self.find_panel.pack(side=tk.BOTTOM, fill=tk.X, after=self.status_frame)
+        # Seçili metinle başla
+        selection = None
+        tab = self.current_tab()
+        if tab is not None and tab.materialized and tab.editor.tag_ranges('sel'):
+            selection = tab.editor.get('sel.first', 'sel.last').split('\n')[0]
+        self.find_panel.focus_find(selection)
+        return 'break'
+        
+    def get_search_sources(self):
+        """Snapshot of the buffers (and workspace) for a search worker"""
+        buffers = []
+        self.search_versions = {}
+        loaded = self.search_loaded = {}
+        for tab in self.tabs:
+            if tab.has_editor:
+                if tab.restore is not None:
+                    # Okunmamış oturum sekmesi - diskten / anlık görüntüden arama iş parçacığı okur
+                    def text(restore=tab.restore, tab_id=tab.tab_id):
+                        loaded[tab_id] = restore.load()
+                        return loaded[tab_id]
+                else:
+                    text = tab.get_text()
+                buffers.append((tab.tab_id, tab.title, text))
+                self.search_versions[tab.tab_id] = tab.journal.version
+        # Açık sekmeler diskteki hallerinin yerine geçer
+        exclude = [tab.path for tab in self.tabs if tab.path and tab.has_editor]
+        if self.workspace is None:
+            return buffers, None, None, exclude
+        return buffers, self.workspace.root, self.workspace.db_path, exclude
+        
+    def open_search_result(self, source, line, column, length):
+        """Jump to a match from the results panel"""
+        kind, key = source
+        if kind == 'buffer':
+            tab = self.tabs.by_id(key)
+            if tab is not None:
+                self.notebook.select(tab.frame)
+                self.goto_location(tab, line, column, length)
+        else:
+            self.open_path(key, (line, column, length))
+            
+    def goto_location(self, tab, line, column, length=0):
+        """Move the cursor of a tab to ``line.column`` and select the match"""
+        self.materialize_tab(tab)
+        if not tab.materialized:
+            return
+        editor = tab.editor
+        start = f"{line}.{column}"
+        if tab.pretty_view is not None:
+            self.toggle_pretty_view(tab)  # Sonuç editörde - biçimli görünümü kapat
+        if tab.long_lines:
+            from long_lines import expand_line, is_truncated
+            if is_truncated(editor, start):
+                expand_line(editor, line)
+        if self.outline_worker is not None:
+            from outline import reveal
+            reveal(editor, line)  # Katlanmış bölgedeyse aç
+        editor.tag_remove('sel', '1.0', tk.END)
+        editor.tag_add('sel', start, f"{start} + {length}c")
+        editor.mark_set(tk.INSERT, start)
+        editor.see(start)
+        editor.focus_set()
+        
+    def apply_buffer_replacement(self, tab_id, new_text, count):
+        """Replace-all result for an open tab (skipped if it was edited meanwhile)"""
+        tab = self.tabs.by_id(tab_id)
+        if tab is None:
+            return
+        if tab.journal.version != self.search_versions.get(tab_id):
+            self.status_bar.config(text=f"⚠️ {tab.title} changed during replace - skipped")
+            return
+        if tab.restore is not None and tab_id in self.search_loaded:
+            tab.load_restored(self.search_loaded.pop(tab_id))  # Arama zaten okudu
+        if tab.materialized:
+            tab.editor.delete('1.0', tk.END)
+            tab.editor.insert('1.0', new_text)
+        else:
+            # Editör yok - değişikliği günlüğe elle işle
+            tab.journal.record('delete', '1.0', end_index(tab.pending_text), None)
+            tab.journal.record('insert', '1.0', end_index(new_text), new_text)
+            tab.pending_text = new_text
+        self.search_versions[tab_id] = tab.journal.version
+        self.update_tab_title(tab)
+        
+    def toggle_outline_panel(self):
+        """Outline tree and minimap of the current tab (Ctrl+Shift+O)"""
+        if self.outline_panel is None:
+            from outline import OutlinePanel
+            self.outline_panel = OutlinePanel(
+                self.notebook_frame,
+                self.outline_jump,
+                self.fold_node,
+                self.unfold_all_current,
+                self.toggle_outline_panel
+            )
+            self.outline_panel.pack_propagate(False)
+        if self.outline_panel.winfo_ismapped():
+            self.outline_panel.pack_forget()
+            return 'break'
+        self.outline_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0), before=self.split_pane)
+        self.show_current_outline()
+        self.track_outline_viewport()
+        return 'break'
+        
+    def outline_visible(self):
+        return self.outline_panel is not None and self.outline_panel.winfo_ismapped()
+        
+    def show_current_outline(self):
+        """Point the outline panel at the selected tab"""
+        tab = self.current_tab()
+        if tab is None or not tab.materialized:
+            self.outline_panel.clear()
+            return
+        cached = self.outlines.get(tab.tab_id)
+        if cached is not None:
+            self.outline_panel.show(cached[1])
+        self.request_outline(tab)
+        
+    def request_outline(self, tab, then=None):
+        """Bring a tab's outline up to date on the worker, then call ``then(index)``"""
+        journal = tab.journal
+        version, index = self.outlines.get(tab.tab_id, (None, None))
+        if version == journal.version:
+            if then is not None:
+                then(index)
+            return
+        if then is not None:
+            self.outline_actions[tab.tab_id] = then
+        first_line = None
+        if index is not None:
+            # Yalnızca ilk değişen satırdan sonrası yeniden ayrıştırılır
+            changes = journal.changes_since(version)
+            if changes:
+                first_line = min(int(str(entry[2]).split('.')[0]) for entry in changes)
+        if self.outline_worker is None:
+            from keyed_worker import KeyedWorker
+            from outline import outline_index
+            self.outline_worker = KeyedWorker(self.root, 'outline', outline_index, self.on_outline_built)
+        self.outline_worker.submit(tab.tab_id, journal.version, tab.get_text(), index, first_line)
+        
+    def on_outline_built(self, tab_id, version, index, seconds):
+        """A finished outline from the worker"""
+        tab = self.tabs.by_id(tab_id)
+        if tab is None or not tab.materialized:
+            return
+        end = time.perf_counter()
+        recorder.record('outline.build', end - seconds, end, 'outline',
+                        {'from line': index.reparsed_from, 'elements': len(index.nodes)})
+        self.outlines[tab_id] = (version, index)
+        if version != tab.journal.version:
+            self.request_outline(tab)  # Ayrıştırılırken yine düzenlendi
+        else:
+            action = self.outline_actions.pop(tab_id, None)
+            if action is not None:
+                action(index)
+        if self.outline_visible() and tab is self.current_tab():
+            self.outline_panel.show(index, seconds)
+        
+    def schedule_outline(self, tab):
+        """Debounced outline refresh while typing"""
+        if self.outline_job:
+            self.root.after_cancel(self.outline_job)
+        self.outline_job = self.root.after(self.live_delay, lambda: self.refresh_outline(tab))
+        
+    def refresh_outline(self, tab):
+        self.outline_job = None
+        if tab.materialized and self.outline_visible():
+            self.request_outline(tab)
+        
+    def track_outline_viewport(self):
+        """Keep the minimap's viewport box on the visible lines"""
+        if not self.outline_visible():
+            return
+        tab = self.current_tab()
+        if tab is not None and tab.materialized:
+            editor = tab.editor
+            first = int(editor.index('@0,0').split('.')[0])
+            last = int(editor.index(f"@0,{editor.winfo_height()}").split('.')[0])
+            self.outline_panel.set_viewport(first, last)
+        self.root.after(200, self.track_outline_viewport)
+        
+    def outline_jump(self, line):
+        """Show ``line`` of the current tab (opening folds that hide it)"""
+        from outline import reveal
+
+        tab = self.current_tab()
+        if tab is None or not tab.materialized:
+            return
+        reveal(tab.editor, line)
+        tab.editor.mark_set(tk.INSERT, f"{line}.0")
+        tab.editor.see(f"{line}.0")
+        
+    def fold_node(self, node, tab=None):
+        """Collapse the lines of an outline node below its first line"""
+        from outline import fold_lines
+
+        tab = tab or self.current_tab()
+        if tab is None or not tab.materialized:
+            return
+        editor = tab.editor
+        if fold_lines(editor, node.start, node.end) is None:
+            return
+        cursor = int(editor.index(tk.INSERT).split('.')[0])
+        if node.start < cursor <= node.end:
+            editor.mark_set(tk.INSERT, f"{node.start}.0 lineend")
+        self.status_bar.config(
+            text=f"⊟ Folded <{node.label}> ({node.end - node.start} lines) - Ctrl+Shift+] to unfold")
+        
+    def fold_at_cursor(self):
+        """Fold the innermost element around the cursor (Ctrl+Shift+[)"""
+        tab = self.current_tab()
+        if tab is None or not tab.materialized:
+            return 'break'
+        line = int(tab.editor.index(tk.INSERT).split('.')[0])
+
+        def fold(index):
+            from outline import folded_at
+
+            if not tab.materialized:
+                return
+            node_id = index.innermost_at(line)
+            # Zaten katlıysa bir üst öğeyi katla
+            while node_id is not None and folded_at(tab.editor, index.nodes[node_id].start):
+                node_id = index.nodes[node_id].parent
+                node_id = None if node_id < 0 else node_id
+            if node_id is None:
+                self.status_bar.config(text="⊟ Nothing to fold here")
+                return
+            self.fold_node(index.nodes[node_id], tab)
+
+        self.request_outline(tab, fold)
+        return 'break'
         
+    def unfold_at_cursor(self):
+        """Open the folds on the cursor line (Ctrl+Shift+])"""
+        from outline import unfold_at
+
+        tab = self.current_tab()
+        if tab is not None and tab.materialized:
+            line = int(tab.editor.index(tk.INSERT).split('.')[0])
+            if unfold_at(tab.editor, line):
+                self.status_bar.config(text="⊞ Unfolded")
+        return 'break'
+        
+    def unfold_all_current(self):
+        from outline import unfold_all
+
+        tab = self.current_tab()
+        if tab is not None and tab.materialized:
+            unfold_all(tab.editor)
+
+    def schedule_lint(self, tab):
+        """Debounced lint of a tab's buffer"""
+        job = self.lint_jobs.pop(tab.tab_id, None)
+        if job:
+            self.root.after_cancel(job)
+        self.lint_jobs[tab.tab_id] = self.root.after(self.lint_delay, lambda: self.request_lint(tab))
+        
+    def request_lint(self, tab):
+        """Hand the buffer to the lint worker (it re-checks only around the edit)"""
+        self.lint_jobs.pop(tab.tab_id, None)
+        if tab not in self.tabs or not tab.materialized:
+            return
+        version, index = self.lints.get(tab.tab_id, (None, None))
+        if version == tab.journal.version:
+            return
+        if self.lint_worker is None:
+            from keyed_worker import KeyedWorker
+            from lint import lint_index
+            self.lint_worker = KeyedWorker(self.root, 'lint', lint_index, self.on_lint_result, 20)
+        self.lint_worker.submit(tab.tab_id, tab.journal.version, tab.get_text(), index)
+        
+    def on_lint_result(self, tab_id, version, index, seconds):
+        """A finished lint from the worker - underline its problems"""
+        from lint import show_marks
+
+        tab = self.tabs.by_id(tab_id)
+        if tab is None or not tab.materialized:
+            return
+        end = time.perf_counter()
+        recorder.record('lint.run', end - seconds, end, 'lint',
+                        {'scanned': index.scanned, 'problems': len(index.marks)})
+        _, previous = self.lints.get(tab_id, (None, None))
+        self.lints[tab_id] = (version, index)
+        if version != tab.journal.version:
+            self.request_lint(tab)  # Denetlenirken yine düzenlendi - konumlar eskidi
+            return
+        show_marks(tab.editor, index, self.show_lint_problem)
+        counts = (index.error_count, index.warning_count)
+        if tab is self.current_tab() and any(counts) and (
+                previous is None or counts != (previous.error_count, previous.warning_count)):
+            self.status_bar.config(
+                text=f"🔍 {tab.title}: {counts[0]} error(s), {counts[1]} warning(s) - F8 for the next")
+        
+    def show_lint_problem(self, mark):
+        start, _, severity, code, message = mark
+        icon = '❌' if severity == 'error' else '⚠️'
+        self.status_bar.config(text=f"{icon} Line {start.split('.')[0]}: {message} ({code})")
+        
+    def next_lint_problem(self):
+        """Jump to the next underlined problem after the cursor (F8)"""
+        tab = self.current_tab()
+        if tab is None or not tab.materialized:
+            return 'break'
+        _, index = self.lints.get(tab.tab_id, (None, None))
+        if index is None or not index.marks:
+            self.status_bar.config(text="✅ No problems found")
+            return 'break'
+        line, column = map(int, tab.editor.index(tk.INSERT).split('.'))
+        mark = index.next_mark(line, column)
+        start_line, start_column = map(int, mark[0].split('.'))
+        end_line, end_column = map(int, mark[1].split('.'))
+        length = end_column - start_column if end_line == start_line else 0
+        self.goto_location(tab, start_line, start_column, length)
+        self.show_lint_problem(mark)
+        return 'break'
+
     def open_file(self):
-        """Open file and create new tab"""
-        file_path = filedialog.askopenfilename(
+        """Open one or more files, each in a new tab"""
+        file_paths = filedialog.askopenfilenames(
             title="Select HTML File",
             filetypes=[("HTML files", "*.html *.htm"), ("All files", "*.*")]
         )
         
-        if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    
-                # Yeni sekme oluştur
-                self.add_file_tab(file_path, content)
-                self.status_bar.config(text=f"✅ Dosya açıldı: {file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("❌ Hata", f"Dosya açılırken hata oluştu: {str(e)}")
+        if file_paths:
+            self.open_paths(list(file_paths))
         else:
             # Dosya seçilmezse yeni boş sekme oluştur
-            self.add_file_tab(None, "", f"Yeni Dosya {len(self.open_files) + 1}")
+            self.add_file_tab(None, "", f"Yeni Dosya {len(self.tabs) + 1}")
             self.status_bar.config(text="📝 Yeni boş sekme oluşturuldu")
+            
+    def open_paths(self, file_paths, on_done=None):
+        """Read files in the background and add their tabs in order"""
+        if file_paths:
+            results = {}
+            added = []
+            
+            def flush():
+                # Sekmeleri seçim sırasıyla ekle; sadece sonuncusu editör oluşturur
+                while len(added) < len(file_paths) and file_paths[len(added)] in results:
+                    path = file_paths[len(added)]
+                    content = results.pop(path)
+                    last = len(added) == len(file_paths) - 1
+                    if content is not None:
+                        self.add_file_tab(path, content, select=last)
+                    added.append(path)
+                if len(added) == len(file_paths):
+                    if len(file_paths) == 1:
+                        self.status_bar.config(text=f"✅ Dosya açıldı: {file_paths[0]}")
+                    else:
+                        self.status_bar.config(text=f"✅ {len(file_paths)} dosya açıldı")
+                    if on_done:
+                        on_done()
+                        
+            def loaded(path, content):
+                results[path] = content
+                flush()
+                
+            def failed(path, error):
+                results[path] = None
+                self.on_file_read_error(path, error)
+                flush()
+                
+            for file_path in file_paths:
+                try:
+                    large = os.path.getsize(file_path) >= LARGE_FILE_THRESHOLD
+                except OSError as e:
+                    failed(file_path, e)
+                    continue
+                if large:
+                    self.add_large_file_tab(file_path)
+                    loaded(file_path, None)
+                else:
+                    # Okuma arka planda - arayüz donmaz
+                    self.file_io.read(file_path, loaded, failed)
+            if len(added) < len(file_paths):
+                self.status_bar.config(text=f"⏳ Dosya açılıyor: {os.path.basename(file_paths[0])}"
+                                            + (f" (+{len(file_paths) - 1})" if len(file_paths) > 1 else "")
+                                            + "...")
+            
+    def on_file_read_error(self, path, error):
+        """Background read failed"""
+        self.status_bar.config(text=f"❌ Could not open {os.path.basename(path)}")
+        messagebox.showerror("❌ Hata", f"Dosya açılırken hata oluştu: {str(error)}")
                 
     def save_file_tab(self, frame):
         """Save file tab"""
-        file_info = self.open_files.get(frame)
-        if file_info and 'editor' in file_info:
-            content = file_info['editor'].get(1.0, tk.END)
-            
-            if file_info['path']:
-                try:
-                    with open(file_info['path'], 'w', encoding='utf-8') as file:
-                        file.write(content)
-                    self.status_bar.config(text=f"💾 File saved: {file_info['path']}")
-                    messagebox.showinfo("✅ Success", "File saved successfully!")
-                except Exception as e:
-                    messagebox.showerror("❌ Error", f"Error saving file: {str(e)}")
+        tab = self.tabs.get(frame)
+        if tab and tab.large_file is not None:
+            self.status_bar.config(text="📚 Large files are opened read-only - nothing to save")
+        elif tab and tab.has_editor:
+            if tab.path:
+                self.write_tab(tab, tab.path)
             else:
-                self.save_as_file_tab(frame)
+                self.save_as_file_tab(tab)
                 
     def save_as_file_tab(self, frame):
         """Save file tab as"""
-        file_info = self.open_files.get(frame)
-        if file_info and 'editor' in file_info:
-            content = file_info['editor'].get(1.0, tk.END)
-            
+        tab = self.tabs.get(frame)
+        if tab and tab.has_editor:
             file_path = filedialog.asksaveasfilename(
                 title="Save HTML File",
                 defaultextension=".html",
@@ -749,119 +1949,367 @@ class WebViewer:
             )
             
             if file_path:
-                try:
-                    with open(file_path, 'w', encoding='utf-8') as file:
-                        file.write(content)
-                    
-                    # Dosya bilgilerini güncelle
-                    file_info['path'] = file_path
-                    file_info['title'] = os.path.basename(file_path)
-                    
-                    # Sekme başlığını güncelle
-                    tab_index = self.notebook.index(frame)
-                    self.notebook.tab(tab_index, text=file_info['title'])
-                    
-                    self.status_bar.config(text=f"💾 File saved: {file_path}")
-                    messagebox.showinfo("✅ Success", "File saved successfully!")
-                except Exception as e:
-                    messagebox.showerror("❌ Error", f"Error saving file: {str(e)}")
-    
+                self.write_tab(tab, file_path)
+                
+    def write_tab(self, tab, file_path):
+        """Write a tab's buffer in the background (atomic, coalesced)"""
+        journal = tab.journal
+        if file_path == tab.path and journal.is_unchanged_since_save(tab.get_text):
+            # Değişiklik yok - yazmaya gerek yok
+            self.update_tab_title(tab)
+            self.status_bar.config(text=f"✅ No changes to save: {file_path}")
+            return
+        content = tab.get_text()
+        version = journal.version
+        text_hash = content_hash(content)
+        
+        def saved(path, size, elapsed):
+            journal.mark_saved(version, text_hash)
+            # Dosya bilgilerini güncelle (Save As ise yeni yol)
+            if tab in self.tabs:
+                if tab.path != path:
+                    tab.path = path
+                    tab.title = os.path.basename(path)
+                self.update_tab_title(tab)
+            self.status_bar.config(
+                text=f"💾 File saved: {path} ({size / 1024:.1f} KB, {elapsed * 1000:.0f} ms)")
+            
+        def failed(path, error):
+            self.status_bar.config(text=f"❌ Save failed: {path}")
+            messagebox.showerror("❌ Error", f"Error saving file: {str(error)}")
+            
+        if self.file_io.write(tab.tab_id, file_path, content, saved, failed):
+            self.status_bar.config(text=f"⏳ Saving {os.path.basename(file_path)}...")
+        else:
+            self.status_bar.config(text=f"⏳ Saving {os.path.basename(file_path)} (queued latest changes)...")
+            
+    def save_all_files(self):
+        """Write every modified tab in parallel"""
+        dirty = [tab for tab in self.tabs if tab.dirty]
+        for tab in dirty:
+            if tab.path:
+                self.write_tab(tab, tab.path)
+        # Adı olmayan sekmeler için yine de sor
+        for tab in dirty:
+            if not tab.path:
+                self.notebook.select(tab.frame)
+                self.save_as_file_tab(tab)
+        if not dirty:
+            self.status_bar.config(text="✅ All files are already saved")
+            
     def close_file_tab(self, frame):
         """Close file tab"""
-        if frame in self.open_files:
+        tab = self.tabs.get(frame)
+        if tab is not None:
             # Remove tab
-            self.notebook.forget(frame)
-            # Clean file info
-            del self.open_files[frame]
+            self.notebook.forget(tab.frame)
+            # Drop the in-memory preview document
+            if self.preview_server is not None:
+                self.preview_server.unpublish(tab.tab_id)
+            if self.live_pusher is not None:
+                self.live_pusher.forget(tab.tab_id)
+            job = self.live_jobs.pop(tab.tab_id, None)
+            if job:
+                self.root.after_cancel(job)
+            preview = self.previews.pop(tab.tab_id, None)
+            if preview is not None:
+                preview.close()
+                self.reap_renderers()
+            closed = None
+            if tab.has_editor:
+                # Ctrl+Shift+T ile geri açılabilsin
+                text = tab.get_text() if tab.dirty or not tab.path else None
+                closed = ClosedTab(tab.path, tab.title, text, None)
+            elif tab.path:
+                closed = ClosedTab(tab.path, tab.title, None, None)
+            if tab.pretty_view is not None:
+                tab.pretty_view.frame.destroy()
+                tab.pretty_view = None
+            if tab.pooled_editor is not None:
+                # Editörü havuza geri ver
+                tab.editor._change_proxy.remove_listener(tab.journal.record)
+                self.save_history(tab)
+                tab.editor._change_proxy.remove_listener(tab.history.record, want_deleted_text=True)
+                tab.history = None
+                if self.outline_worker is not None:
+                    from outline import unfold_all
+                    unfold_all(tab.editor)  # Katlamalar sonraki sekmeye geçmesin
+                self.editor_pool.release(tab.pooled_editor)
+                tab.pooled_editor = tab.editor = None
+            if tab.large_file is not None:
+                tab.large_file.close()
+            if self.autosave is not None:
+                self.autosave.discard(tab.tab_id)
+            self.preview_requested.pop(tab.tab_id, None)
+            if self.split_preview is not None and self.split_preview.preview_id == tab.tab_id:
+                self.split_preview.clear()
+            if self.responsive is not None and self.responsive.preview_id == tab.tab_id:
+                self.responsive.clear()
+            self.outlines.pop(tab.tab_id, None)
+            self.outline_actions.pop(tab.tab_id, None)
+            self.lints.pop(tab.tab_id, None)
+            job = self.lint_jobs.pop(tab.tab_id, None)
+            if job:
+                self.root.after_cancel(job)
+            # Clean file info and widgets
+            self.tabs.remove(tab, closed)
+            tab.frame.destroy()
+            recorder.count('open tabs', -1)
             self.status_bar.config(text="🗑️ Tab closed")
         
+    def attach_history(self, tab):
+        """Undo history of a newly shown tab - last session's if the file is unchanged"""
+        from undo import UndoHistory, history_path
+        
+        history = None
+        if tab.path and not tab.dirty and tab.journal.saved_hash is not None:
+            history = UndoHistory.load(history_path(tab.path), tab.journal.saved_hash)
+        tab.history = history or UndoHistory()
+        TextChangeProxy.install(tab.editor).add_listener(tab.history.record, want_deleted_text=True)
+        
+    def save_history(self, tab):
+        """Keep the undo steps of a file tab for the next session"""
+        if tab.history is None or not tab.path or not len(tab.history):
+            return
+        from undo import history_path
+        
+        try:
+            tab.history.save(history_path(tab.path), tab.journal.hash(tab.get_text))
+        except OSError as e:
+            print(f"Undo history not saved: {e}")
+            
+    def on_app_close(self):
+        """Main window closed - keep the session and undo histories while the editors still exist"""
+        from undo import prune_histories
+        
+        try:
+            self.save_session()
+            self.session_saved = True
+        except OSError as e:
+            print(f"Session not saved: {e}")
+            if any(tab.dirty for tab in self.tabs) and not messagebox.askyesno(
+                    "⚠️ Session not saved",
+                    f"The session could not be saved:\n{e}\n\n"
+                    "Unsaved changes are kept for crash recovery and offered at the next start.\n\n"
+                    "Close anyway?"):
+                return
+        for tab in self.tabs:
+            if tab.materialized:
+                self.save_history(tab)
+        prune_histories()
+        self.root.destroy()
+        
+    def undo_redo(self, frame, action):
+        """Ctrl+Z / Ctrl+Y in an editor"""
+        tab = self.tabs.get(frame)
+        if tab is None or tab.history is None:
+            return 'break'
+        editor = tab.editor
+        with recorder.span(f"edit.{action}", 'edit'):
+            if action == 'undo':
+                index = tab.history.undo(editor)
+            else:
+                index = tab.history.redo(editor)
+        if index is None:
+            self.status_bar.config(text=f"Nothing to {action}")
+            return 'break'
+        editor.tag_remove('sel', '1.0', tk.END)
+        editor.mark_set(tk.INSERT, index)
+        editor.see(index)
+        return 'break'
+        
+    def on_editor_key(self, event):
+        """Keystroke latency: key press until the redraw that follows it"""
+        start = time.perf_counter()
+        # İlk boşta turu Text'in yeniden çizimini içerir; ikincide bitmiş say
+        self.root.after_idle(lambda: self.root.after_idle(
+            lambda: recorder.record('keystroke', start, time.perf_counter(), 'input')))
+        
+    def toggle_perf_hud(self):
+        """Show/hide keystroke and preview latency in the status bar (F12)"""
+        if self.perf_hud is not None:
+            self.perf_hud.destroy()
+            self.perf_hud = None
+            return
+        self.perf_hud = tk.Label(self.status_frame, font=('Cascadia Code', 9),
+                                 bg='#1a1a1a', fg='#60a5fa')
+        self.perf_hud.pack(side=tk.RIGHT, padx=15, pady=5)
+        self.update_perf_hud()
+        
+    def update_perf_hud(self):
+        if self.perf_hud is None:
+            return
+        parts = []
+        keys = recorder.percentiles('keystroke')
+        if keys:
+            parts.append(f"⌨️ p50 {keys[0]:.1f} ms p99 {keys[1]:.1f} ms")
+        preview = recorder.percentiles('preview.roundtrip') or recorder.percentiles('preview.serve')
+        if preview:
+            parts.append(f"🌐 preview p50 {preview[0]:.0f} ms")
+        io = recorder.percentiles('read_text')
+        if io:
+            parts.append(f"📖 read p50 {io[0]:.1f} ms")
+        parts.append(f"{len(recorder.events):,} events (Shift+F12: export)")
+        self.perf_hud.config(text="  |  ".join(parts))
+        self.root.after(500, self.update_perf_hud)
+        
+    def export_perf_trace(self):
+        """Save the recorded spans as a Chrome trace (chrome://tracing, Perfetto)"""
+        path = filedialog.asksaveasfilename(
+            title="Export Performance Trace",
+            defaultextension=".json",
+            initialfile=f"web-viewer-trace-{time.strftime('%Y%m%d-%H%M%S')}.json",
+            filetypes=[("Chrome trace", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            count = recorder.write_chrome_trace(path)
+        except OSError as e:
+            messagebox.showerror("❌ Error", f"Could not write trace: {e}")
+            return
+        self.status_bar.config(text=f"📈 {count:,} trace events written to {path}")
+        
     def save_file(self):
         """Save active tab"""
-        # Find active tab
-        current_tab = self.notebook.select()
-        if current_tab:
-            # Find active tab frame
-            for frame in self.open_files:
-                if str(frame) == current_tab:
-                    file_info = self.open_files[frame]
-                    if 'editor' in file_info:
-                        content = file_info['editor'].get(1.0, tk.END)
-                        if file_info['path']:
-                            try:
-                                with open(file_info['path'], 'w', encoding='utf-8') as file:
-                                    file.write(content)
-                                self.status_bar.config(text=f"💾 File saved: {file_info['path']}")
-                                messagebox.showinfo("✅ Success", "File saved successfully!")
-                            except Exception as e:
-                                messagebox.showerror("❌ Error", f"Error saving file: {str(e)}")
-                        else:
-                            self.save_as_file()
-                    return
-        messagebox.showwarning("⚠️ Warning", "No active tab found!")
+        tab = self.current_tab()
+        if tab is not None:
+            self.save_file_tab(tab)
+        else:
+            messagebox.showwarning("⚠️ Warning", "No active tab found!")
             
     def save_as_file(self):
         """Save active tab as"""
-        # Find active tab
-        current_tab = self.notebook.select()
-        if current_tab:
-            # Find active tab frame
-            for frame in self.open_files:
-                if str(frame) == current_tab:
-                    file_info = self.open_files[frame]
-                    if 'editor' in file_info:
-                        content = file_info['editor'].get(1.0, tk.END)
-                        
-                        file_path = filedialog.asksaveasfilename(
-                            title="Save HTML File",
-                            defaultextension=".html",
-                            filetypes=[("HTML files", "*.html"), ("All files", "*.*")]
-                        )
-                        
-                        if file_path:
-                            try:
-                                with open(file_path, 'w', encoding='utf-8') as file:
-                                    file.write(content)
-                                
-                                # Update file info
-                                file_info['path'] = file_path
-                                file_info['title'] = os.path.basename(file_path)
-                                
-                                # Update tab title
-                                tab_index = self.notebook.index(frame)
-                                self.notebook.tab(tab_index, text=file_info['title'])
-                                
-                                self.status_bar.config(text=f"💾 File saved: {file_path}")
-                                messagebox.showinfo("✅ Success", "File saved successfully!")
-                            except Exception as e:
-                                messagebox.showerror("❌ Error", f"Error saving file: {str(e)}")
-                    return
-        messagebox.showwarning("⚠️ Warning", "No active tab found!")
+        tab = self.current_tab()
+        if tab is not None:
+            self.save_as_file_tab(tab)
+        else:
+            messagebox.showwarning("⚠️ Warning", "No active tab found!")
+            
+    def export_optimized(self):
+        """Export minified pages with bundled assets and .gz/.br files"""
+        if self.export_run is not None and not self.export_run.done:
+            self.status_bar.config(text="⏳ An export is already running")
+            return
+        tab = self.current_tab()
+        whole_workspace = False
+        if self.workspace is not None and self.workspace.ready:
+            whole_workspace = messagebox.askyesnocancel(
+                "📦 Export Optimized",
+                "Export every HTML page of the workspace?\n\n(No = only the active tab)")
+            if whole_workspace is None:
+                return
+        if not whole_workspace and (tab is None or not tab.has_editor):
+            messagebox.showwarning("⚠️ Warning", "No HTML tab to export!")
+            return
+        out_dir = filedialog.askdirectory(title="Export Optimized To")
+        if not out_dir:
+            return
+        # Açık sekmelerdeki kaydedilmemiş değişiklikler de dışa aktarılır
+        sources = [t for t in self.tabs if t.has_editor and t.path] if whole_workspace else [tab]
+        buffers = {t.tab_id: t.get_text() for t in sources if t.restore is None}
+        # Okunmamış oturum sekmeleri: diskteki dosyayı iş okur, anlık görüntüdekiler G/Ç havuzunda okunur
+        unread = [t for t in sources if t.restore is not None and t.restore.span is not None]
+        
+        def start(texts):
+            buffers.update(texts)
+            if whole_workspace:
+                root = self.workspace.root
+                by_path = {os.path.abspath(t.path): buffers.get(t.tab_id) for t in sources}
+                jobs = []
+                for relpath in self.workspace.paths:
+                    if relpath.lower().endswith(('.html', '.htm')):
+                        path = self.workspace.abspath(relpath)
+                        jobs.append((path, by_path.get(os.path.abspath(path)), root, out_dir, relpath))
+            else:
+                name = os.path.basename(tab.path) if tab.path else 'index.html'
+                jobs = [(tab.path, buffers.get(tab.tab_id), self.preview_base_dir(tab), out_dir, name)]
+            if not jobs:
+                self.status_bar.config(text="ℹ️ No HTML pages to export")
+                return
+            from export import ExportRun
+            self.export_run = ExportRun(jobs)
+            self.status_bar.config(text=f"⏳ Exporting {len(jobs)} page(s) to {out_dir}...")
+            self.poll_export()
+            
+        self.read_snapshot_buffers(unread, start)
+        
+    def read_snapshot_buffers(self, tabs, callback):
+        """Texts of session tabs kept in the snapshot, read on the I/O pool
+
+        ``callback({tab_id: text})`` runs on the Tk thread once every read
+        has finished; tabs that could not be read are left out.
+        """
+        texts = {}
+        waiting = {tab.tab_id for tab in tabs}
+        if not waiting:
+            callback(texts)
+            return
+        
+        def finished(tab_id):
+            waiting.discard(tab_id)
+            if not waiting:
+                callback(texts)
+                
+        for tab in tabs:
+            def read_snapshot(path, restore=tab.restore):
+                return restore.read()
+            
+            def loaded(path, text, tab_id=tab.tab_id):
+                texts[tab_id] = text
+                finished(tab_id)
+                
+            def failed(path, error, tab_id=tab.tab_id):
+                print(f"Session buffer not read: {error}")
+                finished(tab_id)
+                
+            self.file_io.read(tab.restore.snapshot, loaded, failed, loader=read_snapshot)
+        
+    def poll_export(self):
+        """Stream finished export jobs to the status bar"""
+        run = self.export_run
+        if run is None:
+            return
+        for stats in run.poll():
+            if 'error' in stats:
+                print(f"Export failed: {stats['source']}: {stats['error']}")
+        if not run.done:
+            self.status_bar.config(text=f"⏳ Exported {len(run.results)}/{len(run.jobs)} page(s)...")
+            self.root.after(100, self.poll_export)
+            return
+        total = run.summary()
+        if not total['pages']:
+            self.status_bar.config(text="❌ Export failed (see console)")
+            return
+        saved = 1 - total['output'] / max(1, total['original'])
+        compressed = total['brotli'] or total['gzip']
+        text = (f"📦 Exported {total['pages']} page(s): {total['original'] / 1024:,.1f} KB → "
+                f"{total['output'] / 1024:,.1f} KB ({saved:.0%} smaller, "
+                f"{compressed / 1024:,.1f} KB {'br' if total['brotli'] else 'gzip'}) in {run.elapsed:.2f}s")
+        if total['errors']:
+            text += f" - {total['errors']} failed"
+        self.status_bar.config(text=text)
         
     def clear_content(self):
         """Clear active tab"""
-        # Find active tab
-        current_tab = self.notebook.select()
-        if current_tab:
-            # Find active tab frame
-            for frame in self.open_files:
-                if str(frame) == current_tab:
-                    file_info = self.open_files[frame]
-                    if 'editor' in file_info:
-                        if messagebox.askyesno("❓ Confirm", "Are you sure you want to clear the active tab content?"):
-                            file_info['editor'].delete(1.0, tk.END)
-                            # Clear file info
-                            file_info['path'] = None
-                            file_info['title'] = f"New File {len(self.open_files)}"
-                            # Update tab title
-                            tab_index = self.notebook.index(frame)
-                            self.notebook.tab(tab_index, text=file_info['title'])
-                            self.status_bar.config(text="🗑️ Content cleared")
-                    return
-        messagebox.showwarning("⚠️ Warning", "No active tab found!")
+        tab = self.current_tab()
+        if tab is None:
+            messagebox.showwarning("⚠️ Warning", "No active tab found!")
+        elif tab.has_editor:
+            self.materialize_tab(tab)
+            if not tab.materialized:
+                return  # Oturum sekmesi hâlâ okunuyor
+            if messagebox.askyesno("❓ Confirm", "Are you sure you want to clear the active tab content?"):
+                tab.editor.delete(1.0, tk.END)
+                # Clear file info
+                tab.path = None
+                tab.title = f"New File {len(self.tabs)}"
+                # Update tab title
+                self.update_tab_title(tab)
+                self.status_bar.config(text="🗑️ Content cleared")
             
     def create_new_file(self):
         """Create new empty file tab"""
-        new_file_count = len(self.open_files) + 1
+        new_file_count = len(self.tabs) + 1
         self.add_file_tab(None, "", f"New File {new_file_count}")
         self.status_bar.config(text=f"📄 New file tab created")
             
@@ -869,16 +2317,50 @@ class WebViewer:
         try:
             print("Web Viewer starting...")
             self.root.mainloop()
+            # Bekleyen kayıtları bitir
+            self.file_io.shutdown()
+            if self.autosave is not None:
+                # Oturum kaydedildiyse temiz çıkış - kurtarma verisi gerekmez; yoksa sonraki açılışa kalır
+                self.autosave.close(keep=not self.session_saved)
+            self.close_all_previews()
+            if self.split_preview is not None:
+                self.split_preview.close()
+            if self.responsive is not None:
+                self.responsive.close()
+            from preview_process import reap_closed
+            reap_closed(wait=True)  # Pencereler kapanırken bekle, kapanmayanları sonlandır
+            if self.find_panel is not None:
+                self.find_panel.cancel()
+            if self.export_run is not None:
+                self.export_run.cancel()
+            if self.outline_worker is not None:
+                self.outline_worker.stop()
+            if self.lint_worker is not None:
+                self.lint_worker.stop()
+            if self.workspace is not None:
+                self.workspace.stop()
+            if self.live_pusher is not None:
+                self.live_pusher.stop()
+            if self.preview_server is not None:
+                self.preview_server.stop()
             print("Web Viewer closed.")
         except Exception as e:
             print(f"Error: {e}")
             messagebox.showerror("❌ Error", f"Error running program: {str(e)}")
 
 def main():
+    if not WEBVIEW_AVAILABLE:
+        print("Uyarı: pywebview kütüphanesi bulunamadı. Tarayıcıda açma modu kullanılacak.")
+    profile = None
+    if '--profile-startup' in sys.argv[1:]:
+        profile = StartupProfile(STARTUP_STARTED)
+        profile.mark('imports')
     try:
         print("Program starting...")
         root = tk.Tk()
-        app = WebViewer(root)
+        if profile is not None:
+            profile.mark('tk root')
+        app = WebViewer(root, profile)
         app.run()
     except Exception as e:
         print(f"Critical error: {e}")
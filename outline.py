@@ -0,0 +1,439 @@
+"""Belge ana hattı - HTML öğe ağacı (satır aralıkları), katlama ve mini harita paneli"""
+import bisect
+import itertools
+import re
+import tkinter as tk
+from html.parser import HTMLParser
+from tkinter import ttk
+
+from html_check import VOID_TAGS
+
+_NEWLINE = re.compile('\n')
+
+# Ağaçta bir düğüm açılınca en fazla bu kadar çocuk eklenir
+MAX_TREE_CHILDREN = 2000
+
+
+class OutlineNode:
+    """An element and the lines it spans (``end`` is None while open)"""
+
+    __slots__ = ('tag', 'label', 'start', 'end', 'depth', 'parent', 'children')
+
+    def __init__(self, tag, label, start, depth, parent):
+        self.tag = tag
+        self.label = label
+        self.start = start
+        self.end = None
+        self.depth = depth
+        self.parent = parent  # Ebeveyn düğümün indeksi, kökte -1
+        self.children = []
+
+    def copy(self):
+        node = OutlineNode(self.tag, self.label, self.start, self.depth, self.parent)
+        node.end = self.end
+        node.children = list(self.children)
+        return node
+
+
+def _label(tag, attrs):
+    label = tag
+    for name, value in attrs:
+        if name == 'id' and value:
+            label += f"#{value}"
+        elif name == 'class' and value:
+            label += '.' + '.'.join(value.split()[:2])
+    return label
+
+
+class _OutlineParser(HTMLParser):
+    """Builds nodes into an OutlineIndex, starting at a checkpoint"""
+
+    def __init__(self, index, stack, line, column):
+        super().__init__(convert_charrefs=False)
+        self.index = index
+        self.stack = stack
+        self.line = line - 1  # Beslenen metnin 1. satırı belgenin bu satırı
+        self.column = column  # ... ve ilk satırı bu sütundan başlar
+
+    def _position(self):
+        line, column = self.getpos()
+        return line + self.line, column + (self.column if line == 1 else 0)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        index = self.index
+        line, column = self._position()
+        # Buradan yeniden başlanabilir: etiket sınırı, öncesi bu düğüm sayısı ve yığın
+        index.checkpoints.append((line, index.line_starts[line - 1] + column,
+                                  len(index.nodes), tuple(self.stack)))
+        parent = self.stack[-1] if self.stack else -1
+        node_id = len(index.nodes)
+        index.nodes.append(OutlineNode(tag, _label(tag, attrs), line, len(self.stack), parent))
+        if parent >= 0:
+            index.nodes[parent].children.append(node_id)
+        else:
+            index.roots.append(node_id)
+        self.stack.append(node_id)
+
+    def handle_endtag(self, tag):
+        nodes = self.index.nodes
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if nodes[self.stack[depth]].tag == tag:
+                break
+        else:
+            return  # Eşleşmeyen kapanış - yoksay
+        line = self._position()[0]
+        for node_id in self.stack[depth:]:
+            nodes[node_id].end = line
+        del self.stack[depth:]
+
+
+def _open_comment(text, end):
+    """Offset of a ``<!--`` still unterminated at ``end``, or None
+
+    Comments are paired in order, so the result is never after the one the
+    parser sees as open (a ``<!--`` inside a script only makes it earlier).
+    """
+    start = text.find('<!--', 0, end)
+    while start >= 0:
+        close = text.find('-->', start + 4, end)
+        if close < 0:
+            return start
+        start = text.find('<!--', close + 3, end)
+    return None
+
+
+class OutlineIndex:
+    """Element tree of an HTML document as line ranges
+
+    ``nodes`` are in document order; each knows its parent and children
+    by index. While parsing, a checkpoint (position, node count, open
+    element stack) is stored at every start tag, so after an edit
+    ``update()`` keeps everything before the last checkpoint above the
+    first changed line (or above a comment still open there) and only
+    re-parses from there.
+
+    ``update()`` returns a new index that shares the untouched nodes;
+    open elements are copied before they change.
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self.roots = []
+        self.checkpoints = []  # (satır, karakter ofseti, düğüm sayısı, yığın)
+        self.line_starts = [0]
+        self.line_count = 1
+        self.reparsed_from = 1  # Son güncellemede ayrıştırmanın başladığı satır
+
+    @classmethod
+    def build(cls, text):
+        return cls()._parse(text, 0, 1, 0, [])
+
+    def update(self, text, first_changed_line=None):
+        """Index of ``text``, re-parsing only from ``first_changed_line`` on"""
+        if first_changed_line is None or not self.checkpoints:
+            return OutlineIndex.build(text)
+        # Değişen satırdan önce açılıp kapanmamış yorum: ayrıştırma yorumun başından değişir
+        # (değişiklikten önceki metin eski ve yeni sürümde aynı)
+        end = self.line_starts[first_changed_line - 1] \
+            if first_changed_line <= len(self.line_starts) else len(text)
+        comment = _open_comment(text, end)
+        if comment is not None:
+            first_changed_line = min(first_changed_line, bisect.bisect_right(self.line_starts, comment))
+        position = bisect.bisect_left(self.checkpoints, (first_changed_line,)) - 1
+        if position < 0:
+            return OutlineIndex.build(text)
+        line, offset, count, stack = self.checkpoints[position]
+        index = OutlineIndex()
+        index.nodes = self.nodes[:count]
+        index.roots = [node_id for node_id in self.roots if node_id < count]
+        index.checkpoints = self.checkpoints[:position]
+        index.line_starts = self.line_starts[:line]
+        # Açık kalan öğeler değişecek - paylaşılan düğümleri kopyala
+        for node_id in stack:
+            node = index.nodes[node_id].copy()
+            node.end = None
+            node.children = [child for child in node.children if child < count]
+            index.nodes[node_id] = node
+        column = offset - index.line_starts[line - 1]
+        return index._parse(text, offset, line, column, list(stack))
+
+    def _parse(self, text, offset, line, column, stack):
+        self.line_starts.extend(match.end() for match in _NEWLINE.finditer(text, offset))
+        self.line_count = len(self.line_starts)
+        self.reparsed_from = line
+        parser = _OutlineParser(self, stack, line, column)
+        parser.feed(text[offset:])
+        parser.close()
+        for node_id in parser.stack:
+            self.nodes[node_id].end = self.line_count  # Kapanmamış - belge sonuna kadar
+        return self
+
+    def innermost_at(self, line, foldable=True):
+        """Deepest node whose range contains ``line`` (multi-line only if ``foldable``)"""
+        best = None
+        candidates = self.roots
+        while candidates:
+            position = bisect.bisect_right([self.nodes[i].start for i in candidates], line) - 1
+            found = None
+            # Kardeşler sıralı; satırı içeren en yakın öncekiler arasında
+            while position >= 0:
+                node = self.nodes[candidates[position]]
+                if node.start <= line <= (node.end or node.start):
+                    found = candidates[position]
+                    break
+                if node.end is not None and node.end < line:
+                    break
+                position -= 1
+            if found is None:
+                break
+            node = self.nodes[found]
+            if not foldable or node.end > node.start:
+                best = found
+            candidates = node.children
+        return best
+
+
+def outline_index(text, previous=None, first_changed_line=None):
+    """Outline of ``text`` - an update of ``previous`` when there is one (KeyedWorker job)"""
+    if previous is None:
+        return OutlineIndex.build(text)
+    return previous.update(text, first_changed_line)
+
+
+# --- Katlama ----------------------------------------------------------------
+
+_fold_ids = itertools.count(1)
+FOLD_PREFIX = 'fold:'
+
+
+def fold_lines(text, first, last):
+    """Hide lines ``first+1 .. last`` of a Text, keeping ``first`` visible
+
+    Every fold is its own elided tag, so nested folds survive when an
+    outer one is opened, and the range moves with the text as it is
+    edited.
+    """
+    if last <= first:
+        return None
+    name = f"{FOLD_PREFIX}{next(_fold_ids)}"
+    text.tag_configure(name, elide=True)
+    text.tag_configure('fold_header', background='#1e3a5f')
+    text.tag_add(name, f"{first}.0 lineend", f"{last}.0 lineend")
+    text.tag_add('fold_header', f"{first}.0", f"{first}.0 lineend")
+    return name
+
+
+def fold_tags(text):
+    return [name for name in text.tag_names() if name.startswith(FOLD_PREFIX)]
+
+
+def unfold(text, name):
+    ranges = text.tag_ranges(name)
+    if ranges:
+        text.tag_remove('fold_header', f"{ranges[0]} linestart", ranges[0])
+    text.tag_delete(name)
+
+
+def unfold_at(text, line):
+    """Open the folds whose header or hidden part is on ``line``; returns how many"""
+    opened = 0
+    for name in fold_tags(text):
+        ranges = text.tag_ranges(name)
+        if not ranges:
+            text.tag_delete(name)
+            continue
+        first = int(str(ranges[0]).split('.')[0])
+        last = int(str(ranges[1]).split('.')[0])
+        if first <= line <= last:
+            unfold(text, name)
+            opened += 1
+    return opened
+
+
+def folded_at(text, line):
+    """Name of the fold whose visible header is ``line``, or None"""
+    for name in text.tag_names(f"{line}.0 lineend"):
+        if name.startswith(FOLD_PREFIX) and text.compare(f"{name}.first", '==', f"{line}.0 lineend"):
+            return name
+    return None
+
+
+def reveal(text, line):
+    """Open every fold hiding ``line`` (before jumping to it)"""
+    for name in text.tag_names(f"{line}.0"):
+        if name.startswith(FOLD_PREFIX):
+            unfold(text, name)
+
+
+def unfold_all(text):
+    for name in fold_tags(text):
+        text.tag_delete(name)
+    text.tag_remove('fold_header', '1.0', tk.END)
+
+
+# --- Panel ------------------------------------------------------------------
+
+_TAG_COLORS = ('#60a5fa', '#a78bfa', '#34d399', '#fbbf24', '#f472b6', '#22d3ee', '#fb7185')
+
+
+class OutlinePanel(tk.Frame):
+    """Outline tree plus a minimap of element ranges for the current tab
+
+    Tree items are created lazily (children when a node is opened), so a
+    page with tens of thousands of elements shows up immediately.
+    ``on_jump(line)`` moves the editor; ``on_fold(node)`` / ``on_unfold_all``
+    are the panel's fold buttons.
+    """
+
+    minimap_width = 70
+
+    def __init__(self, parent, on_jump, on_fold, on_unfold_all, on_close, **kwargs):
+        super().__init__(parent, bg='#1a1a1a', width=320, **kwargs)
+        self.on_jump = on_jump
+        self.on_fold = on_fold
+        self.index = None
+        self.viewport = (1, 1)
+
+        header = tk.Frame(self, bg='#1a1a1a')
+        header.pack(fill=tk.X, padx=5, pady=(5, 0))
+        self.summary = tk.Label(header, text="🧭 Outline", font=('Segoe UI', 10, 'bold'),
+                                bg='#1a1a1a', fg='#ffffff', anchor='w')
+        self.summary.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        for text, command in (("✕", on_close), ("⊞ Unfold all", on_unfold_all),
+                              ("⊟ Fold", self._fold_selected)):
+            tk.Button(header, text=text, command=command, bg='#333333', fg='#ffffff',
+                      relief='flat', bd=0, padx=6, cursor='hand2').pack(side=tk.RIGHT, padx=2)
+
+        body = tk.Frame(self, bg='#1a1a1a')
+        body.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.minimap = tk.Canvas(body, width=self.minimap_width, bg='#111111',
+                                 highlightthickness=0, cursor='hand2')
+        self.minimap.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
+        self.minimap.bind('<Button-1>', self._minimap_click)
+        self.minimap.bind('<B1-Motion>', self._minimap_click)
+        self.minimap.bind('<Configure>', lambda e: self.draw_minimap())
+        self.tree = ttk.Treeview(body, show='tree', selectmode='browse')
+        scrollbar = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind('<<TreeviewOpen>>', self._expand)
+        self.tree.bind('<<TreeviewSelect>>', self._select)
+        self.tree.bind('<Double-1>', lambda e: self._fold_selected())
+
+    def show(self, index, seconds=None):
+        """Display a new index; open items and the selection are kept by line"""
+        opened = {self.index.nodes[int(item)].start for item in self._open_items()} \
+            if self.index is not None else set()
+        self.index = index
+        self.tree.delete(*self.tree.get_children())
+        self._insert_children('', index.roots)
+        if opened:
+            self._reopen(opened)
+        text = f"🧭 {len(index.nodes):,} elements"
+        if seconds is not None:
+            text += f" · {seconds * 1000:.0f} ms"
+        self.summary.config(text=text)
+        self.draw_minimap()
+
+    def clear(self):
+        self.index = None
+        self.tree.delete(*self.tree.get_children())
+        self.minimap.delete('all')
+        self.summary.config(text="🧭 Outline")
+
+    def _open_items(self, parent=''):
+        for item in self.tree.get_children(parent):
+            if item.isdigit() and self.tree.item(item, 'open'):
+                yield item
+                yield from self._open_items(item)
+
+    def _reopen(self, lines, parent=''):
+        for item in self.tree.get_children(parent):
+            if item.isdigit() and self.index.nodes[int(item)].start in lines:
+                self.tree.item(item, open=True)
+                self._fill(item)
+                self._reopen(lines, item)
+
+    def _insert_children(self, parent, node_ids):
+        nodes = self.index.nodes
+        for node_id in node_ids[:MAX_TREE_CHILDREN]:
+            node = nodes[node_id]
+            span = f"  {node.start}" if node.end == node.start else f"  {node.start}–{node.end}"
+            item = self.tree.insert(parent, tk.END, iid=str(node_id), text=node.label + span)
+            if node.children:
+                self.tree.insert(item, tk.END, iid=f"{node_id}:lazy", text="…")
+        if len(node_ids) > MAX_TREE_CHILDREN:
+            self.tree.insert(parent, tk.END, iid=f"{parent}:more",
+                             text=f"… {len(node_ids) - MAX_TREE_CHILDREN:,} more")
+
+    def _fill(self, item):
+        lazy = f"{item}:lazy"
+        if self.tree.exists(lazy):
+            self.tree.delete(lazy)
+            self._insert_children(item, self.index.nodes[int(item)].children)
+
+    def _expand(self, event=None):
+        item = self.tree.focus()
+        if item.isdigit():
+            self._fill(item)
+
+    def _selected_node(self):
+        selection = self.tree.selection()
+        if not selection or not selection[0].isdigit() or self.index is None:
+            return None
+        return self.index.nodes[int(selection[0])]
+
+    def _select(self, event=None):
+        node = self._selected_node()
+        if node is not None:
+            self.on_jump(node.start)
+
+    def _fold_selected(self):
+        node = self._selected_node()
+        if node is not None:
+            self.on_fold(node)
+
+    def set_viewport(self, first, last):
+        if (first, last) != self.viewport:
+            self.viewport = (first, last)
+            self._draw_viewport()
+
+    def draw_minimap(self):
+        """Element ranges as bars (indented by depth) scaled to the canvas"""
+        canvas = self.minimap
+        canvas.delete('all')
+        if self.index is None:
+            return
+        height = max(1, canvas.winfo_height())
+        scale = height / max(1, self.index.line_count)
+        for node in self.index.nodes:
+            if node.depth > 6:
+                continue
+            top = (node.start - 1) * scale
+            bottom = node.end * scale
+            if bottom - top < 2:
+                continue  # Bir pikselden küçük - çizme
+            x = 4 + node.depth * 9
+            canvas.create_rectangle(x, top, x + 5, bottom, width=0,
+                                    fill=_TAG_COLORS[hash(node.tag) % len(_TAG_COLORS)])
+        self._draw_viewport()
+
+    def _draw_viewport(self):
+        canvas = self.minimap
+        canvas.delete('viewport')
+        if self.index is None:
+            return
+        scale = max(1, canvas.winfo_height()) / max(1, self.index.line_count)
+        first, last = self.viewport
+        canvas.create_rectangle(1, (first - 1) * scale, self.minimap_width - 1,
+                                max((first - 1) * scale + 3, last * scale),
+                                outline='#ffffff', tags='viewport')
+
+    def _minimap_click(self, event):
+        if self.index is None:
+            return
+        fraction = min(1.0, max(0.0, event.y / max(1, self.minimap.winfo_height())))
+        self.on_jump(max(1, int(fraction * self.index.line_count)))
@@ -0,0 +1,141 @@
+"""Performans ölçümü - zamanlayıcılar, sayaçlar, halka tampon ve Chrome trace çıktısı"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PerfRecorder:
+    """Lightweight, thread-safe recorder of timed spans and counters
+
+    Every span is appended to a fixed-size ring buffer (oldest entries
+    drop out), so recording costs two ``perf_counter`` calls and an
+    append no matter how long the editor runs. The last ``samples``
+    durations of each span name are also kept for percentiles (the HUD).
+    ``chrome_trace()`` turns the buffer into the Trace Event Format that
+    chrome://tracing and Perfetto load.
+    """
+
+    def __init__(self, capacity=100000, samples=1000):
+        self.events = deque(maxlen=capacity)  # (faz, ad, kategori, başlangıç, süre, thread, args)
+        self.counters = {}
+        self.origin = time.perf_counter()
+        self.enabled = True
+        self._samples = {}  # ad -> süreler (ms)
+        self._sample_size = samples
+        self._threads = {}  # thread id -> ad (thread bitince de trace'te görünsün)
+        self._lock = threading.Lock()
+
+    def record(self, name, start, end, category='app', args=None):
+        """Record a span that ran from ``start`` to ``end`` (perf_counter seconds)"""
+        if not self.enabled:
+            return
+        ident = threading.get_ident()
+        with self._lock:
+            if ident not in self._threads:
+                self._remember_thread(ident)
+            self.events.append(('X', name, category, start, end - start, ident, args))
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self._sample_size)
+            samples.append((end - start) * 1000)
+
+    def count(self, name, value=1):
+        """Add ``value`` to a counter (shown as a counter track in the trace)"""
+        if not self.enabled:
+            return
+        ident = threading.get_ident()
+        with self._lock:
+            if ident not in self._threads:
+                self._remember_thread(ident)
+            total = self.counters[name] = self.counters.get(name, 0) + value
+            self.events.append(('C', name, 'counter', time.perf_counter(), 0, ident, {'value': total}))
+
+    def _remember_thread(self, ident):
+        if len(self._threads) > 4096:
+            self._threads.clear()  # İstek başına thread açan sunucu - sınırsız büyümesin
+        self._threads[ident] = threading.current_thread().name
+
+    @contextmanager
+    def span(self, name, category='app', **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter(), category, args or None)
+
+    def timed(self, name=None, category='app'):
+        """Decorator recording every call of a function as a span"""
+
+        def decorate(func):
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(label, start, time.perf_counter(), category)
+
+            return wrapper
+
+        return decorate
+
+    def percentiles(self, name):
+        """``(p50, p99, count)`` in ms over the recent samples of ``name``, or None"""
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return None
+        return (samples[len(samples) // 2],
+                samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+                len(samples))
+
+    def names(self):
+        with self._lock:
+            return sorted(self._samples)
+
+    def chrome_trace(self):
+        """The ring buffer as a Trace Event Format dict"""
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self._threads)
+        pid = os.getpid()
+        tids = {}
+        trace = []
+        for phase, name, category, start, duration, ident, args in events:
+            tid = tids.get(ident)
+            if tid is None:
+                tid = tids[ident] = len(tids) + 1
+                trace.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                              'args': {'name': thread_names.get(ident, f"thread-{ident}")}})
+            event = {'name': name, 'cat': category, 'ph': phase, 'pid': pid, 'tid': tid,
+                     'ts': round((start - self.origin) * 1e6, 1)}
+            if phase == 'X':
+                event['dur'] = round(duration * 1e6, 1)
+            if args:
+                event['args'] = args
+            trace.append(event)
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        """Write ``chrome_trace()`` as JSON; returns the number of events"""
+        from file_io import atomic_write  # file_io bu modülü içe aktarır
+
+        trace = self.chrome_trace()
+        atomic_write(path, json.dumps(trace))
+        return len(trace['traceEvents'])
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self._samples.clear()
+            self.counters.clear()
+
+
+# Uygulama genelinde tek kayıtçı
+recorder = PerfRecorder()
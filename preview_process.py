@@ -0,0 +1,223 @@
+"""Önizleme işlemi - pywebview penceresini ayrı bir süreçte çalıştırır"""
+import multiprocessing
+import threading
+import time
+
+# Tk ile çatallanmış (fork) süreç güvenli değil - her zaman spawn kullan
+_mp = multiprocessing.get_context('spawn')
+
+# close() sonrası bu kadar saniyede çıkmayan renderer sonlandırılır
+CLOSE_TIMEOUT = 1.0
+# Kapatılmış, çıkması beklenen süreçler: (süreç, son tarih) - reap_closed() toplar
+_closing = []
+
+
+class _Bridge:
+    """``window.pywebview.api`` of a renderer: page events sent up the pipe"""
+
+    def __init__(self, send):
+        self._send = send
+
+    def scrolled(self, fraction):
+        self._send('scroll', float(fraction))
+
+
+def _renderer_main(conn, options):
+    """Child process entry point: own the webview GUI loop"""
+    try:
+        import webview
+    except ImportError as e:
+        conn.send(('error', f"pywebview not available: {e}"))
+        conn.close()
+        return
+
+    send_lock = threading.Lock()
+
+    def send(*message):
+        with send_lock:
+            try:
+                conn.send(message)
+            except (OSError, EOFError):
+                pass
+
+    if options.pop('bridge', False):
+        options['js_api'] = _Bridge(send)
+    try:
+        window = webview.create_window(**options)
+    except Exception as e:
+        conn.send(('error', str(e)))
+        conn.close()
+        return
+
+    window.events.closed += lambda: send('closed')
+    # perf_counter süreçler arasında ortak (monoton saat) - gidiş-dönüş ölçümü için
+    window.events.loaded += lambda: send('loaded', time.perf_counter())
+
+    def command_loop():
+        send('ready')
+        while True:
+            try:
+                command, kwargs = conn.recv()
+            except (EOFError, OSError):
+                # Editör kapandı - pencereyi de kapat
+                command, kwargs = 'close', {}
+            if command == 'close':
+                try:
+                    window.destroy()
+                except Exception as e:  # Pencere zaten kapanmış olabilir - yine de çık
+                    send('error', f"close: {e}")
+                break
+            try:
+                if command == 'load_url':
+                    window.load_url(kwargs['url'])
+                elif command == 'reload':
+                    window.evaluate_js('location.reload()')
+                elif command == 'evaluate_js':
+                    window.evaluate_js(kwargs['script'])
+                elif command == 'set_title':
+                    window.set_title(kwargs['title'])
+                elif command == 'move':
+                    window.move(kwargs['x'], kwargs['y'])
+                elif command == 'resize':
+                    window.resize(kwargs['width'], kwargs['height'])
+                elif command == 'hide':
+                    window.hide()
+                elif command == 'show':
+                    window.show()
+            except Exception as e:
+                send('error', f"{command}: {e}")
+
+    webview.start(command_loop, debug=False)
+
+
+def reap_closed(wait=False):
+    """Join renderers handed over by ``close()``; returns how many still run
+
+    Without ``wait`` this never blocks, so the editor calls it from its
+    poll loops: exited processes are reaped (no zombies) and ones still
+    running ``CLOSE_TIMEOUT`` after ``close()`` are terminated. With
+    ``wait`` (editor exit) it waits for each of them up to that deadline.
+    """
+    remaining = []
+    for process, deadline in _closing:
+        if wait:
+            process.join(max(0.0, deadline - time.monotonic()))
+        if process.is_alive() and time.monotonic() >= deadline:
+            process.terminate()
+            if wait:
+                process.join(CLOSE_TIMEOUT)
+        if process.is_alive():
+            remaining.append((process, deadline))
+    _closing[:] = remaining
+    return len(remaining)
+
+
+class PreviewProcess:
+    """A preview window running in its own process
+
+    The editor talks to it over a ``multiprocessing`` pipe: commands go
+    down (``load_url``, ``reload``, ``set_title``, ``move``, ``resize``,
+    ``hide``, ``show``, ``close``) and events
+    come back (``ready``, ``loaded``, ``closed``, ``error``). A renderer
+    crash only ends this process; the editor notices it via ``poll``.
+
+    With ``bridge=True`` the page can call ``window.pywebview.api``
+    (see ``_Bridge``); those calls arrive as events too (``scroll``).
+    """
+
+    def __init__(self, url, **window_options):
+        self.url = url
+        self.options = dict(window_options, url=url)
+        self.process = None
+        self.conn = None
+        self.ready = False  # GUI döngüsü başladı mı
+        self.closed = False
+
+    def start(self):
+        parent_conn, child_conn = _mp.Pipe()
+        self.process = _mp.Process(target=_renderer_main,
+                                   args=(child_conn, self.options),
+                                   name="preview-renderer", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        return self
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive() and not self.closed
+
+    def send(self, command, **kwargs):
+        if not self.is_alive():
+            return False
+        try:
+            self.conn.send((command, kwargs))
+            return True
+        except (OSError, EOFError):
+            return False
+
+    def load_url(self, url):
+        self.url = url
+        return self.send('load_url', url=url)
+
+    def reload(self):
+        return self.send('reload')
+
+    def evaluate_js(self, script):
+        return self.send('evaluate_js', script=script)
+
+    def set_title(self, title):
+        return self.send('set_title', title=title)
+
+    def move(self, x, y):
+        return self.send('move', x=x, y=y)
+
+    def resize(self, width, height):
+        return self.send('resize', width=width, height=height)
+
+    def hide(self):
+        return self.send('hide')
+
+    def show(self):
+        return self.send('show')
+
+    def close(self):
+        """Ask the renderer to close without waiting for it
+
+        The pipe is closed and the process handed to ``reap_closed()``,
+        which joins it once it has exited.
+        """
+        self.send('close')
+        self.closed = True
+        if self.process is not None:
+            _closing.append((self.process, time.monotonic() + CLOSE_TIMEOUT))
+            self.process = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def poll(self):
+        """Return pending events without blocking
+
+        A process that died without reporting ``closed`` yields a
+        ``('crashed', exitcode)`` event.
+        """
+        events = []
+        if self.conn is None:
+            return events
+        try:
+            while self.conn.poll():
+                event = self.conn.recv()
+                events.append(event)
+                if event[0] == 'ready':
+                    self.ready = True
+                elif event[0] == 'closed':
+                    self.closed = True
+        except (EOFError, OSError):
+            pass
+        if not self.closed and self.process is not None and not self.process.is_alive():
+            self.closed = True
+            if self.process.exitcode:
+                events.append(('crashed', self.process.exitcode))
+            else:
+                events.append(('closed',))
+        return events
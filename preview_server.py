@@ -0,0 +1,377 @@
+"""Yerel önizleme sunucusu - açık sekmelerin içeriğini bellekten sunar"""
+import json
+import os
+import queue
+import re
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit, unquote
+
+from asset_cache import AssetCache, resolve_asset
+from perf import recorder
+
+
+# Sayfaya enjekte edilen canlı yenileme istemcisi (Server-Sent Events)
+LIVE_CLIENT_JS = """
+(function () {
+  if (!window.EventSource) return;
+  var source = new EventSource('/events/' + %(preview_id)s);
+  function morph(oldNode, newNode) {
+    if (oldNode.nodeType !== newNode.nodeType || oldNode.nodeName !== newNode.nodeName) {
+      oldNode.parentNode.replaceChild(newNode.cloneNode(true), oldNode);
+      return;
+    }
+    if (oldNode.nodeType === 3 || oldNode.nodeType === 8) {
+      if (oldNode.nodeValue !== newNode.nodeValue) oldNode.nodeValue = newNode.nodeValue;
+      return;
+    }
+    if (oldNode.nodeType !== 1) return;
+    var i, attr;
+    for (i = oldNode.attributes.length - 1; i >= 0; i--) {
+      attr = oldNode.attributes[i];
+      if (!newNode.hasAttribute(attr.name)) oldNode.removeAttribute(attr.name);
+    }
+    for (i = 0; i < newNode.attributes.length; i++) {
+      attr = newNode.attributes[i];
+      if (oldNode.getAttribute(attr.name) !== attr.value) oldNode.setAttribute(attr.name, attr.value);
+    }
+    morphChildren(oldNode, newNode);
+  }
+  function morphChildren(oldParent, newParent) {
+    var oldKids = Array.prototype.slice.call(oldParent.childNodes);
+    var newKids = Array.prototype.slice.call(newParent.childNodes);
+    for (var i = 0; i < newKids.length; i++) {
+      if (i < oldKids.length) morph(oldKids[i], newKids[i]);
+      else oldParent.appendChild(newKids[i].cloneNode(true));
+    }
+    for (var j = oldKids.length - 1; j >= newKids.length; j--) oldParent.removeChild(oldKids[j]);
+  }
+  function applyStyles(styles) {
+    var nodes = document.querySelectorAll('style');
+    if (nodes.length !== styles.length) { location.reload(); return; }
+    for (var i = 0; i < nodes.length; i++) {
+      if (nodes[i].textContent !== styles[i]) nodes[i].textContent = styles[i];
+    }
+  }
+  source.onmessage = function (event) {
+    var msg = JSON.parse(event.data);
+    if (msg.type === 'reload') { location.reload(); return; }
+    if (msg.styles) applyStyles(msg.styles);
+    if (msg.type === 'body') {
+      var template = document.createElement('body');
+      template.innerHTML = msg.html;
+      morphChildren(document.body, template);
+    }
+  };
+})();
+"""
+
+# Duyarlı matris: sekmeyi sabit boyutlu bir iframe'de gösterip pencereye sığdıran sarmalayıcı
+VIEWPORT_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>%(width)d x %(height)d</title>
+<style>
+html, body { margin: 0; height: 100%%; overflow: hidden; background: #e5e7eb; }
+iframe { border: 0; width: %(width)dpx; height: %(height)dpx; transform-origin: 0 0; background: #fff; }
+</style></head>
+<body><iframe id="page" src="%(src)s"></iframe>
+<script>
+(function () {
+  var frame = document.getElementById('page'), width = %(width)d;
+  var quietUntil = 0, pending = false;
+  function fit() {
+    frame.style.transform = 'scale(' + Math.min(1, innerWidth / width) + ')';
+  }
+  function fraction(w) {
+    var max = w.document.documentElement.scrollHeight - w.innerHeight;
+    return max > 0 ? w.scrollY / max : 0;
+  }
+  frame.addEventListener('load', function () {
+    var w = frame.contentWindow;
+    w.addEventListener('scroll', function () {
+      if (pending || Date.now() < quietUntil) return;
+      pending = true;
+      requestAnimationFrame(function () {
+        pending = false;
+        if (window.pywebview && window.pywebview.api) window.pywebview.api.scrolled(fraction(w));
+      });
+    }, {passive: true});
+  });
+  window.syncScroll = function (f) {
+    var w = frame.contentWindow;
+    var max = w.document.documentElement.scrollHeight - w.innerHeight;
+    quietUntil = Date.now() + 200;
+    w.scrollTo(0, f * max);
+  };
+  addEventListener('resize', fit);
+  fit();
+})();
+</script></body></html>
+"""
+
+_HEAD_OPEN_RE = re.compile(r'<head\b[^>]*>', re.IGNORECASE)
+
+
+def inject_live_client(content, preview_id):
+    """Insert the live-reload client right after <head> (or at the top)"""
+    script = ('<script data-live-reload>'
+              + LIVE_CLIENT_JS % {'preview_id': json.dumps(str(preview_id))}
+              + '</script>')
+    match = _HEAD_OPEN_RE.search(content)
+    if match:
+        return content[:match.end()] + script + content[match.end():]
+    return script + content
+
+
+class PreviewServer:
+    """Loopback HTTP server serving in-memory tab contents
+
+    Every tab publishes its current buffer under ``/tab/<preview_id>/``.
+    Nothing is written to disk; the preview window simply navigates to
+    (or reloads) the tab URL. Open pages also subscribe to
+    ``/events/<preview_id>`` so edits can be pushed to them live.
+
+    Relative links resolve to ``/tab/<preview_id>/<path>``, which is served
+    from the document's own directory (``base_dir``) through an AssetCache
+    with ETag / 304 revalidation.
+
+    ``/viewport/<preview_id>?w=&h=`` shows the same document in an iframe
+    of that size, scaled to fit the window (the responsive matrix).
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, asset_cache=None):
+        self.host = host
+        self.port = port
+        self.assets = asset_cache or AssetCache()
+        self._documents = {}  # preview_id -> (title, bytes)
+        self._base_dirs = {}  # preview_id -> belgenin klasörü
+        self._subscribers = {}  # preview_id -> [queue.Queue]
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._httpd is not None
+
+    def start(self):
+        """Start the server thread (idempotent)"""
+        if self._httpd is not None:
+            return
+        server = self
+
+        class Handler(_PreviewRequestHandler):
+            preview_server = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name="preview-server", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the server thread"""
+        if self._httpd is None:
+            return
+        # Açık olay akışlarını kapat
+        with self._lock:
+            for subscribers in self._subscribers.values():
+                for q in subscribers:
+                    q.put(None)
+            self._subscribers.clear()
+        try:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        except Exception:
+            pass
+        self._httpd = None
+        self._thread = None
+
+    def publish(self, preview_id, content, title=None, base_dir=None):
+        """Store tab content in memory and return its URL
+
+        ``base_dir`` (kept until changed) is where relative assets are
+        looked up.
+        """
+        if isinstance(content, str):
+            data = inject_live_client(content, preview_id).encode('utf-8')
+        else:
+            data = content
+        with self._lock:
+            self._documents[str(preview_id)] = (title, data)
+        if base_dir is not None:
+            self.set_base_dir(preview_id, base_dir)
+        return self.url_for(preview_id)
+
+    def set_base_dir(self, preview_id, base_dir):
+        """Directory relative asset URLs of a tab are served from"""
+        with self._lock:
+            self._base_dirs[str(preview_id)] = base_dir
+
+    def unpublish(self, preview_id):
+        """Forget a tab (e.g. when it is closed)"""
+        with self._lock:
+            self._documents.pop(str(preview_id), None)
+            self._base_dirs.pop(str(preview_id), None)
+
+    def get_asset(self, preview_id, relpath):
+        """Cached Asset for a relative path of a tab, or None"""
+        with self._lock:
+            base_dir = self._base_dirs.get(str(preview_id))
+        path = resolve_asset(base_dir, relpath)
+        if path is None or not os.path.isfile(path):
+            return None
+        try:
+            return self.assets.get(path)
+        except OSError:
+            return None
+
+    def push(self, preview_id, message):
+        """Send a live-reload message to every page showing this tab"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(preview_id), ()))
+        for q in subscribers:
+            q.put(message)
+        return len(subscribers)
+
+    def has_subscribers(self, preview_id):
+        with self._lock:
+            return bool(self._subscribers.get(str(preview_id)))
+
+    def subscribe(self, preview_id):
+        q = queue.Queue()
+        with self._lock:
+            self._subscribers.setdefault(str(preview_id), []).append(q)
+        return q
+
+    def unsubscribe(self, preview_id, q):
+        with self._lock:
+            subscribers = self._subscribers.get(str(preview_id), [])
+            if q in subscribers:
+                subscribers.remove(q)
+            if not subscribers:
+                self._subscribers.pop(str(preview_id), None)
+
+    def get_document(self, preview_id):
+        with self._lock:
+            return self._documents.get(str(preview_id))
+
+    def url_for(self, preview_id):
+        return f"http://{self.host}:{self.port}/tab/{preview_id}/"
+
+    def viewport_url(self, preview_id, width, height):
+        return f"http://{self.host}:{self.port}/viewport/{preview_id}?w={width}&h={height}"
+
+
+class _PreviewRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for PreviewServer"""
+    preview_server = None
+    protocol_version = 'HTTP/1.1'
+    keepalive_interval = 15
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def _handle(self, send_body):
+        if not self._host_allowed():
+            # DNS rebinding: başka bir alan adına çözülmüş sayfa yerel dosyaları okuyamasın
+            self._send(403, 'text/plain; charset=utf-8', b'Forbidden', send_body)
+            return
+        parts = [unquote(p) for p in urlsplit(self.path).path.split('/') if p]
+        if len(parts) == 2 and parts[0] == 'events' and send_body:
+            self._stream_events(parts[1])
+            return
+        with recorder.span('preview.serve', 'preview', path=self.path):
+            self._route(parts, send_body)
+
+    def _host_allowed(self):
+        """Only ``127.0.0.1:<port>`` / ``localhost:<port>`` may be used to reach the server"""
+        port = self.preview_server.port
+        host = (self.headers.get('Host') or '').strip().lower()
+        return host in (f"127.0.0.1:{port}", f"localhost:{port}")
+
+    def _route(self, parts, send_body):
+        if len(parts) >= 2 and parts[0] == 'tab':
+            document = self.preview_server.get_document(parts[1])
+            if document is not None and len(parts) == 2:
+                self._send(200, 'text/html; charset=utf-8', document[1], send_body)
+                return
+            if len(parts) > 2:
+                self._send_asset(parts[1], '/'.join(parts[2:]), send_body)
+                return
+        if len(parts) == 2 and parts[0] == 'viewport' and self.preview_server.get_document(parts[1]):
+            self._send_viewport(parts[1], send_body)
+            return
+        self._send(404, 'text/plain; charset=utf-8', b'Not found', send_body)
+
+    def _send_asset(self, preview_id, relpath, send_body):
+        """Serve a file next to the document; 304 when the browser's copy is current"""
+        asset = self.preview_server.get_asset(preview_id, relpath)
+        if asset is None:
+            self._send(404, 'text/plain; charset=utf-8', b'Not found', send_body)
+            return
+        # Tarayıcı her seferinde doğrulasın (no-cache), değişmediyse gövde yok
+        headers = {'ETag': asset.etag, 'Cache-Control': 'no-cache'}
+        if asset.etag in self.headers.get('If-None-Match', ''):
+            self._send(304, asset.content_type, b'', False, headers)
+            return
+        self._send(200, asset.content_type, asset.data, send_body, headers)
+
+    def _send_viewport(self, preview_id, send_body):
+        query = parse_qs(urlsplit(self.path).query)
+        try:
+            width = min(4096, max(100, int(query.get('w', ['1280'])[0])))
+            height = min(4096, max(100, int(query.get('h', ['800'])[0])))
+        except ValueError:
+            self._send(400, 'text/plain; charset=utf-8', b'Bad viewport size', send_body)
+            return
+        page = VIEWPORT_PAGE % {'width': width, 'height': height,
+                                'src': f"/tab/{preview_id}/"}
+        self._send(200, 'text/html; charset=utf-8', page.encode('utf-8'), send_body)
+
+    def _stream_events(self, preview_id):
+        """Server-Sent Events stream of live-reload messages"""
+        q = self.preview_server.subscribe(preview_id)
+        self.close_connection = True
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-store')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.wfile.flush()
+            while True:
+                try:
+                    message = q.get(timeout=self.keepalive_interval)
+                except queue.Empty:
+                    self.wfile.write(b': ping\n\n')
+                    self.wfile.flush()
+                    continue
+                if message is None:
+                    break
+                self.wfile.write(b'data: ' + json.dumps(message).encode('utf-8') + b'\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            self.preview_server.unsubscribe(preview_id, q)
+
+    def _send(self, status, content_type, body, send_body=True, headers=None):
+        headers = dict(headers or {})
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', headers.pop('Cache-Control', 'no-store'))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Konsolu her istekte kirletme
+        pass
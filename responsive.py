@@ -0,0 +1,268 @@
+"""Duyarlı matris - geçerli sekmeyi birkaç görünüm alanı boyutunda yan yana gösterir"""
+import time
+import tkinter as tk
+import webbrowser
+
+from perf import recorder
+from split_preview import DockedRenderer, FrameThrottle
+
+DEFAULT_VIEWPORTS = ((360, 740), (768, 1024), (1280, 800), (1920, 1080))
+
+# Hücre başlığının yüksekliği (piksel)
+HEADER_HEIGHT = 26
+
+
+def default_height(width):
+    """A typical screen height for ``width``: phone/tablet portrait, desktop landscape"""
+    if width < 600:
+        return round(width * 37 / 18)  # 360 -> 740
+    if width < 1024:
+        return round(width * 4 / 3)
+    return round(width * 10 / 16)
+
+
+def parse_viewports(spec):
+    """``'360x740, 768, 1280x800'`` -> ``[(360, 740), (768, 1024), (1280, 800)]``"""
+    viewports = []
+    for item in spec.replace(';', ',').split(','):
+        item = item.strip().lower().replace('×', 'x')
+        if not item:
+            continue
+        width, _, height = item.partition('x')
+        width = int(width)
+        height = int(height) if height.strip() else default_height(width)
+        if not (100 <= width <= 4096 and 100 <= height <= 4096):
+            raise ValueError(f"viewport out of range: {item}")
+        viewports.append((width, height))
+    if not viewports:
+        raise ValueError("no viewports given")
+    return viewports
+
+
+def format_viewports(viewports):
+    return ', '.join(f"{width}x{height}" for width, height in viewports)
+
+
+class _Cell:
+    """One viewport of the matrix: header, thumbnail area and its renderer"""
+
+    __slots__ = ('size', 'frame', 'header', 'thumb', 'docked', 'requested')
+
+    def __init__(self, size, frame, header, thumb, docked):
+        self.size = size
+        self.frame = frame
+        self.header = header
+        self.thumb = thumb
+        self.docked = docked
+        self.requested = None  # Yükleme isteğinin zamanı
+
+
+class ResponsiveMatrix(tk.Toplevel):
+    """The current tab at several viewport sizes at once
+
+    Every viewport is a thumbnail cell covered by its own DockedRenderer,
+    so the pages load and lay out in parallel renderer processes. All of
+    them show ``/viewport/<id>`` of the same published document on the
+    one preview server - the page at the real viewport width, scaled down
+    to the cell - and edits reach every cell as live patches. With scroll
+    sync on, a scroll in one cell is relayed to the others as a fraction
+    of the page height.
+    """
+
+    fps = 10
+
+    def __init__(self, parent, server, pusher, viewports, webview_available, on_close=None):
+        super().__init__(parent, bg='#0a0a0a')
+        self.title("📱 Responsive Matrix - Web Viewer")
+        self.geometry(f"{int(self.winfo_screenwidth() * 0.8)}x{int(self.winfo_screenheight() * 0.8)}")
+        self.server = server
+        self.pusher = pusher
+        self.viewports = list(viewports)
+        self.webview_available = webview_available
+        self.on_close = on_close
+        self.preview_id = None
+        self.cells = []
+        self.sync_scroll = tk.BooleanVar(value=True)
+        self.throttle = FrameThrottle(self, self._render, self.fps)
+        self._poll_job = None
+
+        bar = tk.Frame(self, bg='#1a1a1a')
+        bar.pack(fill=tk.X)
+        tk.Label(bar, text="Viewports", font=('Segoe UI', 10, 'bold'),
+                 bg='#1a1a1a', fg='#ffffff').pack(side=tk.LEFT, padx=(10, 5), pady=8)
+        self.spec = tk.Entry(bar, width=40, font=('Cascadia Code', 10), bg='#2a2a2a', fg='#ffffff',
+                             insertbackground='#60a5fa', relief='flat')
+        self.spec.insert(0, format_viewports(self.viewports))
+        self.spec.pack(side=tk.LEFT, padx=5, ipady=3)
+        self.spec.bind('<Return>', lambda e: self.apply_viewports())
+        tk.Button(bar, text="Apply", command=self.apply_viewports, bg='#3b82f6', fg='#ffffff',
+                  relief='flat', bd=0, padx=10, cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(bar, text="🔗 Sync scroll", variable=self.sync_scroll, bg='#1a1a1a',
+                       fg='#ffffff', selectcolor='#2a2a2a', activebackground='#1a1a1a',
+                       activeforeground='#ffffff').pack(side=tk.LEFT, padx=10)
+        self.status = tk.Label(bar, text="", font=('Segoe UI', 9), bg='#1a1a1a', fg='#a0a0a0')
+        self.status.pack(side=tk.RIGHT, padx=10)
+
+        self.grid_frame = tk.Frame(self, bg='#0a0a0a')
+        self.grid_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # Pencere taşınınca / boyutlanınca renderer pencereleri hücreleri izler
+        self.bind('<Configure>', lambda e: self.sync_cells(), add='+')
+        self.bind('<Unmap>', self._on_unmap, add='+')
+        self.bind('<Map>', self._on_map, add='+')
+        self.protocol('WM_DELETE_WINDOW', self.close)
+        self.build_cells()
+
+    def build_cells(self):
+        """(Re)create one cell per viewport in a grid of up to three columns"""
+        for cell in self.cells:
+            if cell.docked is not None:
+                cell.docked.close()
+            cell.frame.destroy()
+        self.cells = []
+        columns = min(len(self.viewports), 2 if len(self.viewports) <= 4 else 3)
+        rows = (len(self.viewports) + columns - 1) // columns
+        for column in range(3):
+            self.grid_frame.columnconfigure(column, weight=1 if column < columns else 0,
+                                            uniform='cell')
+        for row in range(rows):
+            self.grid_frame.rowconfigure(row, weight=1, uniform='cell')
+        for position, size in enumerate(self.viewports):
+            frame = tk.Frame(self.grid_frame, bg='#0a0a0a')
+            frame.grid(row=position // columns, column=position % columns, sticky='nsew',
+                       padx=5, pady=5)
+            header = tk.Label(frame, text=f"{size[0]} × {size[1]}", font=('Segoe UI', 9, 'bold'),
+                              bg='#0a0a0a', fg='#a0a0a0', anchor='w')
+            header.place(x=0, y=0, relwidth=1, height=HEADER_HEIGHT)
+            thumb = tk.Frame(frame, bg='#ffffff')
+            docked = None
+            if self.webview_available:
+                docked = DockedRenderer(thumb, title=f"Viewport {size[0]}x{size[1]}", bridge=True)
+            else:
+                tk.Button(thumb, text="🌐 Open in browser", relief='flat', bg='#3b82f6',
+                          fg='#ffffff', cursor='hand2',
+                          command=lambda size=size: self.open_in_browser(size)).pack(expand=True)
+            cell = _Cell(size, frame, header, thumb, docked)
+            frame.bind('<Configure>', lambda e, cell=cell: self.fit_cell(cell))
+            self.cells.append(cell)
+        if self.preview_id is not None:
+            self.show(self.preview_id)
+
+    def fit_cell(self, cell):
+        """Largest thumbnail of the viewport's aspect ratio that fits the cell"""
+        width, height = cell.size
+        available_width = cell.frame.winfo_width()
+        available_height = cell.frame.winfo_height() - HEADER_HEIGHT
+        if available_width < 20 or available_height < 20:
+            return
+        scale = min(1.0, available_width / width, available_height / height)
+        cell.thumb.place(x=0, y=HEADER_HEIGHT, width=max(1, int(width * scale)),
+                         height=max(1, int(height * scale)))
+        cell.header.config(text=f"{width} × {height}  ·  {scale * 100:.0f}%")
+        if cell.docked is not None:
+            cell.frame.after_idle(cell.docked.sync)
+
+    def sync_cells(self):
+        for cell in self.cells:
+            if cell.docked is not None:
+                cell.docked.sync()
+
+    def apply_viewports(self):
+        try:
+            viewports = parse_viewports(self.spec.get())
+        except ValueError as e:
+            self.status.config(text=f"⚠️ {e}")
+            return
+        if viewports != self.viewports:
+            self.viewports = viewports
+            self.build_cells()
+        self.spec.delete(0, tk.END)
+        self.spec.insert(0, format_viewports(self.viewports))
+
+    def show(self, preview_id):
+        """Load a published tab into every viewport (renderers start in parallel)"""
+        self.throttle.cancel()
+        self.preview_id = preview_id
+        now = time.perf_counter()
+        for cell in self.cells:
+            if cell.docked is not None:
+                cell.requested = now
+                cell.docked.load(self.server.viewport_url(preview_id, *cell.size))
+        self.status.config(text=f"⏳ Loading {len(self.cells)} viewports...")
+        if self._poll_job is None and self.webview_available:
+            self._poll_job = self.after(50, self._poll)
+
+    def open_in_browser(self, size):
+        if self.preview_id is not None:
+            webbrowser.open(self.server.viewport_url(self.preview_id, *size))
+
+    def request_render(self, preview_id, get_content, title=None):
+        """Edits of the shown tab, pushed at most ``fps`` times a second"""
+        if preview_id == self.preview_id:
+            self.throttle.request(preview_id, get_content, title)
+
+    def _render(self, preview_id, get_content, title=None):
+        if preview_id == self.preview_id:
+            # Tek yayın - sunucu farkı tüm görünüm alanlarına aynı anda iter
+            self.pusher.submit(preview_id, get_content(), title, time.perf_counter())
+
+    def _poll(self):
+        self._poll_job = None
+        for cell in self.cells:
+            if cell.docked is None:
+                continue
+            for event in cell.docked.poll():
+                if event[0] == 'scroll' and self.sync_scroll.get():
+                    self.relay_scroll(cell, event[1])
+                elif event[0] == 'loaded' and cell.requested is not None and len(event) > 1:
+                    recorder.record('responsive.load', cell.requested, event[1], 'preview',
+                                    {'viewport': f"{cell.size[0]}x{cell.size[1]}"})
+                    cell.requested = None
+                    self._report_loaded()
+                elif event[0] == 'error':
+                    print(f"Viewport {cell.size[0]}x{cell.size[1]} error: {event[1]}")
+        self._poll_job = self.after(50, self._poll)
+
+    def relay_scroll(self, source, fraction):
+        script = f"window.syncScroll && window.syncScroll({fraction:.5f})"
+        for cell in self.cells:
+            if cell is not source and cell.docked is not None:
+                cell.docked.evaluate_js(script)
+
+    def _report_loaded(self):
+        waiting = sum(1 for cell in self.cells if cell.requested is not None)
+        if waiting:
+            self.status.config(text=f"⏳ {len(self.cells) - waiting}/{len(self.cells)} viewports loaded")
+        else:
+            self.status.config(text=f"✅ {len(self.cells)} viewports")
+
+    def _on_unmap(self, event):
+        if event.widget is self:
+            for cell in self.cells:
+                if cell.docked is not None:
+                    cell.docked.hide()
+
+    def _on_map(self, event):
+        if event.widget is self:
+            for cell in self.cells:
+                if cell.docked is not None:
+                    cell.docked.show()
+
+    def clear(self):
+        """The shown tab was closed"""
+        self.throttle.cancel()
+        self.preview_id = None
+        for cell in self.cells:
+            if cell.docked is not None and cell.docked.alive:
+                cell.docked.load('about:blank')
+
+    def close(self):
+        self.throttle.cancel()
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        for cell in self.cells:
+            if cell.docked is not None:
+                cell.docked.close()
+        self.destroy()
+        if self.on_close is not None:
+            self.on_close(self.viewports)
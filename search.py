@@ -0,0 +1,377 @@
+"""Dosyalarda bul - açık sekmeler ve çalışma alanında arama / tümünü değiştirme"""
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from tkinter import ttk
+
+from file_io import atomic_write
+from trigram import QueryMask, is_text_path
+
+# Önizleme satırının en fazla uzunluğu
+MAX_PREVIEW = 200
+
+
+class SearchQuery:
+    """Compiled find (and optional replace) request"""
+
+    __slots__ = ('pattern', 'regex', 'ignore_case', 'compiled', 'mask')
+
+    def __init__(self, pattern, regex=False, ignore_case=True):
+        self.pattern = pattern
+        self.regex = regex
+        self.ignore_case = ignore_case
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        self.compiled = re.compile(pattern if regex else re.escape(pattern), flags)
+        # Düzenli ifadeler için daraltma yok - her aday taranır
+        self.mask = None if regex else QueryMask(pattern)
+
+
+def find_matches(text, query, limit=1000):
+    """``[(line, column, length, line_text)]`` of the matches in ``text``"""
+    matches = []
+    line = 1
+    line_start = 0
+    position = 0
+    for match in query.compiled.finditer(text):
+        start = match.start()
+        newlines = text.count('\n', position, start)
+        if newlines:
+            line += newlines
+            line_start = text.rfind('\n', position, start) + 1
+        position = start
+        line_end = text.find('\n', start)
+        preview = text[line_start:line_end if line_end >= 0 else len(text)]
+        matches.append((line, start - line_start, len(match.group()), preview[:MAX_PREVIEW]))
+        if len(matches) >= limit:
+            break
+    return matches
+
+
+class FindInFiles:
+    """Search (or replace-all) worker over buffers and workspace files
+
+    Runs on a daemon thread and posts events to ``results`` (a queue) as
+    it goes, so the first hits show up while the rest is still scanned:
+
+    - ``('buffer', key, title, matches)`` / ``('file', path, relpath, matches)``
+    - ``('replaced_buffer', key, new_text, count)`` / ``('replaced_file', path, count)``
+    - ``('progress', checked, indexed, skipped)``
+    - ``('done', match_count, source_count, seconds, cancelled)``
+
+    Buffers are ``(key, title, text)`` snapshots taken on the Tk thread;
+    ``text`` may instead be a callable for a buffer not loaded yet, which
+    is then read on the worker thread.
+    Disk files come from the workspace index; their trigram signatures
+    rule out files that cannot contain the search string before any of
+    them is read. Paths in ``exclude`` (open tabs) are skipped on disk.
+    """
+
+    progress_every = 2000  # dizin kaydı
+    max_matches = 20000  # Sonuç paneli için üst sınır
+
+    def __init__(self, query, buffers, root=None, db_path=None, exclude=(), replacement=None):
+        self.query = query
+        self.buffers = buffers
+        self.root = root
+        self.db_path = db_path
+        self.exclude = {os.path.normcase(os.path.abspath(path)) for path in exclude}
+        self.replacement = replacement
+        self.results = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="find-in-files", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def _run(self):
+        start = time.perf_counter()
+        totals = [0, 0]  # eşleşme, kaynak
+        try:
+            for key, title, text in self.buffers:
+                if self._should_stop(totals):
+                    break
+                if callable(text):
+                    text = text()
+                self._search_buffer(key, title, text, totals)
+            if (self.root and self.db_path and os.path.exists(self.db_path)
+                    and not self._should_stop(totals)):
+                self._search_workspace(totals)
+        except Exception as e:
+            print(f"Find in files error: {e}")
+        self.results.put(('done', totals[0], totals[1], time.perf_counter() - start,
+                          self._cancel.is_set()))
+
+    def _should_stop(self, totals):
+        if self._cancel.is_set():
+            return True
+        # Tümünü değiştirirken sınır yok
+        return self.replacement is None and totals[0] >= self.max_matches
+
+    def _search_buffer(self, key, title, text, totals):
+        matches = find_matches(text, self.query)
+        if not matches:
+            return
+        totals[0] += len(matches)
+        totals[1] += 1
+        self.results.put(('buffer', key, title, matches))
+        if self.replacement is not None:
+            new_text, count = self.query.compiled.subn(self.replacement, text)
+            self.results.put(('replaced_buffer', key, new_text, count))
+
+    def _search_workspace(self, totals):
+        """Stream the index; only files whose signature allows a match are read"""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            total = connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+            rows = connection.execute('SELECT path, grams FROM files')
+            checked = skipped = 0
+            for relpath, grams in rows:
+                if self._should_stop(totals):
+                    return
+                checked += 1
+                if checked % self.progress_every == 0:
+                    self.results.put(('progress', checked, total, skipped))
+                if not is_text_path(relpath):
+                    continue
+                if self.query.mask is not None and not self.query.mask.may_match(grams):
+                    skipped += 1
+                    continue
+                self._search_file(relpath, totals)
+        finally:
+            connection.close()
+
+    def _search_file(self, relpath, totals):
+        path = os.path.join(self.root, relpath)
+        if os.path.normcase(path) in self.exclude:
+            return
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return
+        # Değiştirirken bozuk kodlamaya dokunma
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            if self.replacement is not None:
+                return
+            text = data.decode('utf-8', errors='replace')
+        matches = find_matches(text, self.query)
+        if not matches:
+            return
+        totals[0] += len(matches)
+        totals[1] += 1
+        self.results.put(('file', path, relpath, matches))
+        if self.replacement is not None:
+            new_text, count = self.query.compiled.subn(self.replacement, text)
+            try:
+                atomic_write(path, new_text)
+                self.results.put(('replaced_file', path, count))
+            except OSError as e:
+                print(f"Replace error ({relpath}): {e}")
+
+
+class FindPanel(tk.Frame):
+    """Find / replace-all bar with a streamed results tree
+
+    The owner supplies the data through callbacks:
+
+    - ``get_sources()`` -> ``(buffers, root, db_path, exclude)``
+    - ``on_open(source, line, column, length)`` where ``source`` is
+      ``('buffer', key)`` or ``('file', path)``
+    - ``on_replace_buffer(key, new_text, count)``
+    - ``on_status(text)``
+    """
+
+    poll_interval = 30  # ms
+    rows_per_poll = 400
+
+    def __init__(self, parent, get_sources, on_open, on_replace_buffer, on_status=None):
+        super().__init__(parent, bg='#1a1a1a')
+        self.get_sources = get_sources
+        self.on_open = on_open
+        self.on_replace_buffer = on_replace_buffer
+        self.on_status = on_status
+        self.worker = None
+        self.started = None
+        self.first_result = None
+        self._rows = {}  # ağaç öğesi -> (kaynak, satır, sütun, uzunluk)
+        self._pending = deque()  # ağaca eklenecek (kaynak, etiket, eşleşmeler)
+        self._done = None
+
+        bar = tk.Frame(self, bg='#1a1a1a')
+        bar.pack(fill=tk.X, padx=10, pady=(8, 4))
+        entry_options = dict(font=('Cascadia Code', 11), bg='#2a2a2a', fg='#ffffff',
+                             insertbackground='#60a5fa', relief='flat', width=28)
+        tk.Label(bar, text="🔍", bg='#1a1a1a', fg='#ffffff').pack(side=tk.LEFT)
+        self.find_entry = tk.Entry(bar, **entry_options)
+        self.find_entry.pack(side=tk.LEFT, padx=(4, 10), ipady=3)
+        tk.Label(bar, text="↪", bg='#1a1a1a', fg='#ffffff').pack(side=tk.LEFT)
+        self.replace_entry = tk.Entry(bar, **entry_options)
+        self.replace_entry.pack(side=tk.LEFT, padx=(4, 10), ipady=3)
+        self.regex = tk.BooleanVar(value=False)
+        self.match_case = tk.BooleanVar(value=False)
+        check_options = dict(bg='#1a1a1a', fg='#a0a0a0', selectcolor='#2a2a2a',
+                             activebackground='#1a1a1a', activeforeground='#ffffff')
+        tk.Checkbutton(bar, text=".* Regex", variable=self.regex, **check_options).pack(side=tk.LEFT)
+        tk.Checkbutton(bar, text="Aa Case", variable=self.match_case, **check_options).pack(side=tk.LEFT)
+        button_options = dict(font=('Segoe UI', 10, 'bold'), fg='#ffffff', relief='flat',
+                              borderwidth=0, padx=12, pady=3, cursor='hand2',
+                              activebackground='#4f46e5', activeforeground='#ffffff')
+        tk.Button(bar, text="Find", command=self.find, bg='#3b82f6',
+                  **button_options).pack(side=tk.LEFT, padx=(10, 4))
+        tk.Button(bar, text="Replace All", command=self.replace_all, bg='#4f46e5',
+                  **button_options).pack(side=tk.LEFT, padx=4)
+        tk.Button(bar, text="Cancel", command=self.cancel, bg='#333333',
+                  **button_options).pack(side=tk.LEFT, padx=4)
+        tk.Button(bar, text="✕", command=self.hide, bg='#1a1a1a',
+                  **button_options).pack(side=tk.RIGHT)
+        self.summary = tk.Label(bar, text="", bg='#1a1a1a', fg='#a0a0a0', font=('Segoe UI', 9))
+        self.summary.pack(side=tk.RIGHT, padx=10)
+
+        tree_frame = tk.Frame(self, bg='#1a1a1a')
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 8))
+        self.tree = ttk.Treeview(tree_frame, columns=('preview',), show='tree headings', height=8)
+        self.tree.heading('#0', text='Location')
+        self.tree.heading('preview', text='Match')
+        self.tree.column('#0', width=320, stretch=False)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.find_entry.bind('<Return>', lambda e: self.find())
+        self.find_entry.bind('<Escape>', lambda e: self.hide())
+        self.tree.bind('<Double-Button-1>', self.open_selected)
+        self.tree.bind('<Return>', self.open_selected)
+
+    def focus_find(self, text=None):
+        if text:
+            self.find_entry.delete(0, tk.END)
+            self.find_entry.insert(0, text)
+        self.find_entry.focus_set()
+        self.find_entry.select_range(0, tk.END)
+
+    def hide(self):
+        self.cancel()
+        self.pack_forget()
+
+    def status(self, text):
+        self.summary.config(text=text)
+        if self.on_status:
+            self.on_status(text)
+
+    def _query(self):
+        pattern = self.find_entry.get()
+        if not pattern:
+            return None
+        try:
+            return SearchQuery(pattern, self.regex.get(), not self.match_case.get())
+        except re.error as e:
+            self.status(f"❌ Invalid pattern: {e}")
+            return None
+
+    def find(self):
+        query = self._query()
+        if query is not None:
+            self._start(query)
+
+    def replace_all(self):
+        from tkinter import messagebox
+        query = self._query()
+        if query is None:
+            return
+        replacement = self.replace_entry.get()
+        if not query.regex:
+            replacement = replacement.replace('\\', '\\\\')  # Düz metin - kaçış yok
+        if messagebox.askyesno("❓ Replace All",
+                               f"Replace every match of '{query.pattern}' in open tabs "
+                               f"and workspace files?\nFiles on disk are rewritten.", parent=self):
+            self._start(query, replacement)
+
+    def cancel(self):
+        if self.worker is not None and self.worker.is_alive():
+            self.worker.cancel()
+
+    def _start(self, query, replacement=None):
+        self.cancel()
+        self.tree.delete(*self.tree.get_children())
+        self._rows.clear()
+        self._pending.clear()
+        self._done = None
+        buffers, root, db_path, exclude = self.get_sources()
+        self.worker = FindInFiles(query, buffers, root, db_path, exclude, replacement).start()
+        self.started = time.perf_counter()
+        self.first_result = None
+        self.status("⏳ Searching...")
+        self.after(self.poll_interval, self._poll, self.worker)
+
+    def _poll(self, worker):
+        """Drain worker events; rows are added in bounded batches"""
+        if worker is not self.worker:
+            return  # Eski arama
+        while True:
+            try:
+                event = worker.results.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == 'buffer':
+                self._pending.append((('buffer', event[1]), event[2], event[3]))
+            elif kind == 'file':
+                self._pending.append((('file', event[1]), event[2], event[3]))
+            elif kind == 'replaced_buffer':
+                self.on_replace_buffer(event[1], event[2], event[3])
+            elif kind == 'progress' and not worker.cancelled:
+                _, checked, indexed, skipped = event
+                self.status(f"⏳ {checked:,}/{indexed:,} files checked "
+                            f"({skipped:,} ruled out by the trigram index)")
+            elif kind == 'done':
+                self._done = event
+        self._add_rows()
+        if self._done is None or self._pending:
+            self.after(self.poll_interval, self._poll, worker)
+            return
+        _, matches, sources, seconds, cancelled = self._done
+        details = f", first in {self.first_result * 1000:.0f} ms" if self.first_result else ""
+        if worker.replacement is None and matches >= worker.max_matches:
+            details += ", limit reached"
+        verb = "replaced" if worker.replacement is not None else "found"
+        self.status(f"{'⏹️ Cancelled - ' if cancelled else '🔍 '}{matches:,} matches {verb} "
+                    f"in {sources:,} sources ({seconds:.2f}s{details})")
+
+    def _add_rows(self):
+        budget = self.rows_per_poll
+        while self._pending and budget > 0:
+            source, label, matches = self._pending.popleft()
+            if self.first_result is None:
+                self.first_result = time.perf_counter() - self.started
+            parent = self.tree.insert('', tk.END, text=f"{label} ({len(matches)})", open=True)
+            self._rows[parent] = (source, matches[0][0], matches[0][1], matches[0][2])
+            for line, column, length, preview in matches:
+                item = self.tree.insert(parent, tk.END, text=f"  {line}:{column + 1}",
+                                        values=(preview.strip(),))
+                self._rows[item] = (source, line, column, length)
+            budget -= len(matches) + 1
+
+    def open_selected(self, event=None):
+        selection = self.tree.selection()
+        if selection and selection[0] in self._rows:
+            self.on_open(*self._rows[selection[0]])
+        return 'break'
@@ -0,0 +1,156 @@
+"""Oturum - açık sekmeleri, imleç/kaydırma konumlarını ve kaydedilmemiş içerikleri saklar
+
+Layout under ``state_dir('session')``::
+
+    session.json         tab list: path, title, cursor, top line, selection, snapshot span
+    buffers-<n>.bin      zlib-compressed buffers of unsaved / untitled tabs, back to back
+
+Only the tab list is read at startup; each buffer is read (from disk or
+its span of the snapshot file) when its tab is first needed.
+"""
+import glob
+import json
+import os
+import time
+import zlib
+
+from app_paths import state_dir
+from file_io import atomic_write, read_text
+
+SESSION_VERSION = 1
+
+
+class SessionTab:
+    """One tab of a saved session
+
+    ``span`` is the ``(offset, length)`` of the compressed buffer in the
+    ``snapshot`` file; tabs without one are read from ``path``.
+    """
+
+    __slots__ = ('path', 'title', 'cursor', 'top', 'selection', 'dirty', 'saved_hash',
+                 'large', 'snapshot', 'span', 'error')
+
+    def __init__(self, path=None, title=None, cursor='1.0', top='1.0', selection=None,
+                 dirty=False, saved_hash=None, large=False, snapshot=None, span=None):
+        self.path = path
+        self.title = title
+        self.cursor = cursor
+        self.top = top  # Görünen ilk satır
+        self.selection = selection  # (başlangıç, bitiş) veya None
+        self.dirty = dirty
+        self.saved_hash = saved_hash  # Diskteki sürümün özeti (kaydedilmemiş sekmeler)
+        self.large = large
+        self.snapshot = snapshot
+        self.span = span
+        self.error = None  # Son okuma hatası
+
+    def raw(self):
+        """Compressed bytes of the buffer in the snapshot file"""
+        offset, length = self.span
+        with open(self.snapshot, 'rb') as file:
+            file.seek(offset)
+            data = file.read(length)
+        if len(data) != length:
+            raise OSError(f"snapshot truncated: {self.snapshot}")
+        return data
+
+    def read(self):
+        """The tab's text from disk or the snapshot (raises if it cannot be read)"""
+        if self.span is None:
+            return read_text(self.path)
+        return zlib.decompress(self.raw()).decode('utf-8')
+
+    def load(self):
+        """The tab's text - ``''`` (with ``error`` set) if it can no longer be read"""
+        try:
+            return self.read()
+        except (OSError, ValueError, zlib.error) as e:
+            self.error = e
+            return ''
+
+    def as_dict(self):
+        data = {'path': self.path, 'title': self.title}
+        if self.large:
+            data['large'] = True
+            return data
+        data.update(cursor=self.cursor, top=self.top)
+        if self.selection:
+            data['selection'] = list(self.selection)
+        if self.dirty:
+            data.update(dirty=True, saved_hash=self.saved_hash)
+        if self.span is not None:
+            data['span'] = list(self.span)
+        return data
+
+
+def save_session(tabs, selected, folder=None, level=6):
+    """Write ``tabs`` - ``(SessionTab, buffer)`` pairs - as the current session
+
+    ``buffer`` is the text to keep in the snapshot, the already
+    compressed bytes of a tab that was never loaded, or None for tabs read
+    back from disk. The snapshot is written first and session.json then
+    replaced atomically, so a crash leaves the previous session intact.
+    Afterwards each entry points at its span of the new snapshot.
+    """
+    folder = folder or state_dir('session')
+    snapshot = os.path.join(folder, f"buffers-{time.time_ns()}.bin")
+    spans = []
+    with open(snapshot, 'wb') as file:
+        for entry, buffer in tabs:
+            if buffer is None:
+                spans.append(None)
+                continue
+            if isinstance(buffer, str):
+                buffer = zlib.compress(buffer.encode('utf-8'), level)
+            spans.append((file.tell(), len(buffer)))
+            file.write(buffer)
+        file.flush()
+        os.fsync(file.fileno())
+    for (entry, _), span in zip(tabs, spans):
+        entry.snapshot = snapshot if span is not None else None
+        entry.span = span
+    data = {
+        'version': SESSION_VERSION,
+        'snapshot': os.path.basename(snapshot),
+        'selected': selected,
+        'tabs': [entry.as_dict() for entry, _ in tabs],
+    }
+    atomic_write(os.path.join(folder, 'session.json'),
+                 json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+    # Eski anlık görüntüler artık kullanılmıyor
+    for path in glob.glob(os.path.join(folder, 'buffers-*.bin')):
+        if path != snapshot:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_session(folder=None):
+    """``(tabs, selected)`` of the last session, or None"""
+    folder = folder or state_dir('session')
+    try:
+        with open(os.path.join(folder, 'session.json'), encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != SESSION_VERSION:
+        return None
+    snapshot = os.path.join(folder, data.get('snapshot') or '')
+    tabs = []
+    for item in data.get('tabs', []):
+        span = item.get('span')
+        selection = item.get('selection')
+        tabs.append(SessionTab(
+            item.get('path'),
+            item.get('title'),
+            item.get('cursor', '1.0'),
+            item.get('top', '1.0'),
+            tuple(selection) if selection else None,
+            item.get('dirty', False),
+            item.get('saved_hash'),
+            item.get('large', False),
+            snapshot if span else None,
+            tuple(span) if span else None,
+        ))
+    return tabs, data.get('selected', 0)
@@ -0,0 +1,284 @@
+"""Bölünmüş önizleme - editörün yanında, tek ve sürekli açık bir renderer ile çizilen görünüm"""
+import time
+import tkinter as tk
+import webbrowser
+
+from perf import recorder
+
+try:
+    from tkinterweb import HtmlFrame
+    TKINTERWEB_AVAILABLE = True
+except ImportError:
+    HtmlFrame = None
+    TKINTERWEB_AVAILABLE = False
+
+
+class FrameThrottle:
+    """Call ``callback`` at most ``fps`` times a second, always with the latest arguments
+
+    Unlike a debounce, steady typing still renders every ``1/fps``
+    seconds; a burst of requests between two frames collapses into one.
+    """
+
+    def __init__(self, widget, callback, fps=20):
+        self.widget = widget
+        self.callback = callback
+        self.interval = 1.0 / fps
+        self.last = 0.0
+        self._args = None
+        self._job = None
+
+    def request(self, *args):
+        self._args = args
+        if self._job is not None:
+            return
+        delay = max(0.0, self.last + self.interval - time.perf_counter())
+        self._job = self.widget.after(int(delay * 1000), self._fire)
+
+    def _fire(self):
+        self._job = None
+        self.last = time.perf_counter()
+        args, self._args = self._args, None
+        self.callback(*args)
+
+    def cancel(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._args = None
+
+
+class DockedRenderer:
+    """A frameless pywebview window kept exactly over a Tk frame
+
+    pywebview cannot be embedded in a Tk widget, so the renderer window
+    (its own process, see PreviewProcess) is moved and resized to follow
+    ``frame`` instead; ``sync()`` is called from the toplevel's
+    ``<Configure>``. The process is started on the first ``sync()`` that
+    finds the frame on screen and then stays warm: ``load()`` navigates
+    it, ``hide()`` / ``show()`` keep it alive while it is not needed.
+    """
+
+    def __init__(self, frame, title="Web Viewer preview", **window_options):
+        self.frame = frame
+        self.title = title
+        self.window_options = window_options
+        self.url = None
+        self.renderer = None
+        self.geometry = None
+        self.hidden = False
+
+    @property
+    def alive(self):
+        return self.renderer is not None and self.renderer.is_alive()
+
+    def load(self, url):
+        self.url = url
+        if self.alive:
+            self.renderer.load_url(url)
+        else:
+            self.sync()  # Görünürse renderer'ı başlatır
+
+    def evaluate_js(self, script):
+        if self.alive:
+            self.renderer.evaluate_js(script)
+
+    def sync(self):
+        """Move / resize the window onto the frame (starting it if needed)"""
+        frame = self.frame
+        if self.hidden or self.url is None or not frame.winfo_ismapped():
+            return
+        geometry = (frame.winfo_rootx(), frame.winfo_rooty(),
+                    max(100, frame.winfo_width()), max(100, frame.winfo_height()))
+        if self.renderer is None:
+            self.geometry = geometry
+            self._start()
+            return
+        if geometry == self.geometry:
+            return
+        old, self.geometry = self.geometry, geometry
+        if old is None or old[:2] != geometry[:2]:
+            self.renderer.move(*geometry[:2])
+        if old is None or old[2:] != geometry[2:]:
+            self.renderer.resize(*geometry[2:])
+
+    def _start(self):
+        from preview_process import PreviewProcess
+
+        x, y, width, height = self.geometry
+        self.renderer = PreviewProcess(
+            self.url,
+            title=self.title,
+            width=width,
+            height=height,
+            x=x,
+            y=y,
+            resizable=False,
+            frameless=True,
+            easy_drag=False,
+            on_top=True,
+            text_select=True,
+            background_color='#ffffff',
+            **self.window_options
+        ).start()
+
+    def poll(self):
+        """Pending renderer events; a closed renderer restarts on the next ``sync()``"""
+        from preview_process import reap_closed
+
+        reap_closed()  # Kapatılmış renderer süreçlerini topla
+        if self.renderer is None:
+            return []
+        events = self.renderer.poll()
+        if self.renderer.closed:
+            self.renderer.close()
+            self.renderer = None
+        return events
+
+    def hide(self):
+        if self.renderer is not None and not self.hidden:
+            self.renderer.hide()
+        self.hidden = True
+
+    def show(self):
+        if self.renderer is not None and self.hidden:
+            self.renderer.show()
+        self.hidden = False
+        self.geometry = None  # Gizliyken pencere taşınmış olabilir
+        self.frame.after_idle(self.sync)
+
+    def close(self):
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+
+
+class SplitPreview(tk.Frame):
+    """Rendered view of the current tab, shown next to the editor
+
+    One renderer stays alive for the whole session and is pointed at
+    whichever tab is selected, so switching tabs or re-rendering never
+    pays a renderer start-up:
+
+    - with ``tkinterweb`` installed the page is drawn in this frame;
+    - else a DockedRenderer (pywebview in its own process) covers the
+      frame. Edits reach it as live patches (CSS swap / DOM diff) from the
+      preview server instead of page reloads.
+
+    Without either renderer the frame offers the page in the browser,
+    which gets the same live patches.
+    """
+
+    fps = 20
+
+    def __init__(self, parent, server, pusher, webview_available, **kwargs):
+        super().__init__(parent, bg='#ffffff', **kwargs)
+        self.server = server
+        self.pusher = pusher
+        self.preview_id = None
+        self.url = None
+        self.requested = None  # Yükleme isteğinin zamanı (gidiş-dönüş)
+        self.throttle = FrameThrottle(self, self._render, self.fps)
+        self.html = None
+        self.docked = None
+        self.active = False  # Bölme açık mı (kapalıyken renderer gizli bekler)
+        self._poll_job = None
+        if TKINTERWEB_AVAILABLE:
+            self.html = HtmlFrame(self, messages_enabled=False)
+            self.html.pack(fill=tk.BOTH, expand=True)
+        elif webview_available:
+            # Pencere gelene kadar yer tutucu
+            tk.Label(self, text="⏳ Starting renderer...", bg='#ffffff', fg='#6b7280',
+                     font=('Segoe UI', 11)).pack(expand=True)
+            self.docked = DockedRenderer(self)
+            # Ana pencere taşınınca / boyutlanınca / simge durumuna küçülünce takip et
+            top = self.winfo_toplevel()
+            top.bind('<Configure>', lambda e: self.docked.sync(), add='+')
+            top.bind('<Unmap>', self._on_unmap, add='+')
+            top.bind('<Map>', self._on_map, add='+')
+        else:
+            tk.Label(self, text="Install tkinterweb or pywebview to render here",
+                     bg='#ffffff', fg='#6b7280', font=('Segoe UI', 11)).pack(expand=True, pady=(0, 10))
+            tk.Button(self, text="🌐 Open in browser (live)", relief='flat', bg='#3b82f6', fg='#ffffff',
+                      cursor='hand2', command=lambda: self.url and webbrowser.open(self.url)).pack()
+
+    def show(self, preview_id, url, get_content):
+        """Point the view at a tab; ``get_content()`` returns its current buffer"""
+        self.throttle.cancel()
+        self.preview_id = preview_id
+        self.url = url
+        self.requested = time.perf_counter()
+        if self.html is not None:
+            self._render(preview_id, get_content)
+        elif self.docked is not None:
+            self.docked.load(url)
+            if self._poll_job is None:
+                self._poll_job = self.after(50, self._poll)
+
+    def request_render(self, preview_id, get_content, title=None):
+        """An edit happened - re-render at most ``fps`` times a second
+
+        ``get_content`` is only called when a frame is drawn, so keystrokes
+        between two frames never copy the buffer.
+        """
+        if preview_id == self.preview_id:
+            self.throttle.request(preview_id, get_content, title)
+
+    def _render(self, preview_id, get_content, title=None):
+        if preview_id != self.preview_id:
+            return
+        content = get_content()
+        if self.html is not None:
+            with recorder.span('split.render', 'preview', bytes=len(content)):
+                self.html.load_html(content, base_url=self.url)
+        else:
+            # Sunucu farkı çıkarıp açık görünümlere (gömülü, tarayıcı) yamalar
+            self.pusher.submit(preview_id, content, title, time.perf_counter())
+
+    def _poll(self):
+        self._poll_job = None
+        for event in self.docked.poll():
+            if event[0] == 'loaded' and self.requested is not None and len(event) > 1:
+                recorder.record('split.roundtrip', self.requested, event[1], 'preview')
+                self.requested = None
+            elif event[0] == 'error':
+                print(f"Split preview error: {event[1]}")
+        self._poll_job = self.after(50, self._poll)
+
+    def activate(self):
+        self.active = True
+        if self.docked is not None:
+            self.docked.show()
+
+    def deactivate(self):
+        """Split closed - the renderer stays warm, just hidden"""
+        self.active = False
+        self.throttle.cancel()
+        if self.docked is not None:
+            self.docked.hide()
+
+    def _on_unmap(self, event):
+        if event.widget is self.winfo_toplevel() and self.active:
+            self.docked.hide()
+
+    def _on_map(self, event):
+        if event.widget is self.winfo_toplevel() and self.active:
+            self.docked.show()
+
+    def clear(self):
+        """The shown tab was closed"""
+        self.throttle.cancel()
+        self.preview_id = None
+        self.url = None
+        if self.html is not None:
+            self.html.load_html('')
+        elif self.docked is not None and self.docked.alive:
+            self.docked.load('about:blank')
+
+    def close(self):
+        self.throttle.cancel()
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        if self.docked is not None:
+            self.docked.close()
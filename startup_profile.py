@@ -0,0 +1,39 @@
+"""Açılış profili - --profile-startup ile içe aktarma ve kurulum sürelerini raporlar"""
+import sys
+import time
+
+
+class StartupProfile:
+    """Named timestamps from process start to the fully built window
+
+    ``mark(label)`` records the time since the previous mark; ``report()``
+    prints every stage with its duration and the running total, plus how
+    many modules were loaded up to that point.
+    """
+
+    def __init__(self, started):
+        self.started = started
+        self.marks = []  # (label, perf_counter, loaded module count)
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter(), len(sys.modules)))
+
+    def elapsed(self, label):
+        """Milliseconds from start to ``label`` (None if not reached yet)"""
+        for name, at, _ in self.marks:
+            if name == label:
+                return (at - self.started) * 1000
+        return None
+
+    def report(self, file=None):
+        file = file or sys.stderr
+        print("Startup profile:", file=file)
+        previous = self.started
+        for label, at, modules in self.marks:
+            print(f"  {label:<22} {(at - previous) * 1000:8.1f} ms   "
+                  f"total {(at - self.started) * 1000:8.1f} ms   {modules:4d} modules", file=file)
+            previous = at
+        first_frame = self.elapsed('first frame')
+        if first_frame is not None:
+            verdict = 'OK' if first_frame < 200 else 'over budget'
+            print(f"  first frame after {first_frame:.1f} ms ({verdict}, target < 200 ms)", file=file)
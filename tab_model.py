@@ -0,0 +1,153 @@
+"""Sekme modeli - açık sekmeler için Tab sınıfı ve sıralı kayıt defteri"""
+from collections import deque
+
+
+class Tab:
+    """One open tab: file metadata plus its widgets and engines
+
+    Editor tabs are created lazily: until the tab is first shown only
+    ``pending_text`` and the journal exist, and ``editor`` is None. Tabs
+    restored from the last session do not even have their text yet:
+    ``restore`` (a SessionTab) reads it on first use.
+    """
+
+    __slots__ = (
+        'frame', 'widget_path', 'tab_id', 'path', 'title', 'tab_text',
+        'pending_text', 'pooled_editor', 'editor', 'journal', 'preview_version',
+        'large_file', 'viewer', 'long_lines', 'pretty_view', 'history', 'restore', 'view',
+    )
+
+    def __init__(self, frame, tab_id, path=None, title=None):
+        self.frame = frame
+        self.widget_path = str(frame)
+        self.tab_id = tab_id
+        self.path = path
+        self.title = title
+        self.tab_text = None  # Sekmede gösterilen son metin
+        self.pending_text = None  # Editör oluşturulana kadar içerik
+        self.pooled_editor = None
+        self.editor = None
+        self.journal = None
+        self.preview_version = None
+        self.large_file = None
+        self.viewer = None
+        self.long_lines = None  # [(satır, uzunluk)] - kısaltılarak gösterilen satırlar
+        self.pretty_view = None  # Okunabilir (salt okunur) görünüm
+        self.history = None  # Geri al / yinele geçmişi (UndoHistory)
+        self.restore = None  # İçeriği henüz okunmamış oturum sekmesi (SessionTab)
+        self.view = None  # Editör oluşunca uygulanacak imleç / kaydırma / seçim
+
+    @property
+    def has_editor(self):
+        """Editable text tab (materialized or not)"""
+        return self.journal is not None
+
+    @property
+    def materialized(self):
+        return self.editor is not None
+
+    @property
+    def dirty(self):
+        return self.journal is not None and self.journal.dirty
+
+    def get_text(self):
+        """Current buffer (without Tk's trailing newline)"""
+        if self.editor is None:
+            if self.restore is not None:
+                self.load_restored()
+            return self.pending_text
+        return self.editor.get('1.0', 'end-1c')
+
+    def load_restored(self, text=None):
+        """Fill in the buffer of a session tab - ``text``, else read now from disk / the snapshot"""
+        restore, self.restore = self.restore, None
+        self.pending_text = restore.load() if text is None else text
+        if not restore.dirty:
+            self.journal.reset(self.pending_text)
+
+    def __repr__(self):
+        return f"<Tab {self.tab_id} {self.title!r}>"
+
+
+class ClosedTab:
+    """What is needed to reopen a closed tab"""
+
+    __slots__ = ('path', 'title', 'text', 'index')
+
+    def __init__(self, path, title, text, index):
+        self.path = path
+        self.title = title
+        self.text = text  # None: diskten yeniden yükle
+        self.index = index
+
+
+class TabRegistry:
+    """Ordered collection of open tabs with constant-time lookup
+
+    Tabs are indexed by their frame's Tk widget path, which is exactly what
+    ``Notebook.select()`` returns, so finding the active tab never scans
+    the open tabs. Iteration follows the notebook order (``move`` keeps it
+    in sync when tabs are rearranged) and recently closed tabs are
+    remembered for ``pop_closed``.
+    """
+
+    def __init__(self, max_closed=20):
+        self._by_path = {}  # widget path -> Tab
+        self._by_id = {}  # tab_id -> Tab
+        self._order = []
+        self._closed = deque(maxlen=max_closed)
+
+    def add(self, tab, index=None):
+        self._by_path[tab.widget_path] = tab
+        self._by_id[tab.tab_id] = tab
+        if index is None or index >= len(self._order):
+            self._order.append(tab)
+        else:
+            self._order.insert(max(0, index), tab)
+        return tab
+
+    def remove(self, tab, closed=None):
+        """Forget a tab; ``closed`` (a ClosedTab) makes it restorable"""
+        index = self.index(tab)
+        self._order.pop(index)
+        del self._by_path[tab.widget_path]
+        del self._by_id[tab.tab_id]
+        if closed is not None:
+            closed.index = index
+            self._closed.append(closed)
+        return index
+
+    def get(self, key):
+        """Tab for a frame, a widget path (``notebook.select()``) or a Tab"""
+        if isinstance(key, Tab):
+            return key if self._by_path.get(key.widget_path) is key else None
+        return self._by_path.get(str(key))
+
+    def by_id(self, tab_id):
+        return self._by_id.get(tab_id)
+
+    def index(self, tab):
+        return self._order.index(tab)
+
+    def move(self, tab, index):
+        """Move a tab to ``index`` in the order"""
+        self._order.remove(tab)
+        index = max(0, min(index, len(self._order)))
+        self._order.insert(index, tab)
+        return index
+
+    def pop_closed(self):
+        return self._closed.pop() if self._closed else None
+
+    @property
+    def closed_count(self):
+        return len(self._closed)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return iter(list(self._order))
+
+    def __len__(self):
+        return len(self._order)
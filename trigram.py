@@ -0,0 +1,81 @@
+"""Trigram imzaları - dosya bulmada aday dosyaları daraltmak için"""
+
+# İmza boyutu (bit): dosyadaki farklı trigram sayısına göre ölçeklenir
+MIN_SIGNATURE_BITS = 256
+MAX_SIGNATURE_BITS = 8192
+
+# Bundan büyük dosyaların imzası çıkarılmaz (her aramada taranır)
+MAX_SIGNATURE_SIZE = 8 * 1024 * 1024
+
+# İmzası çıkarılan (ve dosyalarda aranan) metin dosyaları
+TEXT_EXTENSIONS = frozenset({
+    '.html', '.htm', '.xhtml', '.css', '.scss', '.less', '.js', '.mjs', '.ts', '.jsx',
+    '.tsx', '.json', '.xml', '.svg', '.txt', '.md', '.yml', '.yaml', '.py', '.vue',
+})
+
+# Tek bir C çağrısında işlenen bayt sayısı - GIL uzun süre tutulmasın
+_CHUNK = 64 * 1024
+
+
+def is_text_path(path):
+    dot = path.rfind('.')
+    return dot >= 0 and path[dot:].lower() in TEXT_EXTENSIONS
+
+
+def _hash(gram):
+    a, b, c = gram
+    return (a * 65599 + b) * 65599 + c
+
+
+def trigrams(data):
+    """Distinct (lowercased) byte trigrams of ``data``"""
+    grams = set()
+    for start in range(0, max(1, len(data) - 2), _CHUNK):
+        chunk = data[start:start + _CHUNK + 2].lower()
+        grams.update(zip(chunk, chunk[1:], chunk[2:]))
+    return grams
+
+
+def signature(data):
+    """Bloom-style trigram signature of a file's bytes
+
+    Every distinct trigram sets one bit. The bitmap grows with the number
+    of distinct trigrams (about one bit in eight set, up to
+    MAX_SIGNATURE_BITS), so small files cost a few bytes in the index.
+    A file can only contain a string if its signature has the bits of all
+    the string's trigrams, so most files are ruled out without being read.
+    """
+    grams = trigrams(data)
+    bits = MIN_SIGNATURE_BITS
+    while bits < len(grams) * 8 and bits < MAX_SIGNATURE_BITS:
+        bits *= 2
+    value = 0
+    for gram in grams:
+        value |= 1 << (_hash(gram) % bits)
+    return value.to_bytes(bits // 8, 'little')
+
+
+class QueryMask:
+    """Trigram bits a signature must have to possibly contain ``literal``
+
+    Strings shorter than a trigram do not narrow anything.
+    """
+
+    def __init__(self, literal, encoding='utf-8'):
+        # Büyük/küçük harf sadece ASCII'de katlanır - diğerlerine güvenme
+        self.hashes = [_hash(gram) for gram in trigrams(literal.encode(encoding))
+                       if max(gram) < 128]
+        self._masks = {}  # imza boyutu -> maske
+
+    def may_match(self, signature_bytes):
+        """False when the file certainly does not contain the literal"""
+        if not self.hashes or not signature_bytes:
+            return True
+        bits = len(signature_bytes) * 8
+        mask = self._masks.get(bits)
+        if mask is None:
+            mask = 0
+            for value in self.hashes:
+                mask |= 1 << (value % bits)
+            self._masks[bits] = mask
+        return int.from_bytes(signature_bytes, 'little') & mask == mask
@@ -0,0 +1,246 @@
+"""Geri al / yinele - sekme başına, belleği sınırlı düzenleme geçmişi"""
+import hashlib
+import json
+import os
+import time
+from collections import deque
+
+from app_paths import state_dir
+from file_io import atomic_write
+
+# Düzenleme kaydı başına tahmini ek yük (karakter cinsinden) - küçük kayıtlar da sayılır
+EDIT_OVERHEAD = 48
+
+HISTORY_VERSION = 1
+
+
+class Edit:
+    """One insert or delete, as Tk indices in the buffer it applied to
+
+    ``text`` is the removed text of a delete. An insert on the undo stack
+    keeps no text - the buffer holds it between ``start`` and ``end`` - and
+    picks it up when it is undone, so typing and pasting cost no memory
+    until they are undone.
+    """
+
+    __slots__ = ('kind', 'start', 'end', 'text')
+
+    def __init__(self, kind, start, end, text=None):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.text = text
+
+    @property
+    def chars(self):
+        return EDIT_OVERHEAD + (len(self.text) if self.text else 0)
+
+
+class UndoStep:
+    """Edits undone together; ``typing`` steps absorb the next keystroke"""
+
+    __slots__ = ('edits', 'time', 'typing')
+
+    def __init__(self, edit, typing):
+        self.edits = [edit]
+        self.time = time.monotonic()
+        self.typing = typing
+
+    @property
+    def chars(self):
+        return sum(edit.chars for edit in self.edits)
+
+
+class UndoHistory:
+    """Undo/redo for one tab, fed by the editor's TextChangeProxy
+
+    ``record`` is a proxy listener (registered with
+    ``want_deleted_text=True``). Single-character inserts or deletes that
+    continue the previous one within ``merge_window`` seconds join its
+    step, so a typed word is one undo; a newline ends the run. A delete
+    followed at once by an insert at the same place (typing over a
+    selection, paste-replace) is one step as well.
+
+    The history is bounded: stored text plus a small per-edit overhead is
+    kept under ``max_chars`` and the step count under ``max_steps`` by
+    dropping the oldest undo steps (then the farthest redo steps); the
+    newest step is always kept, however large.
+    """
+
+    max_chars = 16 * 1024 * 1024
+    max_steps = 10000
+    merge_window = 1.5  # saniye
+    replace_window = 0.05  # saniye - silme + ekleme tek adım sayılır
+
+    def __init__(self):
+        self.undo_steps = deque()
+        self.redo_steps = deque()
+        self.chars = 0
+        self.applying = False  # Geri alma sırasında gelen değişiklikler kaydedilmez
+
+    def __len__(self):
+        return len(self.undo_steps)
+
+    @property
+    def can_redo(self):
+        return bool(self.redo_steps)
+
+    def record(self, kind, start, end, text):
+        """Proxy listener: add one edit"""
+        if self.applying:
+            return
+        if self.redo_steps:
+            self.chars -= sum(step.chars for step in self.redo_steps)
+            self.redo_steps.clear()
+        now = time.monotonic()
+        edit = Edit(kind, start, end, text if kind == 'delete' else None)
+        single = text is not None and len(text) == 1
+        step = self.undo_steps[-1] if self.undo_steps else None
+        added = self._extend(step, edit, single, now) if step is not None else None
+        if added is None:
+            step = UndoStep(edit, single)
+            self.undo_steps.append(step)
+            added = edit.chars
+        self.chars += added
+        step.time = now
+        if text == '\n':
+            step.typing = False  # Satır sonu yazma dizisini bitirir
+        self._evict()
+
+    def _extend(self, step, edit, single, now):
+        """Merge ``edit`` into ``step`` if it continues it; returns the chars added, else None"""
+        last = step.edits[-1]
+        elapsed = now - step.time
+        if edit.kind == 'insert' and last.kind == 'delete' and len(step.edits) == 1 \
+                and elapsed < self.replace_window and edit.start == last.start:
+            step.edits.append(edit)  # Seçimin üzerine yazma / yapıştırarak değiştirme
+            step.typing = single
+            return edit.chars
+        if not (step.typing and single and elapsed < self.merge_window and edit.kind == last.kind):
+            return None
+        if edit.kind == 'insert':
+            if edit.start != last.end:
+                return None
+            last.end = edit.end
+            return 0
+        if edit.end == last.start:  # Backspace
+            last.start = edit.start
+            last.text = edit.text + last.text
+            return 1
+        if edit.start == last.start:  # Delete
+            last.text += edit.text
+            return 1
+        return None
+
+    def _evict(self):
+        while len(self.undo_steps) + len(self.redo_steps) > 1 and (
+                self.chars > self.max_chars or len(self.undo_steps) > self.max_steps):
+            if len(self.undo_steps) > 1 or not self.redo_steps:
+                step = self.undo_steps.popleft()
+            else:
+                step = self.redo_steps.popleft()  # En uzaktaki yineleme
+            self.chars -= step.chars
+
+    def undo(self, text):
+        """Revert the newest step in Text ``text``; returns the index to put the cursor at"""
+        if not self.undo_steps:
+            return None
+        step = self.undo_steps.pop()
+        self.applying = True
+        try:
+            for edit in reversed(step.edits):
+                if edit.kind == 'insert':
+                    edit.text = text.get(edit.start, edit.end)  # Yinelemek için
+                    self.chars += len(edit.text)
+                    text.delete(edit.start, edit.end)
+                else:
+                    text.insert(edit.start, edit.text)
+        finally:
+            self.applying = False
+        step.typing = False
+        self.redo_steps.append(step)
+        self._evict()
+        return step.edits[0].start
+
+    def redo(self, text):
+        """Re-apply the last undone step; returns the index to put the cursor at"""
+        if not self.redo_steps:
+            return None
+        step = self.redo_steps.pop()
+        self.applying = True
+        try:
+            for edit in step.edits:
+                if edit.kind == 'insert':
+                    text.insert(edit.start, edit.text)
+                    self.chars -= len(edit.text)
+                    edit.text = None
+                else:
+                    text.delete(edit.start, f"{edit.start} + {len(edit.text)} chars")
+        finally:
+            self.applying = False
+        self.undo_steps.append(step)
+        last = step.edits[-1]
+        return last.end if last.kind == 'insert' else last.start
+
+    def clear(self):
+        self.undo_steps.clear()
+        self.redo_steps.clear()
+        self.chars = 0
+
+    # --- Kalıcılık -----------------------------------------------------------
+
+    def save(self, path, content_hash, max_chars=2 * 1024 * 1024):
+        """Write the newest undo steps (up to ``max_chars``) for the buffer ``content_hash``
+
+        Redo steps are not kept. The history only applies to that exact
+        buffer, so ``load`` is given the hash of the text it will undo.
+        """
+        steps = []
+        total = 0
+        for step in reversed(self.undo_steps):
+            total += step.chars
+            if total > max_chars:
+                break
+            steps.append([[edit.kind, edit.start, edit.end, edit.text] for edit in step.edits])
+        steps.reverse()
+        data = {'version': HISTORY_VERSION, 'hash': content_hash, 'steps': steps}
+        atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+
+    @classmethod
+    def load(cls, path, content_hash):
+        """History saved for the buffer ``content_hash``, or None"""
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != HISTORY_VERSION or data.get('hash') != content_hash:
+            return None
+        history = cls()
+        for edits in data['steps']:
+            step = UndoStep(Edit(*edits[0]), False)
+            step.edits.extend(Edit(*edit) for edit in edits[1:])
+            history.undo_steps.append(step)
+            history.chars += step.chars
+        history._evict()
+        return history
+
+
+def history_path(file_path):
+    """Where the undo history of ``file_path`` is kept between sessions"""
+    key = hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=12).hexdigest()
+    return os.path.join(state_dir('history'), f"{key}.json")
+
+
+def prune_histories(keep=200):
+    """Remove all but the ``keep`` most recently written history files"""
+    folder = state_dir('history')
+    try:
+        entries = sorted(os.scandir(folder), key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
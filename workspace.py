@@ -0,0 +1,252 @@
+"""Çalışma alanı - klasör dizini (SQLite) ve hızlı "dosyaya git" araması"""
+import hashlib
+import heapq
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from app_paths import state_dir
+from trigram import MAX_SIGNATURE_SIZE, is_text_path, signature
+
+# Dizinlenmeyen klasörler
+IGNORED_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv',
+    '.idea', '.vscode', '.mypy_cache', '.pytest_cache', '.tox',
+})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT,
+    grams BLOB
+);
+"""
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """blake2b of a file's bytes, read in chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def describe_file(path, size):
+    """``(hash, trigram signature)`` of a file; the signature only for text files"""
+    if size > MAX_SIGNATURE_SIZE or not is_text_path(path):
+        return file_hash(path), None
+    with open(path, 'rb') as file:
+        data = file.read()
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), signature(data)
+
+
+def index_path_for(root):
+    """On-disk index location for a workspace folder"""
+    key = hashlib.blake2b(os.path.abspath(root).encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(state_dir('workspaces'), f"{key}.sqlite3")
+
+
+def walk_files(root):
+    """Yield ``(relative_path, stat)`` for every file below ``root``
+
+    Uses an explicit stack of ``os.scandir`` iterators; symlinked
+    directories are not followed and IGNORED_DIRS are skipped.
+    """
+    stack = ['']
+    while stack:
+        relative = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, relative)) as entries:
+                for entry in entries:
+                    name = f"{relative}/{entry.name}" if relative else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in IGNORED_DIRS:
+                                stack.append(name)
+                        elif entry.is_file():
+                            yield name, entry.stat()
+                    except OSError:
+                        continue  # Bu arada silinmiş
+        except OSError:
+            continue  # İzin yok / klasör kayboldu
+
+
+class WorkspaceIndex:
+    """Path, mtime, size and content hash of every file in a folder
+
+    The table lives in SQLite; an in-memory copy of ``path -> (id, mtime,
+    size)`` makes a rescan a plain ``scandir`` walk plus one stat per file.
+    Only new or modified files are hashed and written, so re-indexing an
+    unchanged tree costs no file reads at all. Text files also get a
+    trigram signature (see trigram.py) used by find-in-files.
+
+    Not thread-safe: create and use it on a single (indexer) thread.
+    """
+
+    def __init__(self, root, db_path=None):
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or index_path_for(self.root)
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+        columns = {row[1] for row in self.db.execute('PRAGMA table_info(files)')}
+        rebuild = 'grams' not in columns
+        if rebuild:
+            # Eski dizin - imzalar için her şeyi yeniden oku
+            self.db.execute('ALTER TABLE files ADD COLUMN grams BLOB')
+        self.files = {path: (file_id, -1 if rebuild else mtime_ns, size)
+                      for file_id, path, mtime_ns, size
+                      in self.db.execute('SELECT id, path, mtime_ns, size FROM files')}
+
+    def scan(self, cancel=None):
+        """Bring the index up to date; returns ``(added, changed, removed)``"""
+        seen = set()
+        added, changed = [], []
+        for path, stat in walk_files(self.root):
+            if cancel is not None and cancel.is_set():
+                return 0, 0, 0
+            seen.add(path)
+            known = self.files.get(path)
+            if known is None:
+                added.append((path, stat))
+            elif known[1] != stat.st_mtime_ns or known[2] != stat.st_size:
+                changed.append((path, stat))
+        removed = [path for path in self.files if path not in seen]
+        if not (added or changed or removed):
+            return 0, 0, 0
+
+        with self.db:
+            for path in removed:
+                file_id = self.files.pop(path)[0]
+                self.db.execute('DELETE FROM files WHERE id = ?', (file_id,))
+            for path, stat in added + changed:
+                if cancel is not None and cancel.is_set():
+                    break  # Yazılanlar tutarlı; kalanlar bir sonraki taramada
+                try:
+                    digest, grams = describe_file(os.path.join(self.root, path), stat.st_size)
+                except OSError:
+                    digest, grams = None, None
+                cursor = self.db.execute(
+                    'INSERT INTO files (path, mtime_ns, size, hash, grams) VALUES (?, ?, ?, ?, ?) '
+                    'ON CONFLICT(path) DO UPDATE SET mtime_ns = excluded.mtime_ns, '
+                    'size = excluded.size, hash = excluded.hash, grams = excluded.grams',
+                    (path, stat.st_mtime_ns, stat.st_size, digest, grams))
+                file_id = self.files[path][0] if path in self.files else cursor.lastrowid
+                self.files[path] = (file_id, stat.st_mtime_ns, stat.st_size)
+        return len(added), len(changed), len(removed)
+
+    def paths(self):
+        return list(self.files)
+
+    def close(self):
+        self.db.close()
+
+
+class WorkspaceIndexer:
+    """Keeps a WorkspaceIndex fresh on a background thread
+
+    The first pass indexes the whole tree; after that the tree is polled
+    every ``interval`` seconds and only changed files are re-hashed. The
+    Tk thread reads ``paths`` (swapped atomically after each pass) and
+    watches ``generation`` to notice updates.
+    """
+
+    interval = 3.0  # saniye - mtime yoklama aralığı
+
+    def __init__(self, root, db_path=None):
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or index_path_for(self.root)
+        self.paths = []
+        self.generation = 0  # Her değişiklikte artar
+        self.ready = False
+        self.error = None
+        self.last_scan = None  # (added, changed, removed, seconds)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="workspace-index", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            index = WorkspaceIndex(self.root, self.db_path)
+        except sqlite3.Error as e:
+            self.error = e
+            return
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                added, changed, removed = index.scan(self._stop)
+                if added or changed or removed or not self.ready:
+                    self.paths = sorted(index.files)
+                    self.last_scan = (added, changed, removed, time.perf_counter() - start)
+                    self.generation += 1
+                    self.ready = True
+                self._stop.wait(self.interval)
+        except sqlite3.Error as e:
+            self.error = e
+        finally:
+            index.close()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def abspath(self, path):
+        return os.path.join(self.root, path)
+
+
+def fuzzy_match(query, paths, limit=50):
+    """Best ``limit`` paths containing the characters of ``query`` in order"""
+    return FuzzyFinder(paths).search(query, limit)
+
+
+class FuzzyFinder:
+    """Fuzzy "go to file" over a list of relative paths
+
+    A path matches when it contains the characters of the query in order.
+    Matches in the file name rank above matches spread over directories;
+    among those, tighter and shorter matches win. While the user keeps
+    typing, each query only scans the matches of the previous one.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+        self._last = ('', paths)  # (sorgu, eşleşen yollar)
+
+    def search(self, query, limit=50):
+        query = query.strip().replace('\\', '/')
+        if not query:
+            return self.paths[:limit]
+        last_query, candidates = self._last
+        if not last_query or not query.lower().startswith(last_query.lower()):
+            candidates = self.paths
+        pattern = re.compile('.*?'.join(re.escape(char) for char in query), re.IGNORECASE)
+        matched = []
+        scored = []
+        for path in candidates:
+            match = pattern.search(path)
+            if match is None:
+                continue
+            matched.append(path)
+            # Dosya adında eşleşme daha öncelikli
+            name_start = path.rfind('/') + 1
+            in_name = match if match.start() >= name_start else pattern.search(path, name_start)
+            if in_name is not None:
+                score = (0, in_name.end() - in_name.start(), len(path))
+            else:
+                score = (1, match.end() - match.start(), len(path))
+            scored.append((score, path))
+        self._last = (query, matched)
+        return [path for _, path in heapq.nsmallest(limit, scored)]